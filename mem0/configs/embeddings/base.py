@@ -1,6 +1,6 @@
 import os
 from abc import ABC
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import httpx
 
@@ -44,6 +44,13 @@ class BaseEmbedderConfig(ABC):
         doubao_base_url: Optional[str] = "https://ark.cn-beijing.volces.com/api/v3",
         # Qwen specific
         qwen_base_url: Optional[str] = "https://dashscope.aliyuncs.com/compatible-mode/v1",
+        # Replay specific
+        replay_cassette_path: Optional[str] = None,
+        replay_mode: str = "replay",
+        replay_provider: Optional[str] = None,
+        replay_provider_config: Optional[dict] = None,
+        replay_latency_scale: float = 1.0,
+        replay_normalize_patterns: Optional[List[str]] = None,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -76,6 +83,18 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param replay_cassette_path: File holding recorded embedding requests for the replay provider, defaults to None
+        :type replay_cassette_path: Optional[str], optional
+        :param replay_mode: "replay", "record" or "auto" (replay hits, record misses), defaults to "replay"
+        :type replay_mode: str, optional
+        :param replay_provider: Embedding provider wrapped in record/auto mode, defaults to None
+        :type replay_provider: Optional[str], optional
+        :param replay_provider_config: Config for the wrapped embedding provider, defaults to None
+        :type replay_provider_config: Optional[dict], optional
+        :param replay_latency_scale: Multiplier for the recorded latency on replay, defaults to 1.0
+        :type replay_latency_scale: float, optional
+        :param replay_normalize_patterns: Regexes masked before hashing requests, defaults to masking dates
+        :type replay_normalize_patterns: Optional[List[str]], optional
         """
 
         self.model = model
@@ -118,3 +137,11 @@ class BaseEmbedderConfig(ABC):
         # Qwen specific
         self.qwen_base_url = qwen_base_url
 
+        # Replay specific
+        self.replay_cassette_path = replay_cassette_path
+        self.replay_mode = replay_mode
+        self.replay_provider = replay_provider
+        self.replay_provider_config = replay_provider_config or {}
+        self.replay_latency_scale = replay_latency_scale
+        self.replay_normalize_patterns = replay_normalize_patterns
+
@@ -0,0 +1,73 @@
+from typing import Optional
+
+from mem0.configs.llms.base import BaseLlmConfig
+
+
+class MockLlmConfig(BaseLlmConfig):
+    """
+    Configuration class for the deterministic mock LLM.
+    Inherits from BaseLlmConfig and adds settings for simulated latency and canned responses.
+    """
+
+    def __init__(
+        self,
+        # Base parameters
+        model: Optional[str] = None,
+        temperature: float = 0.1,
+        api_key: Optional[str] = None,
+        max_tokens: int = 2000,
+        top_p: float = 0.1,
+        top_k: int = 1,
+        enable_vision: bool = False,
+        vision_details: Optional[str] = "auto",
+        http_client_proxies: Optional[dict] = None,
+        # Mock-specific parameters
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        max_facts: int = 5,
+        update_ratio: float = 0.0,
+        default_response: str = "{}",
+        seed: int = 0,
+    ):
+        """
+        Initialize mock LLM configuration.
+
+        Args:
+            model: Model name reported by the mock, defaults to None
+            temperature: Unused, defaults to 0.1
+            api_key: Unused, defaults to None
+            max_tokens: Unused, defaults to 2000
+            top_p: Unused, defaults to 0.1
+            top_k: Unused, defaults to 1
+            enable_vision: Unused, defaults to False
+            vision_details: Unused, defaults to "auto"
+            http_client_proxies: Unused, defaults to None
+            latency: Simulated seconds per call, defaults to 0.0
+            latency_jitter: Uniform random seconds added to each call, defaults to 0.0
+            max_facts: Maximum facts returned by fact extraction, defaults to 5
+            update_ratio: Fraction of new facts turned into UPDATE events when related memories exist,
+                defaults to 0.0
+            default_response: Response for prompts that are neither fact extraction nor memory update,
+                defaults to "{}"
+            seed: Seed for jitter and update decisions, defaults to 0
+        """
+        # Initialize base parameters
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            top_k=top_k,
+            enable_vision=enable_vision,
+            vision_details=vision_details,
+            http_client_proxies=http_client_proxies,
+        )
+
+        # Mock-specific parameters
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.max_facts = max_facts
+        self.update_ratio = update_ratio
+        self.default_response = default_response
+        self.seed = seed
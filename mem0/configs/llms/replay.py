@@ -0,0 +1,72 @@
+from typing import List, Optional
+
+from mem0.configs.llms.base import BaseLlmConfig
+
+
+class ReplayLlmConfig(BaseLlmConfig):
+    """
+    Configuration class for the record/replay LLM wrapper.
+    Inherits from BaseLlmConfig and adds the cassette and wrapped-provider settings.
+    """
+
+    def __init__(
+        self,
+        # Base parameters
+        model: Optional[str] = None,
+        temperature: float = 0.1,
+        api_key: Optional[str] = None,
+        max_tokens: int = 2000,
+        top_p: float = 0.1,
+        top_k: int = 1,
+        enable_vision: bool = False,
+        vision_details: Optional[str] = "auto",
+        http_client_proxies: Optional[dict] = None,
+        # Replay-specific parameters
+        cassette_path: Optional[str] = None,
+        mode: str = "replay",
+        provider: Optional[str] = None,
+        provider_config: Optional[dict] = None,
+        latency_scale: float = 1.0,
+        normalize_patterns: Optional[List[str]] = None,
+    ):
+        """
+        Initialize replay LLM configuration.
+
+        Args:
+            model: Model name reported by the wrapper, defaults to None
+            temperature: Unused, defaults to 0.1
+            api_key: Unused, defaults to None
+            max_tokens: Unused, defaults to 2000
+            top_p: Unused, defaults to 0.1
+            top_k: Unused, defaults to 1
+            enable_vision: Unused, defaults to False
+            vision_details: Unused, defaults to "auto"
+            http_client_proxies: Unused, defaults to None
+            cassette_path: File holding recorded request/response pairs (".gz" for gzip), required
+            mode: "replay" (misses raise), "record" (always call provider and append) or
+                "auto" (replay hits, record misses), defaults to "replay"
+            provider: LLM provider wrapped in record/auto mode (e.g. "deepseek"), defaults to None
+            provider_config: Config for the wrapped provider, defaults to None
+            latency_scale: Multiplier for the recorded latency on replay; 0 replays instantly, defaults to 1.0
+            normalize_patterns: Regexes masked before hashing requests, defaults to masking dates
+        """
+        # Initialize base parameters
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            top_k=top_k,
+            enable_vision=enable_vision,
+            vision_details=vision_details,
+            http_client_proxies=http_client_proxies,
+        )
+
+        # Replay-specific parameters
+        self.cassette_path = cassette_path
+        self.mode = mode
+        self.provider = provider
+        self.provider_config = provider_config or {}
+        self.latency_scale = latency_scale
+        self.normalize_patterns = normalize_patterns
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -20,6 +20,16 @@ class ElasticsearchConfig(BaseModel):
         None, description="Custom search query function. Parameters: (query, limit, filters) -> Dict"
     )
     headers: Optional[Dict[str, str]] = Field(None, description="Custom headers to include in requests")
+    num_candidates: Optional[int] = Field(
+        None,
+        description="kNN candidates per shard; larger values raise recall and latency. Defaults to 2 * limit",
+    )
+    bulk_chunk_size: int = Field(500, description="Documents per _bulk request when inserting")
+    bulk_thread_count: int = Field(1, description="Parallel _bulk requests when inserting; 1 streams sequentially")
+    refresh: Optional[Union[bool, str]] = Field(
+        None,
+        description="Refresh policy for writes: True, False or 'wait_for'. Defaults to the index refresh_interval",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -13,6 +13,44 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    persistence: str = Field(
+        "snapshot",
+        description="'snapshot' rewrites the index and docstore on every mutation; 'log' appends mutations to a "
+        "write-ahead log that is compacted into a snapshot in the background",
+    )
+    compaction_interval: float = Field(300, description="Seconds between background log compactions in 'log' mode")
+    compaction_log_records: int = Field(
+        10000, description="Number of log records that triggers an early compaction in 'log' mode"
+    )
+    tombstone_ratio: float = Field(
+        0.1, description="Fraction of deleted vectors still held by the index that triggers removing them in a batch"
+    )
+    index_type: Optional[str] = Field(
+        None,
+        description="faiss.index_factory string, e.g. 'HNSW32', 'IVF4096,PQ64' or 'IVF1024,SQ8'. Defaults to an "
+        "exact flat index",
+    )
+    training_threshold: Optional[int] = Field(
+        None,
+        description="Vectors required before a trainable index_type is trained; searches use an exact flat buffer "
+        "until then. Derived from the index type if not set",
+    )
+    search_params: Optional[Dict[str, Any]] = Field(
+        None, description="Index search parameters set through faiss.ParameterSpace, e.g. {'nprobe': 32}"
+    )
+    background_training: bool = Field(True, description="Train and swap in index_type on a background thread")
+    omp_threads: Optional[int] = Field(None, description="Process-wide OpenMP thread count used by FAISS")
+    docstore: str = Field(
+        "memory",
+        description="'memory' keeps payloads in a pickled dict; 'sqlite' keeps them in an on-disk SQLite file "
+        "with an LRU of hot payloads",
+    )
+    docstore_cache_size: int = Field(10000, description="Payloads cached in memory by the 'sqlite' docstore")
+    mmap_index: bool = Field(False, description="Memory-map the index file on load instead of reading it into RAM")
+    indexed_payload_keys: Optional[List[str]] = Field(
+        None,
+        description="Payload keys indexed for filtered search and list() in addition to user_id, agent_id and run_id",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -22,6 +60,30 @@ class FAISSConfig(BaseModel):
             raise ValueError("Invalid distance_strategy. Must be one of: 'euclidean', 'inner_product', 'cosine'")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_persistence(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        persistence = values.get("persistence")
+        if persistence and persistence not in ["snapshot", "log"]:
+            raise ValueError("Invalid persistence. Must be one of: 'snapshot', 'log'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_docstore(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        docstore = values.get("docstore")
+        if docstore and docstore not in ["memory", "sqlite"]:
+            raise ValueError("Invalid docstore. Must be one of: 'memory', 'sqlite'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_index_type(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        index_type = values.get("index_type")
+        if index_type and "IDMap" in index_type:
+            raise ValueError("index_type must not include IDMap; ids are mapped by the store")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
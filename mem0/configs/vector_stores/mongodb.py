@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -10,6 +10,15 @@ class MongoDBConfig(BaseModel):
     collection_name: str = Field("mem0", description="Name of the MongoDB collection")
     embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding vectors")
     mongo_uri: str = Field("mongodb://localhost:27017", description="MongoDB URI. Default is mongodb://localhost:27017")
+    filter_fields: List[str] = Field(
+        ["user_id", "agent_id", "run_id"],
+        description="Payload fields declared as filter fields in the vector search index; filters on them are "
+        "applied inside $vectorSearch instead of after it",
+    )
+    num_candidates_multiplier: int = Field(
+        10, description="numCandidates sent to $vectorSearch as a multiple of the limit (capped at 10000)"
+    )
+    search_batch_workers: int = Field(8, description="Parallel aggregations used by search_batch")
 
     @model_validator(mode="before")
     @classmethod
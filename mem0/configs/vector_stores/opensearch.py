@@ -18,6 +18,16 @@ class OpenSearchConfig(BaseModel):
         "RequestsHttpConnection", description="Connection class for OpenSearch"
     )
     pool_maxsize: int = Field(20, description="Maximum number of connections in the pool")
+    num_candidates: Optional[int] = Field(
+        None, description="k-NN k (candidates per shard); larger values raise recall and latency. Defaults to 2 * limit"
+    )
+    ef_search: Optional[int] = Field(None, description="HNSW ef_search sent with each k-NN query (OpenSearch 2.16+)")
+    bulk_chunk_size: int = Field(500, description="Documents per _bulk request when inserting")
+    bulk_thread_count: int = Field(1, description="Parallel _bulk requests when inserting; 1 streams sequentially")
+    refresh: Optional[Union[bool, str]] = Field(
+        None,
+        description="Refresh policy for writes: True, False or 'wait_for'. Defaults to the index refresh_interval",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -19,6 +19,70 @@ class PGVectorConfig(BaseModel):
     sslmode: Optional[str] = Field(None, description="SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')")
     connection_string: Optional[str] = Field(None, description="PostgreSQL connection string (overrides individual connection parameters)")
     connection_pool: Optional[Any] = Field(None, description="psycopg connection pool object (overrides connection string and individual parameters)")
+    # Filter indexing options
+    filter_columns: Optional[List[str]] = Field(
+        ["user_id", "agent_id", "run_id"], description="Payload keys used for scoping queries that get a dedicated btree index"
+    )
+    filter_index_mode: Optional[str] = Field(
+        "generated",
+        description="How scoping keys are indexed: 'generated' (stored generated columns), 'expression' (expression indexes on payload) or None",
+    )
+    payload_gin_index: Optional[bool] = Field(True, description="Create a GIN index on payload for the remaining filter keys")
+    payload_containment_filters: Optional[bool] = Field(
+        False,
+        description=(
+            "Filter the remaining keys with JSONB containment (uses the GIN index) instead of text equality. "
+            "Type-sensitive: 5 does not match '5', and list values mean 'array contains'"
+        ),
+    )
+    # Partitioning options
+    partitioning: Optional[str] = Field(
+        None,
+        description="Partition the collection on user_id: 'hash' (fixed partition count) or 'list' (one partition per tenant)",
+    )
+    partition_count: Optional[int] = Field(16, description="Number of hash partitions created with a new collection")
+    # Search tuning options
+    hnsw_ef_search: Optional[int] = Field(None, description="hnsw.ef_search applied to every search (pgvector default is 40)")
+    hnsw_iterative_scan: Optional[str] = Field(
+        None,
+        description="hnsw.iterative_scan mode ('off', 'strict_order', 'relaxed_order') so filtered searches keep scanning until limit rows are found (pgvector >= 0.8)",
+    )
+    hnsw_max_scan_tuples: Optional[int] = Field(None, description="hnsw.max_scan_tuples bound for iterative scans")
+    exact_search_threshold: Optional[int] = Field(
+        None, description="Search users with at most this many rows exactly instead of through the ANN index"
+    )
+    row_count_cache_ttl: Optional[int] = Field(300, description="Seconds a cached per-user row count stays valid")
+    # Ingest options
+    copy_threshold: Optional[int] = Field(
+        256, description="Inserts of at least this many vectors use binary COPY; None always uses INSERT"
+    )
+    # Storage options
+    vector_type: Optional[str] = Field(
+        "vector", description="Column type for embeddings: 'vector' (float32) or 'halfvec' (float16, half the storage)"
+    )
+    index_quantization: Optional[str] = Field(
+        None,
+        description="Quantize the HNSW index: 'halfvec' (2x smaller) or 'binary' (32x smaller, re-ranked with full-precision distances)",
+    )
+    rerank_factor: Optional[int] = Field(10, description="Candidates per requested result fetched by the binary first pass")
+    # Read replica options
+    replica_connection_strings: Optional[List[str]] = Field(
+        None, description="Connection strings of read replicas serving search, list, get and col_info"
+    )
+    replica_pools: Optional[List[Any]] = Field(
+        None, description="psycopg connection pools of read replicas (overrides replica_connection_strings)"
+    )
+    read_your_writes_window: Optional[float] = Field(
+        0, description="Seconds after a write during which reads for the same user or id stay on the primary"
+    )
+    replica_retry_interval: Optional[float] = Field(30, description="Seconds a failed replica is skipped before retrying it")
+    # Async options
+    enable_async: Optional[bool] = Field(
+        False, description="Serve AsyncMemory from a psycopg AsyncConnectionPool instead of worker threads (psycopg3 only)"
+    )
+    async_connection_pool: Optional[Any] = Field(
+        None, description="psycopg AsyncConnectionPool object used by the async methods"
+    )
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -39,6 +103,44 @@ class PGVectorConfig(BaseModel):
             raise ValueError("Both 'host' and 'port' must be provided when not using connection_string.")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_filter_index_mode(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        mode = values.get("filter_index_mode")
+        if mode is not None and mode not in ["generated", "expression"]:
+            raise ValueError("Invalid filter_index_mode. Must be one of: 'generated', 'expression' or None")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_partitioning(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        partitioning = values.get("partitioning")
+        if partitioning is not None and partitioning not in ["hash", "list"]:
+            raise ValueError("Invalid partitioning. Must be one of: 'hash', 'list' or None")
+        partition_count = values.get("partition_count")
+        if partition_count is not None and partition_count < 1:
+            raise ValueError("partition_count must be a positive integer")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_search_params(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        iterative_scan = values.get("hnsw_iterative_scan")
+        if iterative_scan is not None and iterative_scan not in ["off", "strict_order", "relaxed_order"]:
+            raise ValueError("Invalid hnsw_iterative_scan. Must be one of: 'off', 'strict_order', 'relaxed_order'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_storage(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        vector_type = values.get("vector_type")
+        if vector_type is not None and vector_type not in ["vector", "halfvec"]:
+            raise ValueError("Invalid vector_type. Must be one of: 'vector', 'halfvec'")
+        index_quantization = values.get("index_quantization")
+        if index_quantization is not None and index_quantization not in ["halfvec", "binary"]:
+            raise ValueError("Invalid index_quantization. Must be one of: 'halfvec', 'binary' or None")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -4,9 +4,10 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class QdrantConfig(BaseModel):
-    from qdrant_client import QdrantClient
+    from qdrant_client import AsyncQdrantClient, QdrantClient
 
     QdrantClient: ClassVar[type] = QdrantClient
+    AsyncQdrantClient: ClassVar[type] = AsyncQdrantClient
 
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: Optional[int] = Field(1536, description="Dimensions of the embedding model")
@@ -17,6 +18,19 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    prefer_grpc: bool = Field(False, description="Use the gRPC transport for a remote Qdrant server")
+    grpc_port: int = Field(6334, description="gRPC port of the remote Qdrant server")
+    wait: bool = Field(
+        True,
+        description="Wait until writes are applied before returning; False only waits for the acknowledgement, "
+        "so a write may not be visible to an immediately following search",
+    )
+    upsert_batch_size: int = Field(256, description="Points per upsert request")
+    upsert_parallel: int = Field(1, description="Upsert requests in flight at once (remote servers only)")
+    enable_async: bool = Field(
+        False, description="Serve AsyncMemory through an AsyncQdrantClient instead of worker threads (remote only)"
+    )
+    async_client: Optional[AsyncQdrantClient] = Field(None, description="Existing AsyncQdrantClient instance")
 
     @model_validator(mode="before")
     @classmethod
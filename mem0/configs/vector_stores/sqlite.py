@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class SQLiteVectorConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Default name for the collection (table)")
+    path: Optional[str] = Field(
+        None, description="Directory holding the database file (vectors.db), or the path of a .db file"
+    )
+    embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    distance_strategy: str = Field(
+        "cosine", description="Distance strategy to use. Options: 'cosine', 'inner_product', 'euclidean'"
+    )
+    vector_dtype: str = Field(
+        "float32", description="Vector blob storage: 'float32', or 'int8' with a per-vector scale (4x smaller)"
+    )
+    cache_size: int = Field(64, description="Number of per-scope (e.g. per-user) vector matrices kept in memory")
+    synchronous: str = Field(
+        "NORMAL",
+        description="SQLite synchronous pragma. 'NORMAL' is crash-safe in WAL mode, 'FULL' survives power loss",
+    )
+    busy_timeout: float = Field(5.0, description="Seconds to wait for a write lock held by another connection")
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_distance_strategy(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        distance_strategy = values.get("distance_strategy")
+        if distance_strategy and distance_strategy.lower() not in ["cosine", "inner_product", "euclidean"]:
+            raise ValueError("Invalid distance_strategy. Must be one of: 'cosine', 'inner_product', 'euclidean'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_vector_dtype(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        vector_dtype = values.get("vector_dtype")
+        if vector_dtype and vector_dtype not in ["float32", "int8"]:
+            raise ValueError("Invalid vector_dtype. Must be one of: 'float32', 'int8'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_synchronous(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        synchronous = values.get("synchronous")
+        if synchronous and synchronous.upper() not in ["OFF", "NORMAL", "FULL", "EXTRA"]:
+            raise ValueError("Invalid synchronous. Must be one of: 'OFF', 'NORMAL', 'FULL', 'EXTRA'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
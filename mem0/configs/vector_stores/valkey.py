@@ -13,3 +13,5 @@ class ValkeyConfig(BaseModel):
     hnsw_m: int = 16  # Number of connections per layer (default from Valkey docs)
     hnsw_ef_construction: int = 200  # Search width during construction
     hnsw_ef_runtime: int = 10  # Search width during queries
+    batch_size: int = 500  # Commands per pipeline for bulk writes and batched searches
+    transactional: bool = False  # Wrap each bulk write batch in MULTI/EXEC
@@ -26,6 +26,8 @@ class EmbedderConfig(BaseModel):
             "aws_bedrock",
             "doubao",
             "qwen",
+            "mock",
+            "replay",
         ]:
             return v
         else:
@@ -1,7 +1,15 @@
+import hashlib
+import re
+from functools import lru_cache
 from typing import Literal, Optional
 
+import numpy as np
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
 
+_TOKEN = re.compile(r"\w+")
+
 
 class MockEmbeddings(EmbeddingBase):
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
@@ -9,3 +17,38 @@ class MockEmbeddings(EmbeddingBase):
         Generate a mock embedding with dimension of 10.
         """
         return [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+
+
+class HashEmbedding(EmbeddingBase):
+    """
+    Deterministic offline embedder for benchmarks and tests.
+
+    Each token maps to a fixed pseudo-random unit vector seeded by its hash, and a text embeds as the
+    normalized sum of its tokens, so texts sharing words land close together at a realistic dimension.
+    """
+
+    def __init__(self, config: Optional[BaseEmbedderConfig] = None):
+        super().__init__(config)
+
+        self.config.model = self.config.model or "hash"
+        self.config.embedding_dims = self.config.embedding_dims or 1536
+        self._token_vector = lru_cache(maxsize=65536)(self._make_token_vector)
+
+    def _make_token_vector(self, token: str) -> np.ndarray:
+        seed = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+        return np.random.default_rng(seed).standard_normal(self.config.embedding_dims).astype(np.float32)
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): Ignored; all actions share one embedding space. Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        tokens = _TOKEN.findall(text.lower()) or [text]
+        vector = np.sum([self._token_vector(token) for token in tokens], axis=0)
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
@@ -0,0 +1,54 @@
+from typing import Literal, Optional
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.cassette import Cassette
+
+
+class ReplayEmbedding(EmbeddingBase):
+    """
+    Record/replay wrapper around another embedding provider.
+
+    In record mode every embed call goes to the wrapped provider and the vector is appended to the
+    cassette; in replay mode vectors come from the cassette with the recorded (optionally scaled) latency.
+    """
+
+    def __init__(self, config: Optional[BaseEmbedderConfig] = None):
+        super().__init__(config)
+
+        if not self.config.replay_cassette_path:
+            raise ValueError("replay_cassette_path is required for the replay embedding provider")
+        if self.config.replay_mode != "replay" and not self.config.replay_provider:
+            raise ValueError(
+                f"replay_provider is required for the replay embedding provider in {self.config.replay_mode} mode"
+            )
+
+        self.cassette = Cassette(
+            self.config.replay_cassette_path,
+            mode=self.config.replay_mode,
+            latency_scale=self.config.replay_latency_scale,
+            normalize_patterns=self.config.replay_normalize_patterns,
+        )
+        self.embedder = None
+        if self.config.replay_mode != "replay":
+            from mem0.utils.factory import EmbedderFactory
+
+            self.embedder = EmbedderFactory.create(
+                self.config.replay_provider, dict(self.config.replay_provider_config), None
+            )
+            self.config.embedding_dims = self.config.embedding_dims or self.embedder.config.embedding_dims
+        self.config.model = self.config.model or (self.embedder.config.model if self.embedder else "replay")
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text from the cassette, recording it from the wrapped provider when needed.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        request = {"text": text, "memory_action": memory_action}
+        fn = (lambda: self.embedder.embed(text, memory_action)) if self.embedder is not None else None
+        return self.cassette.call("embed", request, fn)
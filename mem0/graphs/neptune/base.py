@@ -18,6 +18,7 @@ from mem0.graphs.tools import (
 )
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
+from mem0.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ class NeptuneBase(ABC):
         """
         return LlmFactory.create(llm_provider, config.llm.config)
 
+    @traced("graph.add")
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -64,6 +66,7 @@ class NeptuneBase(ABC):
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
+    @traced("graph.llm.extract_entities")
     def _retrieve_nodes_from_data(self, data, filters):
         """
         Extract all entities mentioned in the query.
@@ -98,6 +101,7 @@ class NeptuneBase(ABC):
         entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
         return entity_type_map
 
+    @traced("graph.llm.extract_relations")
     def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
         """
         Establish relations among the extracted nodes.
@@ -148,6 +152,7 @@ class NeptuneBase(ABC):
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
+    @traced("graph.llm.delete_decision")
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """
         Get the entities to be deleted from the search output.
@@ -179,6 +184,7 @@ class NeptuneBase(ABC):
         logger.debug(f"Deleted relationships: {to_be_deleted}")
         return to_be_deleted
 
+    @traced("graph.query.delete_entities")
     def _delete_entities(self, to_be_deleted, user_id):
         """
         Delete the entities from the graph.
@@ -204,6 +210,7 @@ class NeptuneBase(ABC):
 
         pass
 
+    @traced("graph.query.add_entities")
     def _add_entities(self, to_be_added, user_id, entity_type_map):
         """
         Add the new entities to the graph. Merge the nodes if they already exist.
@@ -263,6 +270,7 @@ class NeptuneBase(ABC):
         """
         pass
 
+    @traced("graph.search")
     def search(self, query, filters, limit=100):
         """
         Search for memories and related graph data.
@@ -322,6 +330,7 @@ class NeptuneBase(ABC):
         """
         pass
 
+    @traced("graph.delete_all")
     def delete_all(self, filters):
         cypher, params = self._delete_all_cypher(filters)
         self.graph.query(cypher, params=params)
@@ -333,6 +342,7 @@ class NeptuneBase(ABC):
         """
         pass
 
+    @traced("graph.get_all")
     def get_all(self, filters, limit=100):
         """
         Retrieves all nodes and relationships from the graph database based on filtering criteria.
@@ -371,6 +381,7 @@ class NeptuneBase(ABC):
         """
         pass
 
+    @traced("graph.query.search_nodes")
     def _search_graph_db(self, node_list, filters, limit=100):
         """
         Search similar nodes among and their respective incoming and outgoing relations.
@@ -138,4 +138,5 @@ class AzureOpenAILLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -88,4 +88,5 @@ class AzureOpenAIStructuredLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
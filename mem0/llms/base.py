@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
@@ -27,6 +28,24 @@ class LLMBase(ABC):
         # Validate configuration
         self._validate_config()
 
+        # Cumulative token usage reported by OpenAI-compatible APIs, see _record_usage
+        self.usage = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._usage_lock = threading.Lock()
+
+    def _record_usage(self, response):
+        """
+        Accumulate the token usage of a chat completion response into self.usage.
+
+        Args:
+            response: Raw response from an OpenAI-compatible API; responses without `usage` only count the request.
+        """
+        usage = getattr(response, "usage", None)
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            if usage is not None:
+                self.usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+                self.usage["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
     def _validate_config(self):
         """
         Validate the configuration.
@@ -28,6 +28,8 @@ class LlmConfig(BaseModel):
             "lmstudio",
             "vllm",
             "langchain",
+            "mock",
+            "replay",
         ):
             return v
         else:
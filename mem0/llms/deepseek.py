@@ -107,4 +107,5 @@ class DeepSeekLLM(LLMBase):
             params["response_format"] = response_format
 
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
@@ -85,4 +85,5 @@ class GroqLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         return self._parse_response(response, tools)
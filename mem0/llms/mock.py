@@ -0,0 +1,121 @@
+import ast
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Dict, List, Optional, Union
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.configs.llms.mock import MockLlmConfig
+from mem0.llms.base import LLMBase
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。！？])\s*")
+_CODE_BLOCK = re.compile(r"```(.*?)```", re.DOTALL)
+_NEW_FACTS_MARKER = "The new retrieved facts are mentioned in the triple backticks"
+_OLD_MEMORY_MARKER = "current content of my memory"
+
+
+class MockLLM(LLMBase):
+    """
+    Deterministic offline LLM for benchmarks and tests.
+
+    Answers the fact extraction prompt by splitting user messages into sentences, and the memory update
+    prompt with ADD/UPDATE/NONE events derived from the prompt itself, so Memory.add runs its full
+    pipeline without network access. Every call sleeps for the configured simulated latency.
+    """
+
+    def __init__(self, config: Optional[Union[BaseLlmConfig, MockLlmConfig, Dict]] = None):
+        if config is None:
+            config = MockLlmConfig()
+        elif isinstance(config, dict):
+            config = MockLlmConfig(**config)
+        elif isinstance(config, BaseLlmConfig) and not isinstance(config, MockLlmConfig):
+            config = MockLlmConfig(model=config.model)
+
+        super().__init__(config)
+
+        if not self.config.model:
+            self.config.model = "mock"
+        self._random = random.Random(self.config.seed)
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a canned response for the given messages.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Ignored; responses are always JSON strings.
+            tools (list, optional): When given, an empty tool-call response is returned. Defaults to None.
+            tool_choice (str, optional): Ignored. Defaults to "auto".
+            **kwargs: Ignored.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        delay = self.config.latency
+        if self.config.latency_jitter:
+            delay += self._random.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if tools:
+            return {"content": "", "tool_calls": []}
+
+        prompt = messages[-1]["content"] if messages else ""
+        if _NEW_FACTS_MARKER in prompt:
+            return json.dumps({"memory": self._memory_events(prompt)})
+        if prompt.startswith("Input:\n"):
+            return json.dumps({"facts": self._extract_facts(prompt[len("Input:\n") :])})
+        return self.config.default_response
+
+    def _extract_facts(self, conversation: str) -> List[str]:
+        facts = []
+        for line in conversation.splitlines():
+            if not line.startswith("user: "):
+                continue
+            for sentence in _SENTENCE_SPLIT.split(line[len("user: ") :]):
+                sentence = sentence.strip()
+                if sentence:
+                    facts.append(sentence)
+        return facts[: self.config.max_facts]
+
+    def _memory_events(self, prompt: str) -> List[Dict]:
+        head, _, tail = prompt.partition(_NEW_FACTS_MARKER)
+        new_facts = self._literal_block(tail) or []
+        old_memories = self._literal_block(head.split(_OLD_MEMORY_MARKER, 1)[1]) if _OLD_MEMORY_MARKER in head else []
+        old_memories = old_memories or []
+        known = {memory.get("text") for memory in old_memories}
+
+        events = []
+        for fact in new_facts:
+            if fact in known:
+                events.append({"id": "", "text": fact, "event": "NONE"})
+                continue
+            # Decide UPDATE from a content hash so the same input always yields the same events
+            digest = int(hashlib.blake2b(f"{self.config.seed}:{fact}".encode(), digest_size=8).hexdigest(), 16)
+            if old_memories and (digest % 10000) / 10000 < self.config.update_ratio:
+                target = old_memories[digest % len(old_memories)]
+                events.append(
+                    {"id": target["id"], "text": fact, "event": "UPDATE", "old_memory": target.get("text")}
+                )
+            else:
+                events.append({"id": str(len(old_memories) + len(events)), "text": fact, "event": "ADD"})
+        return events
+
+    @staticmethod
+    def _literal_block(text: str):
+        match = _CODE_BLOCK.search(text)
+        if not match:
+            return None
+        try:
+            return ast.literal_eval(match.group(1).strip())
+        except (ValueError, SyntaxError):
+            return None
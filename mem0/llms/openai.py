@@ -136,6 +136,7 @@ class OpenAILLM(LLMBase):
             params["tools"] = tools
             params["tool_choice"] = tool_choice
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         parsed_response = self._parse_response(response, tools)
         if self.config.response_callback:
             try:
@@ -0,0 +1,86 @@
+from typing import Dict, List, Optional, Union
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.configs.llms.replay import ReplayLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.utils.cassette import Cassette
+
+
+class ReplayLLM(LLMBase):
+    """
+    Record/replay wrapper around another LLM provider.
+
+    In record mode every generate_response call goes to the wrapped provider and the request/response
+    pair is appended to the cassette; in replay mode responses come from the cassette with the recorded
+    (optionally scaled) latency, so traffic can be reproduced without network access.
+    """
+
+    def __init__(self, config: Optional[Union[BaseLlmConfig, ReplayLlmConfig, Dict]] = None):
+        if config is None:
+            config = ReplayLlmConfig()
+        elif isinstance(config, dict):
+            config = ReplayLlmConfig(**config)
+        elif isinstance(config, BaseLlmConfig) and not isinstance(config, ReplayLlmConfig):
+            config = ReplayLlmConfig(model=config.model)
+
+        super().__init__(config)
+
+        if not self.config.cassette_path:
+            raise ValueError("cassette_path is required for the replay LLM provider")
+        if self.config.mode != "replay" and not self.config.provider:
+            raise ValueError(f"provider is required for the replay LLM provider in {self.config.mode} mode")
+
+        self.cassette = Cassette(
+            self.config.cassette_path,
+            mode=self.config.mode,
+            latency_scale=self.config.latency_scale,
+            normalize_patterns=self.config.normalize_patterns,
+        )
+        self.llm = None
+        if self.config.mode != "replay":
+            from mem0.utils.factory import LlmFactory
+
+            self.llm = LlmFactory.create(self.config.provider, dict(self.config.provider_config))
+        if not self.config.model:
+            self.config.model = getattr(getattr(self.llm, "config", None), "model", None) or "replay"
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response from the cassette, recording it from the wrapped provider when needed.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Part of the request key.
+            tools (list, optional): List of tools that the model can call. Part of the request key.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Passed to the wrapped provider; not part of the request key.
+
+        Returns:
+            str or dict: The recorded or generated response.
+        """
+        request = {
+            "messages": messages,
+            "response_format": response_format,
+            "tools": tools,
+            "tool_choice": tool_choice if tools else None,
+        }
+
+        # Forward only what the caller passed; some providers (e.g. sarvam) take no tools
+        params = dict(kwargs)
+        if response_format is not None:
+            params["response_format"] = response_format
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+
+        def call():
+            return self.llm.generate_response(messages=messages, **params)
+
+        return self.cassette.call("llm", request, call if self.llm is not None else None)
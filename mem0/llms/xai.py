@@ -49,4 +49,5 @@ class XAILLM(LLMBase):
             params["response_format"] = response_format
 
         response = self.client.chat.completions.create(**params)
+        self._record_usage(response)
         return response.choices[0].message.content
@@ -22,6 +22,7 @@ from mem0.graphs.tools import (
 )
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
+from mem0.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,7 @@ class MemoryGraph:
         self.user_id = None
         self.threshold = 0.7
 
+    @traced("graph.add")
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -92,6 +94,7 @@ class MemoryGraph:
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
+    @traced("graph.search")
     def search(self, query, filters, limit=100):
         """
         Search for memories and related graph data.
@@ -128,6 +131,7 @@ class MemoryGraph:
 
         return search_results
 
+    @traced("graph.delete_all")
     def delete_all(self, filters):
         # Build node properties for filtering
         node_props = ["user_id: $user_id"]
@@ -148,6 +152,7 @@ class MemoryGraph:
             params["run_id"] = filters["run_id"]
         self.graph.query(cypher, params=params)
 
+    @traced("graph.get_all")
     def get_all(self, filters, limit=100):
         """
         Retrieves all nodes and relationships from the graph database based on optional filtering criteria.
@@ -192,6 +197,7 @@ class MemoryGraph:
 
         return final_results
 
+    @traced("graph.llm.extract_entities")
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -225,6 +231,7 @@ class MemoryGraph:
         logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
         return entity_type_map
 
+    @traced("graph.llm.extract_relations")
     def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
         """Establish relations among the extracted nodes."""
 
@@ -267,6 +274,7 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    @traced("graph.query.search_nodes")
     def _search_graph_db(self, node_list, filters, limit=100):
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
@@ -318,6 +326,7 @@ class MemoryGraph:
 
         return result_relations
 
+    @traced("graph.llm.delete_decision")
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
         search_output_string = format_entities(search_output)
@@ -354,6 +363,7 @@ class MemoryGraph:
         logger.debug(f"Deleted relationships: {to_be_deleted}")
         return to_be_deleted
 
+    @traced("graph.query.delete_entities")
     def _delete_entities(self, to_be_deleted, filters):
         """Delete the entities from the graph."""
         user_id = filters["user_id"]
@@ -409,6 +419,7 @@ class MemoryGraph:
 
         return results
 
+    @traced("graph.query.add_entities")
     def _add_entities(self, to_be_added, filters, entity_type_map):
         """Add the new entities to the graph. Merge the nodes if they already exist."""
         user_id = filters["user_id"]
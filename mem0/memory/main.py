@@ -2,6 +2,7 @@ import asyncio
 import concurrent
 import gc
 import hashlib
+import inspect
 import json
 import logging
 import os
@@ -38,24 +39,12 @@ from mem0.utils.factory import (
     LlmFactory,
     VectorStoreFactory,
 )
+from mem0.utils.tracing import span, submit, traced
 
 # Suppress SWIG deprecation warnings globally
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*SwigPy.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*swigvarlink.*")
 
-# Performance monitoring setup
-PERFORMANCE_MONITORING_ENABLED = False
-try:
-    import sys
-    perf_monitoring_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'performance_monitoring')
-    if perf_monitoring_path not in sys.path:
-        sys.path.insert(0, perf_monitoring_path)
-
-    from performance_logger import get_performance_logger
-    PERFORMANCE_MONITORING_ENABLED = True
-except ImportError:
-    pass
-
 def _build_filters_and_metadata(
     *,  # Enforce keyword-only arguments
     user_id: Optional[str] = None,
@@ -132,6 +121,20 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _delete_kwargs(vector_store, memory_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Arguments for ``vector_store.delete`` of one memory.
+
+    Stores whose delete takes the owner (e.g. pgvector) get the memory's user_id, so a partitioned
+    collection deletes from the owner's partition instead of probing every partition.
+    """
+    kwargs = {"vector_id": memory_id}
+    user_id = payload.get("user_id")
+    if user_id and "user_id" in inspect.signature(vector_store.delete).parameters:
+        kwargs["user_id"] = user_id
+    return kwargs
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -200,6 +203,7 @@ class Memory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
+    @traced("add")
     def add(
         self,
         messages,
@@ -273,8 +277,8 @@ class Memory(MemoryBase):
             messages = parse_vision_messages(messages)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
-            future2 = executor.submit(self._add_to_graph, messages, effective_filters)
+            future1 = submit(executor, self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
+            future2 = submit(executor, self._add_to_graph, messages, effective_filters)
 
             concurrent.futures.wait([future1, future2])
 
@@ -287,7 +291,7 @@ class Memory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return vector_store_result
 
@@ -299,6 +303,7 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    @traced("add.vector_store")
     def _add_to_vector_store(self, messages, metadata, filters, infer):
         if not infer:
             returned_memories = []
@@ -322,7 +327,8 @@ class Memory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
+                with span("add.embed_message"):
+                    msg_embeddings = self.embedding_model.embed(msg_content, "add")
                 mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
 
                 returned_memories.append(
@@ -344,20 +350,22 @@ class Memory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        with span("add.llm.extract_facts", prompt_chars=len(system_prompt) + len(user_prompt)) as span_context:
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
 
-        try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
+            try:
+                response = remove_code_blocks(response)
+                new_retrieved_facts = json.loads(response)["facts"]
+            except Exception as e:
+                logger.error(f"Error in new_retrieved_facts: {e}")
+                new_retrieved_facts = []
+            span_context["facts"] = len(new_retrieved_facts)
 
         if not new_retrieved_facts:
             logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
@@ -365,14 +373,17 @@ class Memory(MemoryBase):
         retrieved_old_memory = []
         new_message_embeddings = {}
         for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
+            with span("add.embed_fact"):
+                messages_embeddings = self.embedding_model.embed(new_mem, "add")
             new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=filters,
-            )
+            with span("add.dedup_search") as span_context:
+                existing_memories = self.vector_store.search(
+                    query=new_mem,
+                    vectors=messages_embeddings,
+                    limit=5,
+                    filters=filters,
+                )
+                span_context["results"] = len(existing_memories)
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
 
@@ -393,14 +404,17 @@ class Memory(MemoryBase):
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
 
-            try:
-                response: str = self.llm.generate_response(
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
+            with span(
+                "add.llm.update_decision", facts=len(new_retrieved_facts), old_memories=len(retrieved_old_memory)
+            ):
+                try:
+                    response: str = self.llm.generate_response(
+                        messages=[{"role": "user", "content": function_calling_prompt}],
+                        response_format={"type": "json_object"},
+                    )
+                except Exception as e:
+                    logger.error(f"Error in new memory actions response: {e}")
+                    response = ""
 
             try:
                 if not response or not response.strip():
@@ -526,6 +540,7 @@ class Memory(MemoryBase):
 
         return result_item
 
+    @traced("get_all")
     def get_all(
         self,
         *,
@@ -567,9 +582,9 @@ class Memory(MemoryBase):
         )
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
+            future_memories = submit(executor, self._get_all_from_vector_store, effective_filters, limit)
             future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
+                submit(executor, self.graph.get_all, effective_filters, limit) if self.enable_graph else None
             )
 
             concurrent.futures.wait(
@@ -588,19 +603,21 @@ class Memory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'` (which returns a dict with a 'results' key). "
                 "The current format (direct list for v1.0) will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return all_memories_result
         else:
             return {"results": all_memories_result}
 
     def _get_all_from_vector_store(self, filters, limit):
-        memories_result = self.vector_store.list(filters=filters, limit=limit)
-        actual_memories = (
-            memories_result[0]
-            if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
-            else memories_result
-        )
+        with span("get_all.vector_store") as span_context:
+            memories_result = self.vector_store.list(filters=filters, limit=limit)
+            actual_memories = (
+                memories_result[0]
+                if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
+                else memories_result
+            )
+            span_context["results"] = len(actual_memories)
 
         promoted_payload_keys = [
             "user_id",
@@ -633,6 +650,7 @@ class Memory(MemoryBase):
 
         return formatted_memories
 
+    @traced("search")
     def search(
         self,
         query: str,
@@ -660,191 +678,113 @@ class Memory(MemoryBase):
                   and potentially "relations" if graph store is enabled.
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "score": 0.8, ...}]}`
         """
-        # Performance monitoring - start total timing
-        if PERFORMANCE_MONITORING_ENABLED:
-            perf_logger = get_performance_logger()
-            total_start = perf_logger.start_timer()
-
-        # Build filters phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            filter_start = perf_logger.start_timer()
-
-        _, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
-        )
-
-        if PERFORMANCE_MONITORING_ENABLED:
-            filter_duration = perf_logger.end_timer(filter_start)
-            perf_logger.log_step("search.build_filters", filter_duration, {
-                "filter_count": len(effective_filters),
-                "user_id": user_id[:8] + "..." if user_id and len(user_id) > 8 else user_id,
-                "agent_id": agent_id[:8] + "..." if agent_id and len(agent_id) > 8 else agent_id
-            })
+        with span("search.build_filters") as span_context:
+            _, effective_filters = _build_filters_and_metadata(
+                user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+            )
+            span_context["filter_count"] = len(effective_filters)
 
         if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
             raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be specified.")
 
-        # Telemetry processing phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            telemetry_start = perf_logger.start_timer()
-
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
-        capture_event(
-            "mem0.search",
-            self,
-            {
-                "limit": limit,
-                "version": self.api_version,
-                "keys": keys,
-                "encoded_ids": encoded_ids,
-                "sync_type": "sync",
-                "threshold": threshold,
-            },
-        )
-
-        if PERFORMANCE_MONITORING_ENABLED:
-            telemetry_duration = perf_logger.end_timer(telemetry_start)
-            perf_logger.log_step("search.telemetry", telemetry_duration)
-
-        # Concurrent execution phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            concurrent_start = perf_logger.start_timer()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
-            future_graph_entities = (
-                executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+        with span("search.telemetry"):
+            keys, encoded_ids = process_telemetry_filters(effective_filters)
+            capture_event(
+                "mem0.search",
+                self,
+                {
+                    "limit": limit,
+                    "version": self.api_version,
+                    "keys": keys,
+                    "encoded_ids": encoded_ids,
+                    "sync_type": "sync",
+                    "threshold": threshold,
+                },
             )
 
-            original_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+        with span("search.concurrent_execution", graph_enabled=self.enable_graph) as span_context:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                future_memories = submit(
+                    executor, self._search_vector_store, query, effective_filters, limit, threshold
+                )
+                future_graph_entities = (
+                    submit(executor, self.graph.search, query, effective_filters, limit) if self.enable_graph else None
+                )
 
-        if PERFORMANCE_MONITORING_ENABLED:
-            concurrent_duration = perf_logger.end_timer(concurrent_start)
-            perf_logger.log_step("search.concurrent_execution", concurrent_duration, {
-                "graph_enabled": self.enable_graph,
-                "memory_results": len(original_memories) if original_memories else 0,
-                "graph_results": len(graph_entities) if graph_entities else 0
-            })
+                concurrent.futures.wait(
+                    [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+                )
 
-        # Result formatting phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            format_start = perf_logger.start_timer()
+                original_memories = future_memories.result()
+                graph_entities = future_graph_entities.result() if future_graph_entities else None
+            span_context["memory_results"] = len(original_memories)
+            span_context["graph_results"] = len(graph_entities) if graph_entities else 0
 
         if self.enable_graph:
-            result = {"results": original_memories, "relations": graph_entities}
-        elif self.api_version == "v1.0":
+            return {"results": original_memories, "relations": graph_entities}
+
+        if self.api_version == "v1.0":
             warnings.warn(
                 "The current search API output format is deprecated. "
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
-            result = {"results": original_memories}
+            return {"results": original_memories}
         else:
-            result = {"results": original_memories}
-
-        if PERFORMANCE_MONITORING_ENABLED:
-            format_duration = perf_logger.end_timer(format_start)
-            perf_logger.log_step("search.format_result", format_duration)
-
-        # Log search summary
-        if PERFORMANCE_MONITORING_ENABLED:
-            total_duration = perf_logger.end_timer(total_start)
-            perf_logger.log_search_summary(
-                total_duration,
-                query,
-                user_id or agent_id or run_id or "unknown",
-                len(original_memories) if original_memories else 0,
-                effective_filters
-            )
-
-        return result
+            return {"results": original_memories}
 
     def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        # Embedding generation phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            perf_logger = get_performance_logger()
-            embed_start = perf_logger.start_timer()
-
-        embeddings = self.embedding_model.embed(query, "search")
-
-        if PERFORMANCE_MONITORING_ENABLED:
-            embed_duration = perf_logger.end_timer(embed_start)
-            perf_logger.log_step("vector_search.embedding", embed_duration, {
-                "query_length": len(query),
-                "embedding_model": str(type(self.embedding_model).__name__)
-            })
-
-        # Vector database search phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            search_start = perf_logger.start_timer()
-
-        memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
-
-        if PERFORMANCE_MONITORING_ENABLED:
-            search_duration = perf_logger.end_timer(search_start)
-            perf_logger.log_step("vector_search.database_search", search_duration, {
-                "limit": limit,
-                "filter_count": len(filters) if filters else 0,
-                "raw_results": len(memories)
-            })
-
-        # Result processing phase
-        if PERFORMANCE_MONITORING_ENABLED:
-            process_start = perf_logger.start_timer()
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        filtered_count = 0
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
-
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
-            else:
-                filtered_count += 1
+        with span("vector_search.embedding", query_length=len(query)):
+            embeddings = self.embedding_model.embed(query, "search")
+
+        with span("vector_search.database_search", limit=limit) as span_context:
+            memories = self.vector_store.search(query=query, vectors=embeddings, limit=limit, filters=filters)
+            span_context["raw_results"] = len(memories)
+
+        with span("vector_search.result_processing") as span_context:
+            promoted_payload_keys = [
+                "user_id",
+                "agent_id",
+                "run_id",
+                "actor_id",
+                "role",
+            ]
+
+            core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+
+            original_memories = []
+            filtered_count = 0
+            for mem in memories:
+                memory_item_dict = MemoryItem(
+                    id=mem.id,
+                    memory=mem.payload["data"],
+                    hash=mem.payload.get("hash"),
+                    created_at=mem.payload.get("created_at"),
+                    updated_at=mem.payload.get("updated_at"),
+                    score=mem.score,
+                ).model_dump()
+
+                for key in promoted_payload_keys:
+                    if key in mem.payload:
+                        memory_item_dict[key] = mem.payload[key]
+
+                additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
+                if additional_metadata:
+                    memory_item_dict["metadata"] = additional_metadata
+
+                if threshold is None or mem.score >= threshold:
+                    original_memories.append(memory_item_dict)
+                else:
+                    filtered_count += 1
 
-        if PERFORMANCE_MONITORING_ENABLED:
-            process_duration = perf_logger.end_timer(process_start)
-            perf_logger.log_step("vector_search.result_processing", process_duration, {
-                "processed_memories": len(memories),
-                "final_results": len(original_memories),
-                "filtered_by_threshold": filtered_count,
-                "threshold": threshold
-            })
+            span_context["final_results"] = len(original_memories)
+            span_context["filtered_by_threshold"] = filtered_count
 
         return original_memories
 
+    @traced("update")
     def update(self, memory_id, data):
         """
         Update a memory by ID.
@@ -862,11 +802,13 @@ class Memory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "sync"})
 
-        existing_embeddings = {data: self.embedding_model.embed(data, "update")}
+        with span("update.embed"):
+            existing_embeddings = {data: self.embedding_model.embed(data, "update")}
 
         self._update_memory(memory_id, data, existing_embeddings)
         return {"message": "Memory updated successfully!"}
 
+    @traced("delete")
     def delete(self, memory_id):
         """
         Delete a memory by ID.
@@ -878,6 +820,7 @@ class Memory(MemoryBase):
         self._delete_memory(memory_id)
         return {"message": "Memory deleted successfully!"}
 
+    @traced("delete_all")
     def delete_all(self, user_id: Optional[str] = None, agent_id: Optional[str] = None, run_id: Optional[str] = None):
         """
         Delete all memories.
@@ -902,7 +845,8 @@ class Memory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
-        memories = self.vector_store.list(filters=filters)[0]
+        with span("delete_all.list"):
+            memories = self.vector_store.list(filters=filters)[0]
         for memory in memories:
             self._delete_memory(memory.id)
 
@@ -926,32 +870,36 @@ class Memory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "sync"})
         return self.db.get_history(memory_id)
 
+    @traced("memory.create")
     def _create_memory(self, data, existing_embeddings, metadata=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, memory_action="add")
+            with span("memory.embed"):
+                embeddings = self.embedding_model.embed(data, memory_action="add")
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
         metadata["data"] = data
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
-        self.db.add_history(
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
+        with span("vector_store.insert"):
+            self.vector_store.insert(
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
+        with span("history.add"):
+            self.db.add_history(
+                memory_id,
+                None,
+                data,
+                "ADD",
+                created_at=metadata.get("created_at"),
+                actor_id=metadata.get("actor_id"),
+                role=metadata.get("role"),
+            )
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -993,11 +941,13 @@ class Memory(MemoryBase):
 
         return result
 
+    @traced("memory.update")
     def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = self.vector_store.get(vector_id=memory_id)
+            with span("vector_store.get"):
+                existing_memory = self.vector_store.get(vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
@@ -1025,42 +975,49 @@ class Memory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = self.embedding_model.embed(data, "update")
-
-        self.vector_store.update(
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
+            with span("memory.embed"):
+                embeddings = self.embedding_model.embed(data, "update")
+
+        with span("vector_store.update"):
+            self.vector_store.update(
+                vector_id=memory_id,
+                vector=embeddings,
+                payload=new_metadata,
+            )
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-            actor_id=new_metadata.get("actor_id"),
-            role=new_metadata.get("role"),
-        )
+        with span("history.add"):
+            self.db.add_history(
+                memory_id,
+                prev_value,
+                data,
+                "UPDATE",
+                created_at=new_metadata["created_at"],
+                updated_at=new_metadata["updated_at"],
+                actor_id=new_metadata.get("actor_id"),
+                role=new_metadata.get("role"),
+            )
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
+    @traced("memory.delete")
     def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = self.vector_store.get(vector_id=memory_id)
+        with span("vector_store.get"):
+            existing_memory = self.vector_store.get(vector_id=memory_id)
         prev_value = existing_memory.payload["data"]
-        self.vector_store.delete(vector_id=memory_id)
-        self.db.add_history(
-            memory_id,
-            prev_value,
-            None,
-            "DELETE",
-            actor_id=existing_memory.payload.get("actor_id"),
-            role=existing_memory.payload.get("role"),
-            is_deleted=1,
-        )
+        with span("vector_store.delete"):
+            self.vector_store.delete(**_delete_kwargs(self.vector_store, memory_id, existing_memory.payload))
+        with span("history.add"):
+            self.db.add_history(
+                memory_id,
+                prev_value,
+                None,
+                "DELETE",
+                actor_id=existing_memory.payload.get("actor_id"),
+                role=existing_memory.payload.get("role"),
+                is_deleted=1,
+            )
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -1130,6 +1087,17 @@ class AsyncMemory(MemoryBase):
 
         capture_event("mem0.init", self, {"sync_type": "async"})
 
+    async def _vector_store_call(self, method: str, **kwargs):
+        """
+        Call a vector store method without blocking the event loop.
+
+        Stores with native coroutines (``async_enabled``, e.g. pgvector with ``enable_async``) are
+        awaited directly; everything else runs in a worker thread.
+        """
+        if getattr(self.vector_store, "async_enabled", False):
+            return await getattr(self.vector_store, f"a{method}")(**kwargs)
+        return await asyncio.to_thread(getattr(self.vector_store, method), **kwargs)
+
     @classmethod
     async def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -1155,6 +1123,7 @@ class AsyncMemory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
+    @traced("add")
     async def add(
         self,
         messages,
@@ -1227,7 +1196,7 @@ class AsyncMemory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return vector_store_result
 
@@ -1239,6 +1208,7 @@ class AsyncMemory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    @traced("add.vector_store")
     async def _add_to_vector_store(
         self,
         messages: list,
@@ -1268,7 +1238,8 @@ class AsyncMemory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
+                with span("add.embed_message"):
+                    msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
                 mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
 
                 returned_memories.append(
@@ -1289,17 +1260,19 @@ class AsyncMemory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
-        try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
+        with span("add.llm.extract_facts", prompt_chars=len(system_prompt) + len(user_prompt)) as span_context:
+            response = await asyncio.to_thread(
+                self.llm.generate_response,
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+            try:
+                response = remove_code_blocks(response)
+                new_retrieved_facts = json.loads(response)["facts"]
+            except Exception as e:
+                logger.error(f"Error in new_retrieved_facts: {e}")
+                new_retrieved_facts = []
+            span_context["facts"] = len(new_retrieved_facts)
 
         if not new_retrieved_facts:
             logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
@@ -1308,15 +1281,18 @@ class AsyncMemory(MemoryBase):
         new_message_embeddings = {}
 
         async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            with span("add.embed_fact"):
+                embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
             new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
-                limit=5,
-                filters=effective_filters,  # 'filters' is query_filters_for_inference
-            )
+            with span("add.dedup_search") as span_context:
+                existing_mems = await self._vector_store_call(
+                    "search",
+                    query=new_mem_content,
+                    vectors=embeddings,
+                    limit=5,
+                    filters=effective_filters,  # 'filters' is query_filters_for_inference
+                )
+                span_context["results"] = len(existing_mems)
             return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
 
         search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
@@ -1338,15 +1314,18 @@ class AsyncMemory(MemoryBase):
             function_calling_prompt = get_update_memory_messages(
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
-            try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
+            with span(
+                "add.llm.update_decision", facts=len(new_retrieved_facts), old_memories=len(retrieved_old_memory)
+            ):
+                try:
+                    response = await asyncio.to_thread(
+                        self.llm.generate_response,
+                        messages=[{"role": "user", "content": function_calling_prompt}],
+                        response_format={"type": "json_object"},
+                    )
+                except Exception as e:
+                    logger.error(f"Error in new memory actions response: {e}")
+                    response = ""
             try:
                 if not response or not response.strip():
                     logger.warning("Empty response from LLM, no memories to extract")
@@ -1449,7 +1428,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await self._vector_store_call("get", vector_id=memory_id)
         if not memory:
             return None
 
@@ -1481,6 +1460,7 @@ class AsyncMemory(MemoryBase):
 
         return result_item
 
+    @traced("get_all")
     async def get_all(
         self,
         *,
@@ -1548,19 +1528,21 @@ class AsyncMemory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'` (which returns a dict with a 'results' key). "
                 "The current format (direct list for v1.0) will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return results_dict["results"]
 
         return results_dict
 
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
-        actual_memories = (
-            memories_result[0]
-            if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
-            else memories_result
-        )
+        with span("get_all.vector_store") as span_context:
+            memories_result = await self._vector_store_call("list", filters=filters, limit=limit)
+            actual_memories = (
+                memories_result[0]
+                if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
+                else memories_result
+            )
+            span_context["results"] = len(actual_memories)
 
         promoted_payload_keys = [
             "user_id",
@@ -1593,6 +1575,7 @@ class AsyncMemory(MemoryBase):
 
         return formatted_memories
 
+    @traced("search")
     async def search(
         self,
         query: str,
@@ -1620,42 +1603,51 @@ class AsyncMemory(MemoryBase):
                   and potentially "relations" if graph store is enabled.
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "score": 0.8, ...}]}`
         """
-
-        _, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
-        )
+        with span("search.build_filters") as span_context:
+            _, effective_filters = _build_filters_and_metadata(
+                user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+            )
+            span_context["filter_count"] = len(effective_filters)
 
         if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
             raise ValueError("at least one of 'user_id', 'agent_id', or 'run_id' must be specified ")
 
-        keys, encoded_ids = process_telemetry_filters(effective_filters)
-        capture_event(
-            "mem0.search",
-            self,
-            {
-                "limit": limit,
-                "version": self.api_version,
-                "keys": keys,
-                "encoded_ids": encoded_ids,
-                "sync_type": "async",
-                "threshold": threshold,
-            },
-        )
+        with span("search.telemetry"):
+            keys, encoded_ids = process_telemetry_filters(effective_filters)
+            capture_event(
+                "mem0.search",
+                self,
+                {
+                    "limit": limit,
+                    "version": self.api_version,
+                    "keys": keys,
+                    "encoded_ids": encoded_ids,
+                    "sync_type": "async",
+                    "threshold": threshold,
+                },
+            )
 
-        vector_store_task = asyncio.create_task(self._search_vector_store(query, effective_filters, limit, threshold))
+        with span("search.concurrent_execution", graph_enabled=self.enable_graph) as span_context:
+            vector_store_task = asyncio.create_task(
+                self._search_vector_store(query, effective_filters, limit, threshold)
+            )
 
-        graph_task = None
-        if self.enable_graph:
-            if hasattr(self.graph.search, "__await__"):  # Check if graph search is async
-                graph_task = asyncio.create_task(self.graph.search(query, effective_filters, limit))
-            else:
-                graph_task = asyncio.create_task(asyncio.to_thread(self.graph.search, query, effective_filters, limit))
+            graph_task = None
+            if self.enable_graph:
+                if hasattr(self.graph.search, "__await__"):  # Check if graph search is async
+                    graph_task = asyncio.create_task(self.graph.search(query, effective_filters, limit))
+                else:
+                    graph_task = asyncio.create_task(
+                        asyncio.to_thread(self.graph.search, query, effective_filters, limit)
+                    )
 
-        if graph_task:
-            original_memories, graph_entities = await asyncio.gather(vector_store_task, graph_task)
-        else:
-            original_memories = await vector_store_task
-            graph_entities = None
+            if graph_task:
+                original_memories, graph_entities = await asyncio.gather(vector_store_task, graph_task)
+            else:
+                original_memories = await vector_store_task
+                graph_entities = None
+            span_context["memory_results"] = len(original_memories)
+            span_context["graph_results"] = len(graph_entities) if graph_entities else 0
 
         if self.enable_graph:
             return {"results": original_memories, "relations": graph_entities}
@@ -1666,52 +1658,60 @@ class AsyncMemory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return {"results": original_memories}
         else:
             return {"results": original_memories}
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
-        )
-
-        promoted_payload_keys = [
-            "user_id",
-            "agent_id",
-            "run_id",
-            "actor_id",
-            "role",
-        ]
-
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
-
-        original_memories = []
-        for mem in memories:
-            memory_item_dict = MemoryItem(
-                id=mem.id,
-                memory=mem.payload["data"],
-                hash=mem.payload.get("hash"),
-                created_at=mem.payload.get("created_at"),
-                updated_at=mem.payload.get("updated_at"),
-                score=mem.score,
-            ).model_dump()
-
-            for key in promoted_payload_keys:
-                if key in mem.payload:
-                    memory_item_dict[key] = mem.payload[key]
+        with span("vector_search.embedding", query_length=len(query)):
+            embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
 
-            additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
-            if additional_metadata:
-                memory_item_dict["metadata"] = additional_metadata
-
-            if threshold is None or mem.score >= threshold:
-                original_memories.append(memory_item_dict)
+        with span("vector_search.database_search", limit=limit) as span_context:
+            memories = await self._vector_store_call(
+                "search", query=query, vectors=embeddings, limit=limit, filters=filters
+            )
+            span_context["raw_results"] = len(memories)
+
+        with span("vector_search.result_processing") as span_context:
+            promoted_payload_keys = [
+                "user_id",
+                "agent_id",
+                "run_id",
+                "actor_id",
+                "role",
+            ]
+
+            core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+
+            original_memories = []
+            for mem in memories:
+                memory_item_dict = MemoryItem(
+                    id=mem.id,
+                    memory=mem.payload["data"],
+                    hash=mem.payload.get("hash"),
+                    created_at=mem.payload.get("created_at"),
+                    updated_at=mem.payload.get("updated_at"),
+                    score=mem.score,
+                ).model_dump()
+
+                for key in promoted_payload_keys:
+                    if key in mem.payload:
+                        memory_item_dict[key] = mem.payload[key]
+
+                additional_metadata = {k: v for k, v in mem.payload.items() if k not in core_and_promoted_keys}
+                if additional_metadata:
+                    memory_item_dict["metadata"] = additional_metadata
+
+                if threshold is None or mem.score >= threshold:
+                    original_memories.append(memory_item_dict)
+
+            span_context["final_results"] = len(original_memories)
 
         return original_memories
 
+    @traced("update")
     async def update(self, memory_id, data):
         """
         Update a memory by ID asynchronously.
@@ -1729,12 +1729,14 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        with span("update.embed"):
+            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
         return {"message": "Memory updated successfully!"}
 
+    @traced("delete")
     async def delete(self, memory_id):
         """
         Delete a memory by ID asynchronously.
@@ -1746,6 +1748,7 @@ class AsyncMemory(MemoryBase):
         await self._delete_memory(memory_id)
         return {"message": "Memory deleted successfully!"}
 
+    @traced("delete_all")
     async def delete_all(self, user_id=None, agent_id=None, run_id=None):
         """
         Delete all memories asynchronously.
@@ -1770,7 +1773,8 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        with span("delete_all.list"):
+            memories = await self._vector_store_call("list", filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -1798,12 +1802,14 @@ class AsyncMemory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "async"})
         return await asyncio.to_thread(self.db.get_history, memory_id)
 
+    @traced("memory.create")
     async def _create_memory(self, data, existing_embeddings, metadata=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            with span("memory.embed"):
+                embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -1811,23 +1817,25 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[metadata],
-        )
+        with span("vector_store.insert"):
+            await self._vector_store_call(
+                "insert",
+                vectors=[embeddings],
+                ids=[memory_id],
+                payloads=[metadata],
+            )
 
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            None,
-            data,
-            "ADD",
-            created_at=metadata.get("created_at"),
-            actor_id=metadata.get("actor_id"),
-            role=metadata.get("role"),
-        )
+        with span("history.add"):
+            await asyncio.to_thread(
+                self.db.add_history,
+                memory_id,
+                None,
+                data,
+                "ADD",
+                created_at=metadata.get("created_at"),
+                actor_id=metadata.get("actor_id"),
+                role=metadata.get("role"),
+            )
 
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
@@ -1883,11 +1891,13 @@ class AsyncMemory(MemoryBase):
 
         return result
 
+    @traced("memory.update")
     async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+            with span("vector_store.get"):
+                existing_memory = await self._vector_store_call("get", vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
@@ -1916,46 +1926,55 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
-
-        await asyncio.to_thread(
-            self.vector_store.update,
-            vector_id=memory_id,
-            vector=embeddings,
-            payload=new_metadata,
-        )
+            with span("memory.embed"):
+                embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+
+        with span("vector_store.update"):
+            await self._vector_store_call(
+                "update",
+                vector_id=memory_id,
+                vector=embeddings,
+                payload=new_metadata,
+            )
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            prev_value,
-            data,
-            "UPDATE",
-            created_at=new_metadata["created_at"],
-            updated_at=new_metadata["updated_at"],
-            actor_id=new_metadata.get("actor_id"),
-            role=new_metadata.get("role"),
-        )
+        with span("history.add"):
+            await asyncio.to_thread(
+                self.db.add_history,
+                memory_id,
+                prev_value,
+                data,
+                "UPDATE",
+                created_at=new_metadata["created_at"],
+                updated_at=new_metadata["updated_at"],
+                actor_id=new_metadata.get("actor_id"),
+                role=new_metadata.get("role"),
+            )
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
 
+    @traced("memory.delete")
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        with span("vector_store.get"):
+            existing_memory = await self._vector_store_call("get", vector_id=memory_id)
         prev_value = existing_memory.payload["data"]
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
-        await asyncio.to_thread(
-            self.db.add_history,
-            memory_id,
-            prev_value,
-            None,
-            "DELETE",
-            actor_id=existing_memory.payload.get("actor_id"),
-            role=existing_memory.payload.get("role"),
-            is_deleted=1,
-        )
+        with span("vector_store.delete"):
+            await self._vector_store_call(
+                "delete", **_delete_kwargs(self.vector_store, memory_id, existing_memory.payload)
+            )
+        with span("history.add"):
+            await asyncio.to_thread(
+                self.db.add_history,
+                memory_id,
+                prev_value,
+                None,
+                "DELETE",
+                actor_id=existing_memory.payload.get("actor_id"),
+                role=existing_memory.payload.get("role"),
+                is_deleted=1,
+            )
 
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
@@ -1974,6 +1993,8 @@ class AsyncMemory(MemoryBase):
 
         if hasattr(self.vector_store, "client") and hasattr(self.vector_store.client, "close"):
             await asyncio.to_thread(self.vector_store.client.close)
+        if hasattr(self.vector_store, "aclose"):
+            await self.vector_store.aclose()
 
         if hasattr(self.db, "connection") and self.db.connection:
             await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
@@ -22,6 +22,7 @@ from mem0.graphs.tools import (
 )
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
+from mem0.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,7 @@ class MemoryGraph:
         ):
             self.graph.query("CREATE INDEX ON :Entity;")
 
+    @traced("graph.add")
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -99,6 +101,7 @@ class MemoryGraph:
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
+    @traced("graph.search")
     def search(self, query, filters, limit=100):
         """
         Search for memories and related graph data.
@@ -135,6 +138,7 @@ class MemoryGraph:
 
         return search_results
 
+    @traced("graph.delete_all")
     def delete_all(self, filters):
         """Delete all nodes and relationships for a user or specific agent."""
         if filters.get("agent_id"):
@@ -151,6 +155,7 @@ class MemoryGraph:
             params = {"user_id": filters["user_id"]}
         self.graph.query(cypher, params=params)
 
+    @traced("graph.get_all")
     def get_all(self, filters, limit=100):
         """
         Retrieves all nodes and relationships from the graph database based on optional filtering criteria.
@@ -197,6 +202,7 @@ class MemoryGraph:
 
         return final_results
 
+    @traced("graph.llm.extract_entities")
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -230,6 +236,7 @@ class MemoryGraph:
         logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
         return entity_type_map
 
+    @traced("graph.llm.extract_relations")
     def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
         """Eshtablish relations among the extracted nodes."""
         if self.config.graph_store.custom_prompt:
@@ -271,6 +278,7 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {entities}")
         return entities
 
+    @traced("graph.query.search_nodes")
     def _search_graph_db(self, node_list, filters, limit=100):
         """Search similar nodes among and their respective incoming and outgoing relations."""
         result_relations = []
@@ -346,6 +354,7 @@ class MemoryGraph:
 
         return result_relations
 
+    @traced("graph.llm.delete_decision")
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
         search_output_string = format_entities(search_output)
@@ -373,6 +382,7 @@ class MemoryGraph:
         logger.debug(f"Deleted relationships: {to_be_deleted}")
         return to_be_deleted
 
+    @traced("graph.query.delete_entities")
     def _delete_entities(self, to_be_deleted, filters):
         """Delete the entities from the graph."""
         user_id = filters["user_id"]
@@ -415,6 +425,7 @@ class MemoryGraph:
         return results
 
     # added Entity label to all nodes for vector search to work
+    @traced("graph.query.add_entities")
     def _add_entities(self, to_be_added, filters, entity_type_map):
         """Add the new entities to the graph. Merge the nodes if they already exist."""
         user_id = filters["user_id"]
@@ -3,17 +3,68 @@ MongoDB Manager for UserProfile additional_profile storage
 """
 
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 
 try:
     from pymongo import MongoClient
     from pymongo.errors import PyMongoError
+    from pymongo.monitoring import ConnectionPoolListener
 except ImportError:
     raise ImportError("The 'pymongo' library is required. Please install it using 'pip install pymongo'.")
 
 logger = logging.getLogger(__name__)
 
 
+class _PoolStatsListener(ConnectionPoolListener):
+    """Tracks open and checked-out connections across all server pools of a client"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.in_use = 0
+        self.waiting = 0
+
+    def _add(self, field: str, amount: int):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def connection_created(self, event):
+        self._add('open', 1)
+
+    def connection_closed(self, event):
+        self._add('open', -1)
+
+    def connection_check_out_started(self, event):
+        self._add('waiting', 1)
+
+    def connection_check_out_failed(self, event):
+        self._add('waiting', -1)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.in_use += 1
+
+    def connection_checked_in(self, event):
+        self._add('in_use', -1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+
 class MongoDBManager:
     """
     MongoDB manager for UserProfile additional_profile storage
@@ -30,6 +81,8 @@ class MongoDBManager:
                 - uri: MongoDB connection URI
                 - database: Database name
                 - collection: Collection name (default: user_additional_profile)
+                - server_selection_timeout_ms: How long to look for a reachable server (default: pymongo's 30s)
+                - connect_timeout_ms: Timeout per connection attempt (default: pymongo's 20s)
         """
         self.config = config
         self.uri = config['uri']
@@ -39,12 +92,18 @@ class MongoDBManager:
         self.client = None
         self.db = None
         self.collection = None
+        self._pool_listener = _PoolStatsListener()
         self._initialize_connection()
 
     def _initialize_connection(self):
         """Initialize MongoDB connection"""
+        client_options = {}
+        if self.config.get('server_selection_timeout_ms') is not None:
+            client_options['serverSelectionTimeoutMS'] = self.config['server_selection_timeout_ms']
+        if self.config.get('connect_timeout_ms') is not None:
+            client_options['connectTimeoutMS'] = self.config['connect_timeout_ms']
         try:
-            self.client = MongoClient(self.uri)
+            self.client = MongoClient(self.uri, event_listeners=[self._pool_listener], **client_options)
             self.db = self.client[self.database_name]
             self.collection = self.db[self.collection_name]
 
@@ -53,8 +112,26 @@ class MongoDBManager:
             logger.info(f"MongoDB connected successfully to {self.database_name}.{self.collection_name}")
         except PyMongoError as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
+            # Stop the client's background monitor threads
+            self.close()
             raise
 
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool utilization
+
+        Returns:
+            Dict with size (open connections), in_use, available, waiting and max (per server)
+        """
+        listener = self._pool_listener
+        return {
+            'size': listener.open,
+            'in_use': listener.in_use,
+            'available': max(listener.open - listener.in_use, 0),
+            'waiting': max(listener.waiting, 0),
+            'max': self.client.options.pool_options.max_pool_size if self.client else 0,
+        }
+
     def create_collection(self):
         """
         Create collection and indexes if not exist
@@ -48,6 +48,8 @@ class PostgresManager:
                 - database: Database name
                 - minconn: Minimum connections in pool (default 1)
                 - maxconn: Maximum connections in pool (default 5)
+                - timeout: Seconds to wait for a pooled connection (default 30, psycopg3 only)
+                - connect_timeout: Seconds per connection attempt (default: driver default)
         """
         self.config = config
         self.connection_pool = None
@@ -63,20 +65,25 @@ class PostgresManager:
 
             minconn = self.config.get('minconn', 1)
             maxconn = self.config.get('maxconn', 5)
+            connect_kwargs = {}
+            if self.config.get('connect_timeout') is not None:
+                connect_kwargs['connect_timeout'] = self.config['connect_timeout']
 
             if PSYCOPG_VERSION == 3:
                 self.connection_pool = ConnectionPool(
                     connection_string,
                     min_size=minconn,
                     max_size=maxconn,
-                    timeout=30.0,
+                    timeout=self.config.get('timeout', 30.0),
+                    kwargs=connect_kwargs,
                     open=True  # Explicitly open the pool
                 )
             else:
                 self.connection_pool = ConnectionPool(
                     minconn=minconn,
                     maxconn=maxconn,
-                    dsn=connection_string
+                    dsn=connection_string,
+                    **connect_kwargs
                 )
 
             logger.info("PostgreSQL connection pool initialized successfully")
@@ -102,6 +109,29 @@ class PostgresManager:
             if PSYCOPG_VERSION == 2 and conn:
                 self.connection_pool.putconn(conn)
 
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool utilization
+
+        Returns:
+            Dict with size (open connections), in_use, available, waiting (psycopg3 only) and max
+        """
+        pool = self.connection_pool
+        if pool is None:
+            return {}
+        if PSYCOPG_VERSION == 3:
+            stats = pool.get_stats()
+            size, available = stats.get('pool_size', 0), stats.get('pool_available', 0)
+            return {
+                'size': size,
+                'in_use': size - available,
+                'available': available,
+                'waiting': stats.get('requests_waiting', 0),
+                'max': pool.max_size,
+            }
+        in_use, available = len(pool._used), len(pool._pool)
+        return {'size': in_use + available, 'in_use': in_use, 'available': available, 'waiting': 0, 'max': pool.maxconn}
+
     def create_table(self):
         """Create user_profile table if not exists"""
         create_table_query = """
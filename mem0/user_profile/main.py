@@ -68,7 +68,12 @@ class UserProfile:
 
         # Initialize database managers
         self.postgres = PostgresManager(config.user_profile.postgres)
-        self.mongodb = MongoDBManager(config.user_profile.mongodb)
+        try:
+            self.mongodb = MongoDBManager(config.user_profile.mongodb)
+        except Exception:
+            # Don't leave the PostgreSQL pool reconnecting in the background
+            self.postgres.close()
+            raise
 
         # Initialize LLM (shared with Memory module)
         self.llm = LlmFactory.create(
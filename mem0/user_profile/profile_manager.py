@@ -13,6 +13,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from mem0.user_profile.database import PostgresManager, MongoDBManager
+from mem0.utils.tracing import traced
 from mem0.user_profile.prompts import EXTRACT_PROFILE_PROMPT, UPDATE_PROFILE_PROMPT
 from mem0.user_profile.utils import (
     generate_uuid,
@@ -338,6 +339,7 @@ class ProfileManager:
 
         return merged
 
+    @traced("profile.extract")
     def extract_profile(self, messages: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
         """
         Stage 1: Extract profile information from messages using LLM
@@ -384,6 +386,7 @@ class ProfileManager:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return None
 
+    @traced("profile.query_existing")
     def query_existing_profile(self, user_id: str) -> Dict[str, Any]:
         """
         Stage 2: Query existing profile data and prepare for LLM
@@ -421,6 +424,7 @@ class ProfileManager:
             logger.error(f"Stage 2 failed: {e}")
             return {"basic_info": {}, "additional_profile": {}}, {}
 
+    @traced("profile.decide_operations")
     def decide_operations(
         self,
         extracted_info: Dict[str, Any],
@@ -465,6 +469,7 @@ class ProfileManager:
             logger.error(f"Stage 3 failed: {e}")
             return None
 
+    @traced("profile.execute_operations")
     def execute_operations(
         self,
         user_id: str,
@@ -641,6 +646,7 @@ class ProfileManager:
                 "errors": [str(e)],
             }
 
+    @traced("profile.update")
     def update_profile(
         self,
         user_id: str,
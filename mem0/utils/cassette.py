@@ -0,0 +1,156 @@
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Dates are masked by default: FACT_RETRIEVAL_PROMPT embeds the current date
+DEFAULT_NORMALIZE_PATTERNS = [r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?"]
+
+CASSETTE_MODES = ("replay", "record", "auto")
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request has no recorded response"""
+
+
+class Cassette:
+    """
+    Append-only on-disk store of request -> response pairs keyed by a normalized request hash.
+
+    Each line is a JSON record {"key", "kind", "latency", "response"}; embedding responses are stored as
+    base64 float32 to keep the file compact, and a path ending in ".gz" is gzip-compressed. Repeated
+    recordings of the same request are kept and replayed round-robin.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        latency_scale: float = 1.0,
+        normalize_patterns: Optional[List[str]] = None,
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Invalid cassette mode: {mode}. Must be one of {CASSETTE_MODES}")
+        if mode == "replay" and not os.path.exists(path):
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._patterns = [
+            re.compile(pattern)
+            for pattern in (DEFAULT_NORMALIZE_PATTERNS if normalize_patterns is None else normalize_patterns)
+        ]
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with self._open("r") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._entries.setdefault(record["key"], []).append(record)
+        logger.info(f"Loaded {sum(len(v) for v in self._entries.values())} recordings from cassette {self.path}")
+
+    def normalize(self, text: str) -> str:
+        for pattern in self._patterns:
+            text = pattern.sub("<masked>", text)
+        return " ".join(text.split())
+
+    def key(self, kind: str, request: Any) -> str:
+        def normalize_value(value):
+            if isinstance(value, str):
+                return self.normalize(value)
+            if isinstance(value, dict):
+                return {k: normalize_value(v) for k, v in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [normalize_value(v) for v in value]
+            return value
+
+        canonical = json.dumps([kind, normalize_value(request)], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return sum(len(records) for records in self._entries.values())
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            records = self._entries.get(key)
+            if not records:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return records[index % len(records)]
+
+    def _append(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._open("a") as f:
+                f.write(line)
+            self._entries.setdefault(record["key"], []).append(record)
+
+    @staticmethod
+    def _encode(kind: str, response: Any) -> Any:
+        if kind == "embed":
+            return {"b64": base64.b64encode(np.asarray(response, dtype=np.float32).tobytes()).decode("ascii")}
+        return response
+
+    @staticmethod
+    def _decode(kind: str, response: Any) -> Any:
+        if kind == "embed":
+            return np.frombuffer(base64.b64decode(response["b64"]), dtype=np.float32).tolist()
+        return response
+
+    def call(self, kind: str, request: Any, fn: Optional[Callable[[], Any]]) -> Any:
+        """
+        Return the recorded response for request, or record a fresh one from fn.
+
+        Args:
+            kind (str): Request kind ("llm" or "embed"); part of the key.
+            request: JSON-serializable request description.
+            fn (callable, optional): Performs the real call. Required in record and auto modes.
+
+        Returns:
+            The recorded or freshly produced response.
+
+        Raises:
+            CassetteMiss: In replay mode, if the request was never recorded.
+        """
+        key = self.key(kind, request)
+        if self.mode != "record":
+            record = self._lookup(key)
+            if record is not None:
+                delay = record.get("latency", 0.0) * self.latency_scale
+                if delay > 0:
+                    time.sleep(delay)
+                return self._decode(kind, record["response"])
+            if self.mode == "replay" or fn is None:
+                raise CassetteMiss(f"No recorded {kind} response for request {key[:12]} in cassette {self.path}")
+
+        start = time.perf_counter()
+        response = fn()
+        latency = time.perf_counter() - start
+        self._append({"key": key, "kind": kind, "latency": round(latency, 6), "response": self._encode(kind, response)})
+        return response
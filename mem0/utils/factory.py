@@ -7,8 +7,10 @@ from mem0.configs.llms.azure import AzureOpenAIConfig
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.configs.llms.deepseek import DeepSeekConfig
 from mem0.configs.llms.lmstudio import LMStudioConfig
+from mem0.configs.llms.mock import MockLlmConfig
 from mem0.configs.llms.ollama import OllamaConfig
 from mem0.configs.llms.openai import OpenAIConfig
+from mem0.configs.llms.replay import ReplayLlmConfig
 from mem0.configs.llms.vllm import VllmConfig
 from mem0.embeddings.mock import MockEmbeddings
 
@@ -44,6 +46,8 @@ class LlmFactory:
         "lmstudio": ("mem0.llms.lmstudio.LMStudioLLM", LMStudioConfig),
         "vllm": ("mem0.llms.vllm.VllmLLM", VllmConfig),
         "langchain": ("mem0.llms.langchain.LangchainLLM", BaseLlmConfig),
+        "mock": ("mem0.llms.mock.MockLLM", MockLlmConfig),
+        "replay": ("mem0.llms.replay.ReplayLLM", ReplayLlmConfig),
     }
 
     @classmethod
@@ -141,6 +145,8 @@ class EmbedderFactory:
         "aws_bedrock": "mem0.embeddings.aws_bedrock.AWSBedrockEmbedding",
         "doubao": "mem0.embeddings.doubao.DoubaoEmbedding",
         "qwen": "mem0.embeddings.qwen.QwenEmbedding",
+        "mock": "mem0.embeddings.mock.HashEmbedding",
+        "replay": "mem0.embeddings.replay.ReplayEmbedding",
     }
 
     @classmethod
@@ -175,6 +181,7 @@ class VectorStoreFactory:
         "supabase": "mem0.vector_stores.supabase.Supabase",
         "weaviate": "mem0.vector_stores.weaviate.Weaviate",
         "faiss": "mem0.vector_stores.faiss.FAISS",
+        "sqlite": "mem0.vector_stores.sqlite.SQLiteVectorStore",
         "langchain": "mem0.vector_stores.langchain.Langchain",
         "s3_vectors": "mem0.vector_stores.s3_vectors.S3Vectors",
         "baidu": "mem0.vector_stores.baidu.BaiduDB",
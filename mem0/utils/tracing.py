@@ -0,0 +1,89 @@
+import contextvars
+import functools
+import inspect
+import os
+import sys
+from contextlib import nullcontext
+
+# Performance monitoring setup: performance_monitoring/ lives next to the mem0 package (and is on
+# PYTHONPATH in the Docker image). Without it, spans are no-ops.
+PERFORMANCE_MONITORING_ENABLED = False
+try:
+    perf_monitoring_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "performance_monitoring"
+    )
+    if perf_monitoring_path not in sys.path:
+        sys.path.insert(0, perf_monitoring_path)
+
+    from performance_logger import get_performance_logger
+
+    PERFORMANCE_MONITORING_ENABLED = True
+except ImportError:
+    pass
+
+
+def span(name: str, **context):
+    """
+    Time a pipeline stage as a nested span.
+
+    Spans opened inside another span share its request id and record it as their parent; a span opened
+    outside any span starts a new request. The returned context manager yields a dict that the caller
+    may extend with attributes (e.g. result counts) which are written with the span's log event.
+
+    Args:
+        name (str): Stage name, e.g. "add.llm.extract_facts". Used as the histogram name.
+        **context: Initial low-cost attributes for the log event.
+
+    Returns:
+        A context manager yielding the span's attribute dict.
+    """
+    if PERFORMANCE_MONITORING_ENABLED:
+        return get_performance_logger().span(name, context)
+    return nullcontext(context)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """
+    Submit fn to a thread pool executor, carrying over the current span so work done in the worker nests under it.
+
+    Args:
+        executor (concurrent.futures.Executor): Executor to submit to.
+        fn (callable): Function to run.
+        *args: Positional arguments for fn.
+        **kwargs: Keyword arguments for fn.
+
+    Returns:
+        concurrent.futures.Future: The future of the submitted call.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def traced(name: str):
+    """
+    Decorator that runs every call of a function, sync or async, inside span(name).
+
+    Args:
+        name (str): Span name.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
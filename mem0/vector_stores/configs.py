@@ -29,6 +29,7 @@ class VectorStoreConfig(BaseModel):
         "supabase": "SupabaseConfig",
         "weaviate": "WeaviateConfig",
         "faiss": "FAISSConfig",
+        "sqlite": "SQLiteVectorConfig",
         "langchain": "LangchainConfig",
         "s3_vectors": "S3VectorsConfig",
     }
@@ -1,9 +1,9 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 try:
     from elasticsearch import Elasticsearch
-    from elasticsearch.helpers import bulk
+    from elasticsearch.helpers import parallel_bulk, streaming_bulk
 except ImportError:
     raise ImportError("Elasticsearch requires extra dependencies. Install with `pip install elasticsearch`") from None
 
@@ -43,6 +43,10 @@ class ElasticsearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.num_candidates = config.num_candidates
+        self.bulk_chunk_size = config.bulk_chunk_size
+        self.bulk_thread_count = config.bulk_thread_count
+        self.refresh = config.refresh
 
         # Create index only if auto_create_index is True
         if config.auto_create_index:
@@ -93,19 +97,48 @@ class ElasticsearchDB(VectorStoreBase):
             self.client.indices.create(index=name, body=index_settings)
             logger.info(f"Created index {name}")
 
+    def _bulk(self, actions, refresh=None) -> None:
+        """
+        Stream actions to the _bulk API in chunks of bulk_chunk_size.
+
+        With bulk_thread_count > 1 the chunks are sent from a thread pool. Raises on the first failed item.
+        """
+        refresh = self.refresh if refresh is None else refresh
+        options = {"chunk_size": self.bulk_chunk_size}
+        if refresh is not None:
+            options["refresh"] = refresh
+        if self.bulk_thread_count > 1:
+            results = parallel_bulk(self.client, actions, thread_count=self.bulk_thread_count, **options)
+        else:
+            results = streaming_bulk(self.client, actions, **options)
+        for _ in results:
+            pass
+
     def insert(
-        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+        self,
+        vectors: List[List[float]],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+        refresh: Optional[Union[bool, str]] = None,
     ) -> List[OutputData]:
-        """Insert vectors into the index."""
+        """
+        Insert vectors into the index.
+
+        Args:
+            vectors (List[List[float]]): Vectors to insert.
+            payloads (List[Dict], optional): Payloads corresponding to vectors.
+            ids (List[str], optional): IDs corresponding to vectors.
+            refresh (bool | str, optional): Refresh policy for this call (True, False or "wait_for").
+                Defaults to the configured refresh.
+        """
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
-        actions = []
-        for i, (vec, id_) in enumerate(zip(vectors, ids)):
-            action = {
+        actions = (
+            {
                 "_index": self.collection_name,
                 "_id": id_,
                 "_source": {
@@ -113,9 +146,9 @@ class ElasticsearchDB(VectorStoreBase):
                     "metadata": payloads[i],  # Store all metadata in the metadata field
                 },
             }
-            actions.append(action)
-
-        bulk(self.client, actions)
+            for i, (vec, id_) in enumerate(zip(vectors, ids))
+        )
+        self._bulk(actions, refresh=refresh)
 
         results = []
         for i, id_ in enumerate(ids):
@@ -128,39 +161,98 @@ class ElasticsearchDB(VectorStoreBase):
             )
         return results
 
-    def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
-    ) -> List[OutputData]:
-        """
-        Search with two options:
-        1. Use custom search query if provided
-        2. Use KNN search on vectors with pre-filtering if no custom search query is provided
-        """
+    def _search_query(
+        self, vectors: List[float], limit: int, filters: Optional[Dict], num_candidates: Optional[int] = None
+    ) -> Dict:
         if self.custom_search_query:
             search_query = self.custom_search_query(vectors, limit, filters)
         else:
+            num_candidates = num_candidates or self.num_candidates or limit * 2
             search_query = {
-                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
+                "knn": {
+                    "field": "vector",
+                    "query_vector": vectors,
+                    "k": limit,
+                    # Elasticsearch rejects num_candidates below k or above 10000
+                    "num_candidates": min(max(num_candidates, limit), 10000),
+                }
             }
             if filters:
                 filter_conditions = []
                 for key, value in filters.items():
                     filter_conditions.append({"term": {f"metadata.{key}": value}})
                 search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+        # The vector field is never needed in results; skip fetching and serializing it
+        search_query.setdefault("_source", {"excludes": ["vector"]})
+        return search_query
 
+    @staticmethod
+    def _parse_hits(response: Dict) -> List[OutputData]:
+        return [
+            OutputData(id=hit["_id"], score=hit["_score"], payload=hit.get("_source", {}).get("metadata", {}))
+            for hit in response["hits"]["hits"]
+        ]
+
+    def search(
+        self,
+        query: str,
+        vectors: List[float],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        num_candidates: Optional[int] = None,
+    ) -> List[OutputData]:
+        """
+        Search with two options:
+        1. Use custom search query if provided
+        2. Use KNN search on vectors with pre-filtering if no custom search query is provided
+
+        num_candidates overrides the configured candidate pool for this request; larger pools trade
+        latency for recall.
+        """
+        search_query = self._search_query(vectors, limit, filters, num_candidates)
         response = self.client.search(index=self.collection_name, body=search_query)
+        return self._parse_hits(response)
+
+    def search_batch(
+        self,
+        vectors: List[List[float]],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        num_candidates: Optional[int] = None,
+    ) -> List[List[OutputData]]:
+        """
+        Run several KNN searches in one _msearch request.
 
-        results = []
-        for hit in response["hits"]["hits"]:
-            results.append(
-                OutputData(id=hit["_id"], score=hit["_score"], payload=hit.get("_source", {}).get("metadata", {}))
-            )
+        Args:
+            vectors (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query.
+            num_candidates (int, optional): Candidate pool override for these queries.
+
+        Returns:
+            List[List[OutputData]]: Search results, one list per query vector.
+        """
+        if not vectors:
+            return []
+        searches = []
+        for vector in vectors:
+            searches.append({"index": self.collection_name})
+            searches.append(self._search_query(vector, limit, filters, num_candidates))
+        response = self.client.msearch(body=searches)
 
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                raise RuntimeError(f"Batch search failed: {item['error']}")
+            results.append(self._parse_hits(item))
         return results
 
     def delete(self, vector_id: str) -> None:
         """Delete a vector by ID."""
-        self.client.delete(index=self.collection_name, id=vector_id)
+        if self.refresh is not None:
+            self.client.delete(index=self.collection_name, id=vector_id, refresh=self.refresh)
+        else:
+            self.client.delete(index=self.collection_name, id=vector_id)
 
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload."""
@@ -170,12 +262,15 @@ class ElasticsearchDB(VectorStoreBase):
         if payload is not None:
             doc["metadata"] = payload
 
-        self.client.update(index=self.collection_name, id=vector_id, body={"doc": doc})
+        if self.refresh is not None:
+            self.client.update(index=self.collection_name, id=vector_id, body={"doc": doc}, refresh=self.refresh)
+        else:
+            self.client.update(index=self.collection_name, id=vector_id, body={"doc": doc})
 
     def get(self, vector_id: str) -> Optional[OutputData]:
         """Retrieve a vector by ID."""
         try:
-            response = self.client.get(index=self.collection_name, id=vector_id)
+            response = self.client.get(index=self.collection_name, id=vector_id, source_excludes=["vector"])
             return OutputData(
                 id=response["_id"],
                 score=1.0,  # Default score for direct get
@@ -205,7 +300,7 @@ class ElasticsearchDB(VectorStoreBase):
 
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
         """List all memories."""
-        query: Dict[str, Any] = {"query": {"match_all": {}}}
+        query: Dict[str, Any] = {"query": {"match_all": {}}, "_source": {"excludes": ["vector"]}}
 
         if filters:
             filter_conditions = []
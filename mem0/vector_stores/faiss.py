@@ -1,9 +1,17 @@
+import json
 import logging
 import os
 import pickle
+import shutil
+import sqlite3
+import struct
+import threading
 import uuid
+import weakref
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Hashable, List, Optional
 
 import numpy as np
 from pydantic import BaseModel
@@ -30,6 +38,217 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+_LOG_RECORD_HEADER = struct.Struct("<I")
+
+# Payload keys always indexed from value to internal ids; filtered search and list() only touch matching vectors
+INDEXED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id")
+# Bucket for payload values that cannot be dict keys; always included in candidate sets and post-filtered
+_UNHASHABLE = object()
+
+
+def _write_durable(path: str, data) -> None:
+    """Write bytes (or a uint8 array) to path and fsync before returning."""
+    with open(path, "wb") as f:
+        f.write(memoryview(data))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _file_crc32(path: str, chunk_size: int = 1 << 20) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return crc
+            crc = zlib.crc32(chunk, crc)
+
+
+class _MutationLog:
+    """
+    Append-only log of pickled mutation records, each prefixed with its length.
+
+    A batch of records is fsynced before `append` returns. `rotate` moves the
+    current log aside so a snapshot can be written while new mutations keep
+    appending to a fresh file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rotated_path = f"{path}.1"
+        self.records = 0
+        self._file = open(path, "ab")
+
+    def append(self, records: List[tuple]):
+        buffer = bytearray()
+        for record in records:
+            data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+            buffer += _LOG_RECORD_HEADER.pack(len(data))
+            buffer += data
+        self._file.write(buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records += len(records)
+
+    def rotate(self) -> str:
+        """Move the current log to `<path>.1` and start a new one. Returns the rotated path."""
+        self._file.close()
+        if os.path.exists(self.rotated_path):
+            # A previous compaction failed before removing its rotated log; keep both tails
+            with open(self.rotated_path, "ab") as dst, open(self.path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.rotated_path)
+        self._file = open(self.path, "ab")
+        self.records = 0
+        return self.rotated_path
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    @staticmethod
+    def read(path: str):
+        """Yield records from a log file, truncating a torn record left by a crash mid-append."""
+        if not os.path.exists(path):
+            return
+        with open(path, "r+b") as f:
+            offset = 0
+            while True:
+                header = f.read(_LOG_RECORD_HEADER.size)
+                if not header:
+                    return
+                data = f.read(_LOG_RECORD_HEADER.unpack(header)[0]) if len(header) == _LOG_RECORD_HEADER.size else b""
+                try:
+                    record = pickle.loads(data)
+                except Exception:
+                    logger.warning(f"Truncating torn record at offset {offset} in {path}")
+                    f.truncate(offset)
+                    return
+                offset = f.tell()
+                yield record
+
+
+class _SQLiteDocstore:
+    """
+    Payload store backed by a SQLite file, with an LRU of recently used payloads.
+
+    Implements the subset of the dict interface FAISS uses, so it can stand in for the in-memory docstore.
+    Payloads are stored as JSON and written through immediately.
+    """
+
+    _ITEMS_CHUNK = 1000
+
+    def __init__(self, path: str, cache_size: int = 10000):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS payloads (id TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+        self._conn.commit()
+
+    def _remember(self, key: str, payload: Dict):
+        self._cache[key] = payload
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            payload = self._cache.get(key)
+            if payload is not None:
+                self._cache.move_to_end(key)
+                return payload
+            row = self._conn.execute("SELECT payload FROM payloads WHERE id = ?", (key,)).fetchone()
+            if row is None:
+                return default
+            payload = json.loads(row[0])
+            self._remember(key, payload)
+            return payload
+
+    def __getitem__(self, key: str) -> Dict:
+        payload = self.get(key)
+        if payload is None:
+            raise KeyError(key)
+        return payload
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: str, payload: Dict):
+        self.update({key: payload})
+
+    def update(self, items: Dict[str, Dict]):
+        """Upsert several payloads in one transaction."""
+        rows = [(key, json.dumps(payload, default=str)) for key, payload in items.items()]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO payloads (id, payload) VALUES (?, ?)", rows)
+            for key, payload in items.items():
+                self._remember(key, payload)
+
+    def pop(self, key: str, default=None):
+        payload = self.get(key)
+        if payload is None:
+            return default
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM payloads WHERE id = ?", (key,))
+            self._cache.pop(key, None)
+        return payload
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM payloads").fetchone()[0]
+
+    def items(self):
+        """Iterate all payloads in chunks, without holding the lock between chunks."""
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, id, payload FROM payloads WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, self._ITEMS_CHUNK),
+                ).fetchall()
+            if not rows:
+                return
+            for last_rowid, key, payload in rows:
+                yield key, json.loads(payload)
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM payloads")
+            self._cache.clear()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _compaction_loop(store_ref, stop: threading.Event, wakeup: threading.Event, interval: float):
+    """Background compaction thread; holds only a weak reference so the store can be collected."""
+    while not stop.is_set():
+        wakeup.wait(interval)
+        wakeup.clear()
+        if stop.is_set():
+            return
+        store = store_ref()
+        if store is None:
+            return
+        try:
+            if store._log is not None and store._log.records:
+                store._compact()
+        except Exception as e:
+            logger.warning(f"FAISS snapshot compaction failed: {e}")
+        del store
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -45,6 +264,19 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        persistence: str = "snapshot",
+        compaction_interval: float = 300,
+        compaction_log_records: int = 10000,
+        tombstone_ratio: float = 0.1,
+        index_type: Optional[str] = None,
+        training_threshold: Optional[int] = None,
+        search_params: Optional[Dict] = None,
+        background_training: bool = True,
+        omp_threads: Optional[int] = None,
+        docstore: str = "memory",
+        docstore_cache_size: int = 10000,
+        mmap_index: bool = False,
+        indexed_payload_keys: Optional[List[str]] = None,
     ):
         """
         Initialize the FAISS vector store.
@@ -56,48 +288,305 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            persistence (str, optional): 'snapshot' rewrites the index and docstore on every mutation; 'log'
+                appends each mutation batch to a write-ahead log and compacts it into a snapshot in the background.
+                Defaults to "snapshot".
+            compaction_interval (float, optional): Seconds between background compactions in 'log' mode.
+                Defaults to 300.
+            compaction_log_records (int, optional): Log records that trigger an early compaction in 'log' mode.
+                Defaults to 10000.
+            tombstone_ratio (float, optional): Fraction of deleted-but-not-yet-removed vectors in the index that
+                triggers removing them in one batch. Defaults to 0.1.
+            index_type (str, optional): faiss.index_factory string such as "HNSW32", "IVF4096,PQ64" or "IVF1024,SQ8".
+                Defaults to None (exact flat index).
+            training_threshold (int, optional): Vectors required before a trainable index_type is trained. Until
+                then searches run on an exact flat buffer. Defaults to None (derived from the index type).
+            search_params (Dict, optional): Index parameters applied with faiss.ParameterSpace, e.g.
+                {"nprobe": 32} or {"efSearch": 128}. Defaults to None.
+            background_training (bool, optional): Train and swap in the index on a background thread.
+                Defaults to True.
+            omp_threads (int, optional): Process-wide OpenMP thread count for FAISS. Defaults to None.
+            docstore (str, optional): 'memory' keeps payloads in a pickled dict; 'sqlite' keeps them in
+                <collection>.docstore.db with an LRU of hot payloads. Defaults to "memory".
+            docstore_cache_size (int, optional): Payloads cached in memory by the 'sqlite' docstore.
+                Defaults to 10000.
+            mmap_index (bool, optional): Memory-map the index file on load (faiss.IO_FLAG_MMAP) instead of
+                reading it into RAM. Defaults to False.
+            indexed_payload_keys (List[str], optional): Payload keys indexed in addition to user_id, agent_id
+                and run_id. Defaults to None.
         """
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
-
-        # Initialize storage structures
+        self.persistence = persistence
+        self.compaction_interval = compaction_interval
+        self.compaction_log_records = compaction_log_records
+        self.tombstone_ratio = tombstone_ratio
+        self.index_type = index_type
+        self.training_threshold = training_threshold
+        self.search_params = search_params or {}
+        self.background_training = background_training
+        self.docstore_backend = docstore
+        self.docstore_cache_size = docstore_cache_size
+        self.mmap_index = mmap_index
+        self.indexed_payload_keys = tuple(dict.fromkeys(INDEXED_PAYLOAD_KEYS + tuple(indexed_payload_keys or ())))
+
+        if omp_threads:
+            faiss.omp_set_num_threads(omp_threads)
+
+        # Initialize storage structures. The index is keyed by internal int64 ids (natively for IVF indexes,
+        # through IndexIDMap2 otherwise), which index_to_id/id_to_index translate to and from memory ids.
+        # Deleted internal ids stay in the index as tombstones until _purge_tombstones removes them in one batch.
         self.index = None
         self.docstore = {}
         self.index_to_id = {}
+        self.id_to_index = {}
+        self._payload_index = {key: {} for key in self.indexed_payload_keys}
+        self._next_index_id = 0
+        self._tombstones = set()
+        self._tombstone_selector = None
+        # index_type the current index was built for; None while searches run on the flat buffer
+        self._built_index_type = None
+        self._index_generation = 0
+        self._training_thread = None
+        # Set when the index was memory-mapped in a layout FAISS cannot modify (IVF on-disk inverted lists)
+        self._index_read_only = False
+
+        # Mutations and snapshot capture hold _lock; _compaction_lock serialises snapshot writers
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._seq = 0
+        self._log = None
+        self._compaction_stop = None
+        self._compaction_wakeup = None
 
         # Create directory if it doesn't exist
         if self.path:
             os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
             # Try to load existing index if available
-            index_path = f"{self.path}/{collection_name}.faiss"
-            docstore_path = f"{self.path}/{collection_name}.pkl"
+            index_path, docstore_path = self._snapshot_paths()
+            self._recover_snapshot(index_path, docstore_path)
             if os.path.exists(index_path) and os.path.exists(docstore_path):
                 self._load(index_path, docstore_path)
             else:
                 self.create_col(collection_name)
 
+            if self.persistence == "log":
+                self._start_compactor()
+            self._maybe_build_index()
+
+    def _snapshot_paths(self):
+        return f"{self.path}/{self.collection_name}.faiss", f"{self.path}/{self.collection_name}.pkl"
+
+    def _docstore_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.docstore.db"
+
+    def _open_docstore(self, loaded: Optional[Dict] = None):
+        """
+        Set up the configured docstore backend from a loaded snapshot.
+
+        loaded is the docstore pickled in the snapshot, or None if the snapshot was written by the 'sqlite'
+        backend. Switching backends migrates the payloads.
+        """
+        if self.docstore_backend == "sqlite":
+            self._close_docstore()
+            self.docstore = _SQLiteDocstore(self._docstore_path(), self.docstore_cache_size)
+            if loaded is not None:
+                # A file left over from an earlier switch back to 'memory' is stale
+                self.docstore.clear()
+                self.docstore.update(loaded)
+                logger.info(f"Migrated {len(loaded)} FAISS payloads to {self._docstore_path()}")
+        elif loaded is not None:
+            self.docstore = loaded
+        elif not os.path.exists(self._docstore_path()):
+            self.docstore = {}
+        else:
+            sqlite_docstore = _SQLiteDocstore(self._docstore_path(), self.docstore_cache_size)
+            self.docstore = dict(sqlite_docstore.items())
+            sqlite_docstore.close()
+
+    def _close_docstore(self):
+        if isinstance(self.docstore, _SQLiteDocstore):
+            self.docstore.close()
+
+    def _read_index(self, index_path: str):
+        if self.mmap_index:
+            try:
+                index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP)
+                self._index_read_only = faiss.try_extract_index_ivf(index) is not None
+                return index
+            except RuntimeError as e:
+                logger.warning(f"Cannot memory-map FAISS index {index_path}, reading it instead: {e}")
+        self._index_read_only = False
+        return faiss.read_index(index_path)
+
+    def _ensure_writable_index(self):
+        """
+        Read a memory-mapped IVF index into RAM before it is modified or serialised.
+
+        Serialising the mmapped on-disk inverted lists would only reference the file. The index cannot have
+        changed since it was mapped, so the snapshot file on disk is an exact copy.
+        """
+        if self._index_read_only:
+            index = faiss.read_index(self._snapshot_paths()[0])
+            if self._built_index_type == self.index_type:
+                self._apply_search_params(index)
+            self.index = index
+            self._index_read_only = False
+
+    def _log_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.log"
+
+    def _recover_snapshot(self, index_path: str, docstore_path: str):
+        """
+        Finish or discard a snapshot write interrupted by a crash.
+
+        The docstore pickle is replaced first and records the CRC of the index it was written with, so a
+        leftover index temp file is rolled forward only if the committed docstore expects it.
+        """
+        index_tmp = f"{index_path}.tmp"
+        if os.path.exists(f"{docstore_path}.tmp"):
+            os.remove(f"{docstore_path}.tmp")
+        if not os.path.exists(index_tmp):
+            return
+        try:
+            with open(docstore_path, "rb") as f:
+                state = pickle.load(f)
+            expected_crc = state.get("index_crc") if isinstance(state, dict) else None
+        except Exception:
+            expected_crc = None
+        if expected_crc is not None and expected_crc == _file_crc32(index_tmp):
+            os.replace(index_tmp, index_path)
+            logger.info(f"Recovered interrupted FAISS snapshot for {self.collection_name}")
+        else:
+            os.remove(index_tmp)
+
     def _load(self, index_path: str, docstore_path: str):
         """
-        Load FAISS index and docstore from disk.
+        Load FAISS index and docstore from disk, then replay any mutation log tail.
 
         Args:
             index_path (str): Path to FAISS index file.
             docstore_path (str): Path to docstore pickle file.
         """
         try:
-            self.index = faiss.read_index(index_path)
+            self.index = self._read_index(index_path)
             with open(docstore_path, "rb") as f:
-                self.docstore, self.index_to_id = pickle.load(f)
+                state = pickle.load(f)
+            if isinstance(state, dict):
+                self._open_docstore(state["docstore"])
+                self.index_to_id = state["index_to_id"]
+                self._seq = state.get("seq", 0)
+                self._next_index_id = state.get("next_index_id", self.index.ntotal)
+                self._tombstones = state.get("tombstones", set())
+                self._tombstone_selector = None
+                self._built_index_type = state.get("index_type")
+                payload_index = state.get("payload_index")
+            else:
+                # Snapshots written before the mutation log existed
+                docstore, self.index_to_id = state
+                self._open_docstore(docstore)
+                payload_index = None
+            self.id_to_index = {vector_id: idx for idx, vector_id in self.index_to_id.items()}
+            if payload_index is not None and tuple(payload_index) == self.indexed_payload_keys:
+                self._payload_index = payload_index
+            else:
+                # Older snapshot or a changed indexed_payload_keys setting
+                self._rebuild_payload_index()
+            if isinstance(self.index, faiss.IndexFlat):
+                self._migrate_positional_index()
+            elif self._built_index_type and self._built_index_type == self.index_type:
+                self._apply_search_params(self.index)
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
 
             self.docstore = {}
             self.index_to_id = {}
+            self.id_to_index = {}
+            return
+
+        replayed = self._replay_log()
+        if self.persistence == "log":
+            self._log = _MutationLog(self._log_path())
+            self._log.records = replayed
+        elif replayed:
+            # Switched back from 'log' mode: fold the tail into a snapshot and drop the log
+            self._save()
+            self._remove_log_files()
+
+    def _migrate_positional_index(self):
+        """
+        Convert an index written before ids were mapped explicitly.
+
+        Old indexes keyed vectors by insertion position and never removed deleted vectors, so only the
+        positions still referenced by index_to_id are copied into the new IndexIDMap2.
+        """
+        legacy = self.index
+        live = np.array(sorted(idx for idx in self.index_to_id if idx < legacy.ntotal), dtype=np.int64)
+        self.index = faiss.IndexIDMap2(self._new_base_index())
+        if len(live):
+            self.index.add_with_ids(legacy.reconstruct_batch(live), live)
+        self._next_index_id = legacy.ntotal
+        self._tombstones = set()
+        logger.info(
+            f"Migrated FAISS index {self.collection_name} to IndexIDMap2, dropping {legacy.ntotal - len(live)} "
+            "deleted vectors"
+        )
+        self._save()
+
+    def _replay_log(self) -> int:
+        """Apply log records newer than the loaded snapshot. Returns the number of records replayed."""
+        log_path = self._log_path()
+        replayed = 0
+        for path in (f"{log_path}.1", log_path):
+            for record in _MutationLog.read(path):
+                if record[1] <= self._seq:
+                    continue
+                self._apply_record(record)
+                self._seq = record[1]
+                replayed += 1
+        if replayed:
+            logger.info(f"Replayed {replayed} FAISS log records for {self.collection_name}")
+        return replayed
+
+    def _remove_log_files(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        log_path = self._log_path()
+        for path in (log_path, f"{log_path}.1"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _capture_snapshot(self):
+        """Serialise the in-memory state. Must be called with _lock held."""
+        self._ensure_writable_index()
+        index_bytes = faiss.serialize_index(self.index)
+        state = {
+            # The sqlite docstore is written through and not part of the snapshot
+            "docstore": None if isinstance(self.docstore, _SQLiteDocstore) else self.docstore,
+            "index_to_id": self.index_to_id,
+            "next_index_id": self._next_index_id,
+            "tombstones": self._tombstones,
+            "payload_index": self._payload_index,
+            "index_type": self._built_index_type,
+            "seq": self._seq,
+            "index_crc": zlib.crc32(index_bytes),
+        }
+        return index_bytes, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _write_snapshot(self, index_bytes, state_bytes):
+        """Write a captured snapshot. The docstore rename is the commit point (see _recover_snapshot)."""
+        os.makedirs(self.path, exist_ok=True)
+        index_path, docstore_path = self._snapshot_paths()
+        _write_durable(f"{index_path}.tmp", index_bytes)
+        _write_durable(f"{docstore_path}.tmp", state_bytes)
+        os.replace(f"{docstore_path}.tmp", docstore_path)
+        os.replace(f"{index_path}.tmp", index_path)
 
     def _save(self):
         """Save FAISS index and docstore to disk."""
@@ -105,16 +594,77 @@ class FAISS(VectorStoreBase):
             return
 
         try:
-            os.makedirs(self.path, exist_ok=True)
-            index_path = f"{self.path}/{self.collection_name}.faiss"
-            docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-            faiss.write_index(self.index, index_path)
-            with open(docstore_path, "wb") as f:
-                pickle.dump((self.docstore, self.index_to_id), f)
+            with self._compaction_lock:
+                with self._lock:
+                    snapshot = self._capture_snapshot()
+                self._write_snapshot(*snapshot)
         except Exception as e:
             logger.warning(f"Failed to save FAISS index: {e}")
 
+    def _compact(self):
+        """Write a snapshot of the current state and drop the log records it covers."""
+        with self._compaction_lock:
+            with self._lock:
+                if self.index is None or self._log is None:
+                    return
+                self._purge_tombstones()
+                snapshot = self._capture_snapshot()
+                rotated_path = self._log.rotate()
+            self._write_snapshot(*snapshot)
+            os.remove(rotated_path)
+        logger.debug(f"Compacted FAISS mutation log for {self.collection_name}")
+
+    def _start_compactor(self):
+        self._compaction_stop = threading.Event()
+        self._compaction_wakeup = threading.Event()
+        threading.Thread(
+            target=_compaction_loop,
+            args=(weakref.ref(self), self._compaction_stop, self._compaction_wakeup, self.compaction_interval),
+            name=f"faiss-compactor-{self.collection_name}",
+            daemon=True,
+        ).start()
+
+    def _append_log(self, record: tuple) -> bool:
+        """
+        Append an applied mutation to the log. Must be called with _lock held so log order matches apply order.
+
+        Returns False in 'snapshot' mode, where the caller saves a full snapshot after releasing _lock
+        (_compaction_lock is always taken before _lock).
+        """
+        if self._log is None:
+            return False
+        self._log.append([record])
+        if self._log.records >= self.compaction_log_records and self._compaction_wakeup is not None:
+            self._compaction_wakeup.set()
+        return True
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def flush(self):
+        """
+        Remove tombstoned vectors and compact the mutation log into a fresh snapshot.
+
+        Every mutation is already durable when it returns; this only shortens replay on the next load.
+        """
+        if self._log is not None:
+            self._compact()
+        elif self._tombstones and self.index is not None:
+            with self._lock:
+                self._purge_tombstones()
+            self._save()
+
+    def close(self):
+        """Stop the background compactor and flush pending log records."""
+        if self._compaction_stop is not None:
+            self._compaction_stop.set()
+            self._compaction_wakeup.set()
+        if self._log is not None:
+            self.flush()
+            self._log.close()
+            self._log = None
+
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
         Parse the output data.
@@ -168,20 +718,157 @@ class FAISS(VectorStoreBase):
         Returns:
             self: The FAISS instance.
         """
-        distance_strategy = distance or self.distance_strategy
+        if distance:
+            self.distance_strategy = distance
 
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
+        self.index = self._initial_index()
+        self._index_generation += 1
+        self.index_to_id = {}
+        self.id_to_index = {}
+        self._payload_index = {key: {} for key in self.indexed_payload_keys}
+        self._next_index_id = 0
+        self._tombstones = set()
+        self._tombstone_selector = None
+        self._index_read_only = False
 
         self.collection_name = name
+        if self.docstore_backend == "sqlite" and self.path:
+            os.makedirs(self.path, exist_ok=True)
+            self._open_docstore()
+            self.docstore.clear()
 
         self._save()
+        if self.persistence == "log" and self._log is None and self.path:
+            self._log = _MutationLog(self._log_path())
 
         return self
 
+    def _metric(self) -> int:
+        if self.distance_strategy.lower() == "inner_product" or self.distance_strategy.lower() == "cosine":
+            return faiss.METRIC_INNER_PRODUCT
+        return faiss.METRIC_L2
+
+    def _new_base_index(self):
+        """Create an empty index for the configured distance strategy."""
+        if self._metric() == faiss.METRIC_INNER_PRODUCT:
+            return faiss.IndexFlatIP(self.embedding_model_dims)
+        return faiss.IndexFlatL2(self.embedding_model_dims)
+
+    def _initial_index(self):
+        """The configured index if it needs no training (flat, HNSW), otherwise a flat buffer."""
+        self._built_index_type = None
+        if self.index_type:
+            base = faiss.index_factory(self.embedding_model_dims, self.index_type, self._metric())
+            if base.is_trained:
+                self._built_index_type = self.index_type
+                return self._wrap_index(base)
+        return faiss.IndexIDMap2(self._new_base_index())
+
+    def _wrap_index(self, base):
+        """IVF indexes keep external ids natively; everything else goes through IndexIDMap2."""
+        index = base if faiss.try_extract_index_ivf(base) is not None else faiss.IndexIDMap2(base)
+        self._apply_search_params(index)
+        return index
+
+    def _apply_search_params(self, index):
+        if not self.search_params:
+            return
+        parameter_space = faiss.ParameterSpace()
+        for name, value in self.search_params.items():
+            try:
+                parameter_space.set_index_parameter(index, name, value)
+            except RuntimeError as e:
+                logger.warning(f"Ignoring FAISS search parameter {name}={value} for {self.index_type}: {e}")
+
+    def _training_size(self) -> int:
+        if self.training_threshold is not None:
+            return self.training_threshold
+        probe = faiss.index_factory(self.embedding_model_dims, self.index_type, self._metric())
+        if probe.is_trained:
+            return 0
+        # k-means wants ~39 points per centroid; PQ codebooks need 256 * 39
+        ivf = faiss.try_extract_index_ivf(probe)
+        return max(10000, 39 * ivf.nlist) if ivf is not None else 10000
+
+    def _maybe_build_index(self):
+        """Build the configured index_type once the flat buffer holds enough vectors to train it."""
+        if not self.index_type or self._built_index_type == self.index_type or self.index is None:
+            return
+        if len(self.index_to_id) < self._training_size():
+            return
+        self.retrain()
+
+    def retrain(self, background: Optional[bool] = None):
+        """
+        Build the configured index_type from the current vectors and swap it in.
+
+        Also useful after the data distribution has drifted from the one an IVF/PQ index was trained on.
+        Vectors are read back from the current index, so retraining a PQ index starts from decoded vectors.
+
+        Args:
+            background (bool, optional): Train on a background thread. Defaults to background_training.
+        """
+        if not self.index_type:
+            return
+        if self._training_thread is not None and self._training_thread.is_alive():
+            return
+        if background is None:
+            background = self.background_training
+        if background:
+            self._training_thread = threading.Thread(
+                target=self._build_index, name=f"faiss-train-{self.collection_name}", daemon=True
+            )
+            self._training_thread.start()
+        else:
+            self._build_index()
+
+    def _build_index(self):
+        try:
+            with self._lock:
+                generation = self._index_generation
+                live = np.fromiter(self.index_to_id.keys(), dtype=np.int64, count=len(self.index_to_id))
+                vectors = self._reconstruct(live)
+
+            # Training runs without the lock; searches and writes keep using the current index meanwhile
+            base = faiss.index_factory(self.embedding_model_dims, self.index_type, self._metric())
+            if not base.is_trained:
+                base.train(vectors)
+
+            with self._lock:
+                if self.index is None or generation != self._index_generation:
+                    return
+                index = self._wrap_index(base)
+                # Re-read the live set so writes made during training are carried over
+                live = np.fromiter(self.index_to_id.keys(), dtype=np.int64, count=len(self.index_to_id))
+                if len(live):
+                    index.add_with_ids(self._reconstruct(live), live)
+                self.index = index
+                self._built_index_type = self.index_type
+                self._tombstones = set()
+                self._tombstone_selector = None
+            logger.info(f"Built FAISS {self.index_type} index for {self.collection_name} with {len(live)} vectors")
+        except Exception as e:
+            logger.warning(f"Failed to build FAISS {self.index_type} index: {e}")
+            return
+
+        if self._log is not None:
+            self._compact()
+        else:
+            self._save()
+
+    def _reconstruct(self, index_ids: np.ndarray) -> np.ndarray:
+        if not len(index_ids):
+            return np.empty((0, self.embedding_model_dims), dtype=np.float32)
+        ivf = faiss.try_extract_index_ivf(self.index)
+        if ivf is None:
+            return self.index.reconstruct_batch(index_ids)
+        # IVF lookups by id need a direct map; it is only kept while reconstructing
+        ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+        try:
+            return self.index.reconstruct_batch(index_ids)
+        finally:
+            ivf.set_direct_map_type(faiss.DirectMap.NoMap)
+
     def insert(
         self,
         vectors: List[list],
@@ -208,21 +895,149 @@ class FAISS(VectorStoreBase):
         if len(vectors) != len(ids) or len(vectors) != len(payloads):
             raise ValueError("Vectors, payloads, and IDs must have the same length")
 
+        vectors_np = self._prepare_vectors(vectors)
+
+        with self._lock:
+            self._apply_insert(vectors_np, payloads, ids)
+            logged = self._append_log(
+                ("insert", self._next_seq(), vectors_np, [payload.copy() for payload in payloads], list(ids))
+            )
+        if not logged:
+            self._save()
+
+        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+        self._maybe_build_index()
+
+    def _prepare_vectors(self, vectors) -> np.ndarray:
         vectors_np = np.array(vectors, dtype=np.float32)
+        if len(vectors_np.shape) == 1:
+            vectors_np = vectors_np.reshape(1, -1)
 
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
+        return vectors_np
+
+    def _apply_record(self, record: tuple):
+        """Re-apply a logged mutation during replay."""
+        op = record[0]
+        if op == "insert":
+            self._apply_insert(*record[2:])
+        elif op == "delete":
+            self._apply_delete(record[2])
+        elif op == "update":
+            self._apply_update(*record[2:])
+        else:
+            logger.warning(f"Skipping unknown FAISS log record type {op!r}")
+
+    def _apply_insert(self, vectors_np: np.ndarray, payloads: List[Dict], ids: List[str]):
+        for vector_id in ids:
+            # Re-inserting an existing id replaces its vector instead of leaving a stale duplicate
+            if vector_id in self.id_to_index:
+                self._apply_delete(vector_id)
+
+        self._ensure_writable_index()
+        index_ids = np.arange(self._next_index_id, self._next_index_id + len(ids), dtype=np.int64)
+        self.index.add_with_ids(vectors_np, index_ids)
+        self._next_index_id += len(ids)
+
+        self.docstore.update({vector_id: payload.copy() for vector_id, payload in zip(ids, payloads)})
+        for idx, vector_id, payload in zip(index_ids.tolist(), ids, payloads):
+            self.index_to_id[idx] = vector_id
+            self.id_to_index[vector_id] = idx
+            self._index_payload(idx, payload)
+
+    def _apply_delete(self, vector_id: str) -> bool:
+        idx = self.id_to_index.pop(vector_id, None)
+        if idx is None:
+            return False
+
+        self._unindex_payload(idx, self.docstore.pop(vector_id, None))
+        self.index_to_id.pop(idx, None)
+        self._tombstones.add(idx)
+        self._tombstone_selector = None
+        if len(self._tombstones) >= max(1, self.tombstone_ratio * self.index.ntotal):
+            self._purge_tombstones()
+        return True
 
-        self.index.add(vectors_np)
+    def _purge_tombstones(self):
+        """Physically remove tombstoned vectors from the index. Must be called with _lock held."""
+        if not self._tombstones:
+            return
+        self._ensure_writable_index()
+        try:
+            self.index.remove_ids(faiss.IDSelectorBatch(np.fromiter(self._tombstones, dtype=np.int64)))
+        except RuntimeError:
+            # Index types without remove_ids support (e.g. HNSW) are rebuilt from the live vectors
+            self._rebuild_index()
+        self._tombstones = set()
+        self._tombstone_selector = None
+
+    def _rebuild_index(self):
+        live = np.fromiter(self.index_to_id.keys(), dtype=np.int64, count=len(self.index_to_id))
+        vectors = self._reconstruct(live)
+        index = faiss.clone_index(self.index)
+        index.reset()
+        if len(live):
+            index.add_with_ids(vectors, live)
+        self.index = index
+
+    def _apply_update(self, vector_id: str, vector_np: Optional[np.ndarray], payload: Optional[Dict]):
+        current_payload = self.docstore[vector_id].copy()
 
-        starting_idx = len(self.index_to_id)
-        for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
+        if payload is not None:
+            idx = self.id_to_index[vector_id]
+            self._unindex_payload(idx, self.docstore[vector_id])
             self.docstore[vector_id] = payload.copy()
-            self.index_to_id[starting_idx + i] = vector_id
+            self._index_payload(idx, payload)
+            current_payload = self.docstore[vector_id].copy()
 
-        self._save()
+        if vector_np is not None:
+            self._apply_delete(vector_id)
+            self._apply_insert(vector_np, [current_payload], [vector_id])
+
+    def _index_payload(self, idx: int, payload: Optional[Dict]):
+        for key, values in self._payload_index.items():
+            if payload and key in payload:
+                value = payload[key]
+                values.setdefault(value if isinstance(value, Hashable) else _UNHASHABLE, set()).add(idx)
+
+    def _unindex_payload(self, idx: int, payload: Optional[Dict]):
+        for key, values in self._payload_index.items():
+            if payload and key in payload:
+                value = payload[key] if isinstance(payload[key], Hashable) else _UNHASHABLE
+                bucket = values.get(value)
+                if bucket is not None:
+                    bucket.discard(idx)
+                    if not bucket:
+                        del values[value]
+
+    def _rebuild_payload_index(self):
+        self._payload_index = {key: {} for key in self.indexed_payload_keys}
+        for vector_id, payload in self.docstore.items():
+            idx = self.id_to_index.get(vector_id)
+            if idx is not None:
+                self._index_payload(idx, payload)
 
-        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+    def _filter_candidates(self, filters: Dict) -> Optional[set]:
+        """
+        Internal ids that can match the indexed keys in filters, or None if no filter key is indexed.
+
+        The result is a superset of the matches; callers still apply the full filters to each hit.
+        """
+        candidates = None
+        for key, value in filters.items():
+            values = self._payload_index.get(key)
+            if values is None:
+                continue
+            wanted = value if isinstance(value, list) else [value]
+            matched = set(values.get(_UNHASHABLE, ()))
+            for item in wanted:
+                if isinstance(item, Hashable):
+                    matched |= values.get(item, set())
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return candidates
+        return candidates
 
     def search(
         self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
@@ -250,21 +1065,93 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(query_vectors)
 
-        fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        with self._lock:
+            candidates = self._filter_candidates(filters) if filters else None
+        if candidates is not None and not candidates:
+            return []
+        return self._search_adaptive(query_vectors, limit, filters, candidates)
 
-        results = self._parse_output(scores[0], indices[0], limit)
+    def _search_adaptive(
+        self, query_vectors: np.ndarray, limit: int, filters: Optional[Dict], candidates: Optional[set]
+    ) -> List[OutputData]:
+        """
+        Search restricted to candidates, doubling k until `limit` hits pass the filters or the pool is exhausted.
 
-        if filters:
-            filtered_results = []
-            for result in results:
-                if self._apply_filters(result.payload, filters):
-                    filtered_results.append(result)
-                    if len(filtered_results) >= limit:
-                        break
-            results = filtered_results[:limit]
+        When every filter key is indexed the candidates are exact, so the first round normally suffices;
+        otherwise the unindexed conditions are checked on the fetched hits.
+        """
+        exact = candidates is not None and all(key in self._payload_index for key in filters)
+        # Tombstones can occupy result slots in an unrestricted search, so it is exhausted only at ntotal
+        pool = len(candidates) if candidates is not None else self.index.ntotal
+        params = self._search_parameters(candidates)
+        k = limit if not filters or exact else limit * 2
+
+        while True:
+            k = min(k, pool)
+            if k <= 0:
+                return []
+            scores, indices = self.index.search(query_vectors, k, params=params)
+            results = self._parse_output(scores[0], indices[0])
+            if filters:
+                results = [result for result in results if self._apply_filters(result.payload, filters)]
+            if len(results) >= limit:
+                return results[:limit]
+            if indices[0][-1] == -1:
+                # Fewer than k hits: an ANN index found no more matches at its current breadth (a selective
+                # filter against a small nprobe/efSearch), so widen it; a flat index has none left
+                if not self._widen_search(params, pool):
+                    return results[:limit]
+            elif k >= pool:
+                return results[:limit]
+            else:
+                k *= 2
 
-        return results
+    def _search_parameters(self, candidates: Optional[set] = None):
+        """
+        SearchParameters restricting the search to candidates if given, else skipping tombstoned ids.
+
+        Candidate sets come from the payload index, which only holds live ids.
+        """
+        if candidates is not None:
+            selectors = [faiss.IDSelectorBatch(np.fromiter(candidates, dtype=np.int64))]
+        elif self._tombstones:
+            selectors = self._tombstone_selector
+            if selectors is None:
+                batch = faiss.IDSelectorBatch(np.fromiter(self._tombstones, dtype=np.int64))
+                selectors = self._tombstone_selector = [batch, faiss.IDSelectorNot(batch)]
+        else:
+            selectors = []
+        sel = selectors[-1] if selectors else None
+
+        # Parameter objects must match the index type, and the current nprobe/efSearch has to be carried over
+        ivf = faiss.try_extract_index_ivf(self.index)
+        base = faiss.downcast_index(self.index.index) if isinstance(self.index, faiss.IndexIDMap2) else self.index
+        if ivf is not None:
+            params = faiss.SearchParametersIVF(sel=sel, nprobe=ivf.nprobe)
+        elif isinstance(base, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(sel=sel, efSearch=base.hnsw.efSearch)
+        elif sel is not None:
+            params = faiss.SearchParameters(sel=sel)
+        else:
+            return None
+        # SearchParameters does not own its selector
+        params.referenced_objects = selectors
+        return params
+
+    def _widen_search(self, params, pool: int) -> bool:
+        """Double nprobe/efSearch for a retry. Returns False once the search is already exhaustive."""
+        if isinstance(params, faiss.SearchParametersIVF):
+            nlist = faiss.try_extract_index_ivf(self.index).nlist
+            if params.nprobe >= nlist:
+                return False
+            params.nprobe = min(nlist, params.nprobe * 2)
+            return True
+        if isinstance(params, faiss.SearchParametersHNSW):
+            if params.efSearch >= pool:
+                return False
+            params.efSearch = min(pool, params.efSearch * 2)
+            return True
+        return False
 
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
@@ -302,18 +1189,13 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        index_to_delete = None
-        for idx, vid in self.index_to_id.items():
-            if vid == vector_id:
-                index_to_delete = idx
-                break
-
-        if index_to_delete is not None:
-            self.docstore.pop(vector_id, None)
-            self.index_to_id.pop(index_to_delete, None)
-
+        with self._lock:
+            deleted = self._apply_delete(vector_id)
+            logged = deleted and self._append_log(("delete", self._next_seq(), vector_id))
+        if deleted and not logged:
             self._save()
 
+        if deleted:
             logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
         else:
             logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
@@ -335,19 +1217,17 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
+        if vector_id not in self.id_to_index:
             raise ValueError(f"Vector {vector_id} not found")
 
-        current_payload = self.docstore[vector_id].copy()
-
-        if payload is not None:
-            self.docstore[vector_id] = payload.copy()
-            current_payload = self.docstore[vector_id].copy()
+        vector_np = self._prepare_vectors([vector]) if vector is not None else None
 
-        if vector is not None:
-            self.delete(vector_id)
-            self.insert([vector], [current_payload], [vector_id])
-        else:
+        with self._lock:
+            self._apply_update(vector_id, vector_np, payload)
+            logged = self._append_log(
+                ("update", self._next_seq(), vector_id, vector_np, payload.copy() if payload is not None else None)
+            )
+        if not logged:
             self._save()
 
         logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
@@ -400,23 +1280,34 @@ class FAISS(VectorStoreBase):
         """
         Delete a collection.
         """
-        if self.path:
-            try:
-                index_path = f"{self.path}/{self.collection_name}.faiss"
-                docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-                if os.path.exists(index_path):
-                    os.remove(index_path)
-                if os.path.exists(docstore_path):
-                    os.remove(docstore_path)
-
-                logger.info(f"Deleted collection {self.collection_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete collection: {e}")
-
-        self.index = None
-        self.docstore = {}
-        self.index_to_id = {}
+        with self._compaction_lock, self._lock:
+            if self.path:
+                try:
+                    index_path, docstore_path = self._snapshot_paths()
+
+                    if os.path.exists(index_path):
+                        os.remove(index_path)
+                    if os.path.exists(docstore_path):
+                        os.remove(docstore_path)
+                    self._close_docstore()
+                    for suffix in ("", "-wal", "-shm"):
+                        if os.path.exists(self._docstore_path() + suffix):
+                            os.remove(self._docstore_path() + suffix)
+                    self._remove_log_files()
+
+                    logger.info(f"Deleted collection {self.collection_name}")
+                except Exception as e:
+                    logger.warning(f"Failed to delete collection: {e}")
+
+            self.index = None
+            self._index_generation += 1
+            self._built_index_type = None
+            self.docstore = {}
+            self.index_to_id = {}
+            self.id_to_index = {}
+            self._payload_index = {key: {} for key in self.indexed_payload_keys}
+            self._tombstones = set()
+            self._tombstone_selector = None
 
     def col_info(self) -> Dict:
         """
@@ -430,9 +1321,10 @@ class FAISS(VectorStoreBase):
 
         return {
             "name": self.collection_name,
-            "count": self.index.ntotal,
+            "count": len(self.index_to_id),
             "dimension": self.index.d,
             "distance": self.distance_strategy,
+            "index_type": self._built_index_type or "Flat",
         }
 
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
@@ -449,10 +1341,22 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             return []
 
+        with self._lock:
+            candidates = self._filter_candidates(filters) if filters else None
+            # Internal ids grow with insertion, so sorting keeps the docstore's insertion order
+            matched_ids = [self.index_to_id[idx] for idx in sorted(candidates)] if candidates is not None else None
+
+        if matched_ids is not None:
+            entries = ((vector_id, self.docstore.get(vector_id)) for vector_id in matched_ids)
+        else:
+            entries = self.docstore.items()
+
         results = []
         count = 0
 
-        for vector_id, payload in self.docstore.items():
+        for vector_id, payload in entries:
+            if payload is None:
+                continue
             if filters and not self._apply_filters(payload, filters):
                 continue
 
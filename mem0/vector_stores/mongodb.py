@@ -1,5 +1,6 @@
+import concurrent.futures
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -23,10 +24,20 @@ class OutputData(BaseModel):
 
 
 class MongoDB(VectorStoreBase):
-    VECTOR_TYPE = "knnVector"
+    VECTOR_TYPE = "vector"
     SIMILARITY_METRIC = "cosine"
-
-    def __init__(self, db_name: str, collection_name: str, embedding_model_dims: int, mongo_uri: str):
+    MAX_NUM_CANDIDATES = 10000
+
+    def __init__(
+        self,
+        db_name: str,
+        collection_name: str,
+        embedding_model_dims: int,
+        mongo_uri: str,
+        filter_fields: Optional[List[str]] = None,
+        num_candidates_multiplier: int = 10,
+        search_batch_workers: int = 8,
+    ):
         """
         Initialize the MongoDB vector store with vector search capabilities.
 
@@ -35,15 +46,84 @@ class MongoDB(VectorStoreBase):
             collection_name (str): Collection name
             embedding_model_dims (int): Dimension of the embedding vector
             mongo_uri (str): MongoDB connection URI
+            filter_fields (List[str], optional): Payload fields declared as filter fields in the vector search
+                index, so filters on them run inside $vectorSearch. Defaults to user_id, agent_id and run_id.
+            num_candidates_multiplier (int, optional): numCandidates sent to $vectorSearch as a multiple of
+                the limit. Defaults to 10.
+            search_batch_workers (int, optional): Parallel aggregations used by search_batch. Defaults to 8.
         """
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.db_name = db_name
+        self.filter_fields = list(filter_fields) if filter_fields is not None else ["user_id", "agent_id", "run_id"]
+        self.num_candidates_multiplier = num_candidates_multiplier
+        self.search_batch_workers = search_batch_workers
+        self.index_name = f"{self.collection_name}_vector_index"
+        # Index state is probed once in create_col instead of before every query
+        self._index_ready = False
+        self._prefilter_fields = set()
 
         self.client = MongoClient(mongo_uri)
         self.db = self.client[db_name]
         self.collection = self.create_col()
 
+    def _index_definition(self) -> Dict[str, Any]:
+        fields = [
+            {
+                "type": self.VECTOR_TYPE,
+                "path": "embedding",
+                "numDimensions": self.embedding_model_dims,
+                "similarity": self.SIMILARITY_METRIC,
+            }
+        ]
+        fields += [{"type": "filter", "path": f"payload.{field}"} for field in self.filter_fields]
+        return {"fields": fields}
+
+    def _sync_search_index(self, collection) -> None:
+        """
+        Make sure the vector search index exists and declares the configured filter fields.
+
+        Filters only run inside $vectorSearch on fields the serving index already declares; an index that is
+        still being (re)built keeps serving its previous definition, so newly added fields are post-filtered
+        until the next start.
+        """
+        found_indexes = list(collection.list_search_indexes(name=self.index_name))
+        if not found_indexes:
+            collection.create_search_index(
+                SearchIndexModel(name=self.index_name, definition=self._index_definition(), type="vectorSearch")
+            )
+            logger.info(
+                f"Search index '{self.index_name}' created successfully for collection '{self.collection_name}'."
+            )
+            self._index_ready = True
+            self._prefilter_fields = set(self.filter_fields)
+            return
+
+        index = found_indexes[0]
+        self._index_ready = True
+        if index.get("type") != "vectorSearch":
+            # Legacy knnVector mapping: it cannot declare filter fields, so every filter is post-filtered
+            logger.warning(
+                f"Search index '{self.index_name}' uses the legacy knnVector mapping; filters run after the vector "
+                f"stage. Drop the index (or reset the collection) to recreate it with filter fields."
+            )
+            self._prefilter_fields = set()
+            return
+
+        definition = index.get("latestDefinition") or {}
+        declared = {
+            field["path"][len("payload."):]
+            for field in definition.get("fields", [])
+            if field.get("type") == "filter" and field.get("path", "").startswith("payload.")
+        }
+        self._prefilter_fields = declared if index.get("queryable", True) else set()
+        missing = set(self.filter_fields) - declared
+        if missing:
+            collection.update_search_index(self.index_name, self._index_definition())
+            logger.info(f"Search index '{self.index_name}' updated with filter fields: {', '.join(sorted(missing))}.")
+        else:
+            logger.info(f"Search index '{self.index_name}' already exists in collection '{self.collection_name}'.")
+
     def create_col(self):
         """Create new collection with vector search index."""
         try:
@@ -59,30 +139,7 @@ class MongoDB(VectorStoreBase):
             else:
                 collection = database[self.collection_name]
 
-            self.index_name = f"{self.collection_name}_vector_index"
-            found_indexes = list(collection.list_search_indexes(name=self.index_name))
-            if found_indexes:
-                logger.info(f"Search index '{self.index_name}' already exists in collection '{self.collection_name}'.")
-            else:
-                search_index_model = SearchIndexModel(
-                    name=self.index_name,
-                    definition={
-                        "mappings": {
-                            "dynamic": False,
-                            "fields": {
-                                "embedding": {
-                                    "type": self.VECTOR_TYPE,
-                                    "dimensions": self.embedding_model_dims,
-                                    "similarity": self.SIMILARITY_METRIC,
-                                }
-                            },
-                        }
-                    },
-                )
-                collection.create_search_index(search_index_model)
-                logger.info(
-                    f"Search index '{self.index_name}' created successfully for collection '{self.collection_name}'."
-                )
+            self._sync_search_index(collection)
             return collection
         except PyMongoError as e:
             logger.error(f"Error creating collection and search index: {e}")
@@ -111,6 +168,38 @@ class MongoDB(VectorStoreBase):
         except PyMongoError as e:
             logger.error(f"Error inserting data: {e}")
 
+    @staticmethod
+    def _condition(key: str, value: Any) -> Dict[str, Any]:
+        return {"payload." + key: {"$in": value} if isinstance(value, list) else {"$eq": value}}
+
+    def _split_filters(self, filters: Optional[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Split filters into conditions evaluated inside $vectorSearch and ones matched after it."""
+        prefilter, postfilter = [], []
+        for key, value in (filters or {}).items():
+            target = prefilter if key in self._prefilter_fields else postfilter
+            target.append(self._condition(key, value))
+        return prefilter, postfilter
+
+    def _search_pipeline(self, vectors: List[float], limit: int, filters: Optional[Dict]) -> List[Dict]:
+        prefilter, postfilter = self._split_filters(filters)
+        num_candidates = min(max(limit * self.num_candidates_multiplier, limit), self.MAX_NUM_CANDIDATES)
+        vector_search = {
+            "index": self.index_name,
+            # Conditions matched after the vector stage discard hits, so fetch every candidate for them
+            "limit": num_candidates if postfilter else limit,
+            "numCandidates": num_candidates,
+            "queryVector": vectors,
+            "path": "embedding",
+        }
+        if prefilter:
+            vector_search["filter"] = prefilter[0] if len(prefilter) == 1 else {"$and": prefilter}
+
+        pipeline = [{"$vectorSearch": vector_search}]
+        if postfilter:
+            pipeline += [{"$match": {"$and": postfilter}}, {"$limit": limit}]
+        pipeline += [{"$set": {"score": {"$meta": "vectorSearchScore"}}}, {"$project": {"embedding": 0}}]
+        return pipeline
+
     def search(self, query: str, vectors: List[float], limit=5, filters: Optional[Dict] = None) -> List[OutputData]:
         """
         Search for similar vectors using the vector search index.
@@ -124,40 +213,19 @@ class MongoDB(VectorStoreBase):
         Returns:
             List[OutputData]: Search results.
         """
-
-        found_indexes = list(self.collection.list_search_indexes(name=self.index_name))
-        if not found_indexes:
-            logger.error(f"Index '{self.index_name}' does not exist.")
-            return []
+        if not self._index_ready:
+            # Only probe again while the index is missing; once found the result is cached
+            try:
+                self._index_ready = bool(list(self.collection.list_search_indexes(name=self.index_name)))
+            except PyMongoError as e:
+                logger.error(f"Error checking search index '{self.index_name}': {e}")
+            if not self._index_ready:
+                logger.error(f"Index '{self.index_name}' does not exist.")
+                return []
 
         results = []
         try:
-            collection = self.client[self.db_name][self.collection_name]
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": self.index_name,
-                        "limit": limit,
-                        "numCandidates": limit,
-                        "queryVector": vectors,
-                        "path": "embedding",
-                    }
-                },
-                {"$set": {"score": {"$meta": "vectorSearchScore"}}},
-                {"$project": {"embedding": 0}},
-            ]
-
-            # Add filter stage if filters are provided
-            if filters:
-                filter_conditions = []
-                for key, value in filters.items():
-                    filter_conditions.append({"payload." + key: value})
-
-                if filter_conditions:
-                    # Add a $match stage after vector search to apply filters
-                    pipeline.insert(1, {"$match": {"$and": filter_conditions}})
-
-            results = list(collection.aggregate(pipeline))
+            results = list(self.collection.aggregate(self._search_pipeline(vectors, limit, filters)))
             logger.info(f"Vector search completed. Found {len(results)} documents.")
         except Exception as e:
             logger.error(f"Error during vector search for query {query}: {e}")
@@ -166,6 +234,26 @@ class MongoDB(VectorStoreBase):
         output = [OutputData(id=str(doc["_id"]), score=doc.get("score"), payload=doc.get("payload")) for doc in results]
         return output
 
+    def search_batch(
+        self, vectors: List[List[float]], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search several query vectors with parallel aggregations.
+
+        Args:
+            vectors (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query.
+
+        Returns:
+            List[List[OutputData]]: Search results, one list per query vector.
+        """
+        if len(vectors) <= 1:
+            return [self.search("", vector, limit=limit, filters=filters) for vector in vectors]
+        workers = min(len(vectors), self.search_batch_workers)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda vector: self.search("", vector, limit=limit, filters=filters), vectors))
+
     def delete(self, vector_id: str) -> None:
         """
         Delete a vector by ID.
@@ -283,11 +371,7 @@ class MongoDB(VectorStoreBase):
             query = {}
             if filters:
                 # Apply filters to the payload field
-                filter_conditions = []
-                for key, value in filters.items():
-                    filter_conditions.append({"payload." + key: value})
-                if filter_conditions:
-                    query = {"$and": filter_conditions}
+                query = {"$and": [self._condition(key, value) for key, value in filters.items()]}
 
             cursor = self.collection.find(query).limit(limit)
             results = [OutputData(id=str(doc["_id"]), score=None, payload=doc.get("payload")) for doc in cursor]
@@ -301,7 +385,8 @@ class MongoDB(VectorStoreBase):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
-        self.collection = self.create_col(self.collection_name)
+        self._index_ready = False
+        self.collection = self.create_col()
 
     def __del__(self) -> None:
         """Close the database connection when the object is deleted."""
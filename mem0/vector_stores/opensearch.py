@@ -1,9 +1,10 @@
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 try:
     from opensearchpy import OpenSearch, RequestsHttpConnection
+    from opensearchpy.helpers import parallel_bulk, streaming_bulk
 except ImportError:
     raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
 
@@ -39,6 +40,11 @@ class OpenSearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.num_candidates = config.num_candidates
+        self.ef_search = config.ef_search
+        self.bulk_chunk_size = config.bulk_chunk_size
+        self.bulk_thread_count = config.bulk_thread_count
+        self.refresh = config.refresh
         self.create_col(self.collection_name, self.embedding_model_dims)
 
     def create_index(self) -> None:
@@ -103,45 +109,82 @@ class OpenSearchDB(VectorStoreBase):
                         raise TimeoutError(f"Index {name} creation timed out after {max_retries} seconds")
                     time.sleep(0.5)
 
+    def _bulk(self, actions, refresh=None) -> None:
+        """
+        Stream actions to the _bulk API in chunks of bulk_chunk_size.
+
+        With bulk_thread_count > 1 the chunks are sent from a thread pool. Raises on the first failed item.
+        """
+        refresh = self.refresh if refresh is None else refresh
+        options = {"chunk_size": self.bulk_chunk_size}
+        if refresh is not None:
+            options["refresh"] = refresh
+        if self.bulk_thread_count > 1:
+            results = parallel_bulk(self.client, actions, thread_count=self.bulk_thread_count, **options)
+        else:
+            results = streaming_bulk(self.client, actions, **options)
+        for _ in results:
+            pass
+
     def insert(
-        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+        self,
+        vectors: List[List[float]],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+        refresh: Optional[Union[bool, str]] = None,
     ) -> List[OutputData]:
-        """Insert vectors into the index."""
+        """
+        Insert vectors into the index through the _bulk API.
+
+        Args:
+            vectors (List[List[float]]): Vectors to insert.
+            payloads (List[Dict], optional): Payloads corresponding to vectors.
+            ids (List[str], optional): IDs corresponding to vectors.
+            refresh (bool | str, optional): Refresh policy for this call (True, False or "wait_for").
+                Defaults to the configured refresh.
+        """
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
-        for i, (vec, id_) in enumerate(zip(vectors, ids)):
-            body = {
-                "vector_field": vec,
-                "payload": payloads[i],
-                "id": id_,
+        actions = (
+            {
+                "_index": self.collection_name,
+                "_source": {
+                    "vector_field": vec,
+                    "payload": payloads[i],
+                    "id": id_,
+                },
             }
-            self.client.index(index=self.collection_name, body=body)
+            for i, (vec, id_) in enumerate(zip(vectors, ids))
+        )
+        self._bulk(actions, refresh=refresh)
 
         results = []
 
         return results
 
-    def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
-    ) -> List[OutputData]:
-        """Search for similar vectors using OpenSearch k-NN search with optional filters."""
+    def _search_query(
+        self,
+        vectors: List[float],
+        limit: int,
+        filters: Optional[Dict],
+        num_candidates: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> Dict:
+        # k is the candidate pool gathered per shard before the top `limit` hits are returned
+        knn_params = {"vector": vectors, "k": max(num_candidates or self.num_candidates or limit * 2, limit)}
+        ef_search = ef_search or self.ef_search
+        if ef_search:
+            knn_params["method_parameters"] = {"ef_search": ef_search}
 
         # Base KNN query
-        knn_query = {
-            "knn": {
-                "vector_field": {
-                    "vector": vectors,
-                    "k": limit * 2,
-                }
-            }
-        }
+        knn_query = {"knn": {"vector_field": knn_params}}
 
-        # Start building the full query
-        query_body = {"size": limit * 2, "query": None}
+        # Start building the full query; the vector is never needed in results
+        query_body = {"size": limit, "query": None, "_source": {"excludes": ["vector_field"]}}
 
         # Prepare filter conditions if applicable
         filter_clauses = []
@@ -156,15 +199,68 @@ class OpenSearchDB(VectorStoreBase):
             query_body["query"] = {"bool": {"must": knn_query, "filter": filter_clauses}}
         else:
             query_body["query"] = knn_query
+        return query_body
 
-        # Execute search
-        response = self.client.search(index=self.collection_name, body=query_body)
-
-        hits = response["hits"]["hits"]
-        results = [
+    @staticmethod
+    def _parse_hits(response: Dict) -> List[OutputData]:
+        return [
             OutputData(id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {}))
-            for hit in hits
+            for hit in response["hits"]["hits"]
         ]
+
+    def search(
+        self,
+        query: str,
+        vectors: List[float],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        num_candidates: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[OutputData]:
+        """
+        Search for similar vectors using OpenSearch k-NN search with optional filters.
+
+        num_candidates (the k-NN k) and ef_search override the configured values for this request;
+        larger values trade latency for recall.
+        """
+        query_body = self._search_query(vectors, limit, filters, num_candidates, ef_search)
+        response = self.client.search(index=self.collection_name, body=query_body)
+        return self._parse_hits(response)
+
+    def search_batch(
+        self,
+        vectors: List[List[float]],
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        num_candidates: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[List[OutputData]]:
+        """
+        Run several k-NN searches in one _msearch request.
+
+        Args:
+            vectors (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (Dict, optional): Filters applied to every query.
+            num_candidates (int, optional): k-NN k override for these queries.
+            ef_search (int, optional): HNSW ef_search override for these queries.
+
+        Returns:
+            List[List[OutputData]]: Search results, one list per query vector.
+        """
+        if not vectors:
+            return []
+        searches = []
+        for vector in vectors:
+            searches.append({"index": self.collection_name})
+            searches.append(self._search_query(vector, limit, filters, num_candidates, ef_search))
+        response = self.client.msearch(body=searches)
+
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                raise RuntimeError(f"Batch search failed: {item['error']}")
+            results.append(self._parse_hits(item))
         return results
 
     def delete(self, vector_id: str) -> None:
@@ -181,7 +277,9 @@ class OpenSearchDB(VectorStoreBase):
         opensearch_id = hits[0]["_id"]
 
         # Delete using the actual document ID
-        self.client.delete(index=self.collection_name, id=opensearch_id)
+        # Keyword argument, not params=: the client's query_params escaping turns True into "true"
+        options = {"refresh": self.refresh} if self.refresh is not None else {}
+        self.client.delete(index=self.collection_name, id=opensearch_id, **options)
 
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload using the custom 'id' field."""
@@ -206,7 +304,8 @@ class OpenSearchDB(VectorStoreBase):
 
         if doc:
             try:
-                response = self.client.update(index=self.collection_name, id=opensearch_id, body={"doc": doc})
+                options = {"refresh": self.refresh} if self.refresh is not None else {}
+                response = self.client.update(index=self.collection_name, id=opensearch_id, body={"doc": doc}, **options)
             except Exception:
                 pass
 
@@ -219,7 +318,7 @@ class OpenSearchDB(VectorStoreBase):
                 self.create_col(self.collection_name, self.embedding_model_dims)
                 return None
 
-            search_query = {"query": {"term": {"id": vector_id}}}
+            search_query = {"query": {"term": {"id": vector_id}}, "_source": {"excludes": ["vector_field"]}}
             response = self.client.search(index=self.collection_name, body=search_query)
 
             hits = response["hits"]["hits"]
@@ -247,7 +346,7 @@ class OpenSearchDB(VectorStoreBase):
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
         try:
             """List all memories with optional filters."""
-            query: Dict = {"query": {"match_all": {}}}
+            query: Dict = {"query": {"match_all": {}}, "_source": {"excludes": ["vector_field"]}}
 
             filter_clauses = []
             if filters:
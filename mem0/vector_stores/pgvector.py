@@ -1,20 +1,33 @@
+import asyncio
+import hashlib
+import io
+import itertools
 import json
 import logging
-from contextlib import contextmanager
+import re
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any, List, Optional
 
 from pydantic import BaseModel
 
 # Try to import psycopg (psycopg3) first, then fall back to psycopg2
 try:
+    from psycopg import OperationalError
     from psycopg.types.json import Json
-    from psycopg_pool import ConnectionPool
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
     PSYCOPG_VERSION = 3
     logger = logging.getLogger(__name__)
     logger.info("Using psycopg (psycopg3) with ConnectionPool for PostgreSQL connections")
 except ImportError:
     try:
+        from psycopg2 import OperationalError
         from psycopg2.extras import Json, execute_values
+        from psycopg2.pool import PoolError
         from psycopg2.pool import ThreadedConnectionPool as ConnectionPool
         PSYCOPG_VERSION = 2
         logger = logging.getLogger(__name__)
@@ -29,6 +42,72 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Column names owned by the collection table itself; payload keys can't shadow them.
+_RESERVED_COLUMNS = {"id", "vector", "payload"}
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# hnsw.* settings applied per search with set_config(..., is_local => true)
+_HNSW_SETTINGS = {
+    "ef_search": "hnsw.ef_search",
+    "iterative_scan": "hnsw.iterative_scan",
+    "max_scan_tuples": "hnsw.max_scan_tuples",
+}
+# pgvector's default and maximum hnsw.ef_search; an HNSW scan returns at most ef_search rows
+# without iterative scan
+_DEFAULT_EF_SEARCH = 40
+_MAX_EF_SEARCH = 1000
+_ROW_COUNT_CACHE_SIZE = 10000
+_RECENT_WRITES_SIZE = 10000
+
+# Binary COPY framing: signature, flags and header extension length, then a -1 field count as trailer
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_COPY_CHUNK_ROWS = 1000
+
+# Partitioned collections route rows on this payload key, stored in a plain column of the same name.
+PARTITION_KEY = "user_id"
+# SQLSTATE raised when a new list partition would take rows that already sit in the DEFAULT partition
+_CHECK_VIOLATION = "23514"
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a string as a SQL literal for DDL statements, which can't take bind parameters."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _encode_vector(vector, vector_type: str = "vector") -> bytes:
+    """
+    Encode a vector in pgvector's binary format: uint16 dim, uint16 unused, then big-endian
+    float32 values for ``vector`` or float16 values for ``halfvec``.
+    """
+    dim = len(vector)
+    code = "e" if vector_type == "halfvec" else "f"
+    if hasattr(vector, "astype"):
+        # numpy arrays convert without going through Python floats
+        values = vector.astype(">f2" if code == "e" else ">f4").tobytes()
+    else:
+        values = struct.pack(f">{dim}{code}", *vector)
+    return struct.pack(">HH", dim, 0) + values
+
+
+def _encode_copy_row(fields: list) -> bytes:
+    """Encode one tuple of already-binary field values for COPY ... (FORMAT BINARY); None is NULL."""
+    parts = [struct.pack(">h", len(fields))]
+    for value in fields:
+        if value is None:
+            parts.append(struct.pack(">i", -1))
+        else:
+            parts.append(struct.pack(">i", len(value)))
+            parts.append(value)
+    return b"".join(parts)
+
+
+def _encode_jsonb(payload) -> Optional[bytes]:
+    """Encode a payload as binary jsonb (version byte followed by the JSON text)."""
+    if payload is None:
+        return None
+    return b"\x01" + json.dumps(payload).encode("utf-8")
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -53,6 +132,27 @@ class PGVector(VectorStoreBase):
         sslmode=None,
         connection_string=None,
         connection_pool=None,
+        filter_columns=None,
+        filter_index_mode="generated",
+        payload_gin_index=True,
+        payload_containment_filters=False,
+        partitioning=None,
+        partition_count=16,
+        hnsw_ef_search=None,
+        hnsw_iterative_scan=None,
+        hnsw_max_scan_tuples=None,
+        exact_search_threshold=None,
+        row_count_cache_ttl=300,
+        copy_threshold=256,
+        vector_type="vector",
+        index_quantization=None,
+        rerank_factor=10,
+        replica_connection_strings=None,
+        replica_pools=None,
+        read_your_writes_window=0,
+        replica_retry_interval=30,
+        enable_async=False,
+        async_connection_pool=None,
     ):
         """
         Initialize the PGVector database.
@@ -72,12 +172,67 @@ class PGVector(VectorStoreBase):
             sslmode (str, optional): SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')
             connection_string (str, optional): PostgreSQL connection string (overrides individual connection parameters)
             connection_pool (Any, optional): psycopg2 connection pool object (overrides connection string and individual parameters)
+            filter_columns (List[str], optional): Payload keys used for scoping (defaults to user_id, agent_id, run_id)
+            filter_index_mode (str, optional): 'generated' for stored generated columns, 'expression' for
+                expression indexes on payload, or None to leave scoping keys unindexed
+            payload_gin_index (bool, optional): Create a GIN index on payload for containment filters
+            payload_containment_filters (bool, optional): Match non-scoping filter keys with JSONB containment
+                (``payload @> {key: value}``, served by the GIN index) instead of text equality. Containment is
+                type-sensitive: 5 does not match "5", True does not match "True", and a list value means
+                "array contains". Defaults to False (text equality, unindexed).
+            partitioning (str, optional): 'hash' or 'list' to partition the collection on user_id, None for a flat table
+            partition_count (int): Number of hash partitions created with the collection
+            hnsw_ef_search (int, optional): Default hnsw.ef_search for searches
+            hnsw_iterative_scan (str, optional): Default hnsw.iterative_scan ('off', 'strict_order', 'relaxed_order')
+            hnsw_max_scan_tuples (int, optional): Default hnsw.max_scan_tuples for iterative scans
+            exact_search_threshold (int, optional): Users with at most this many rows are searched exactly
+                instead of through the ANN index
+            row_count_cache_ttl (int): Seconds a cached per-user row count stays valid
+            copy_threshold (int, optional): Batches of at least this many vectors are inserted with binary COPY;
+                None disables the COPY path in insert
+            vector_type (str): Column type for embeddings, 'vector' (float32) or 'halfvec' (float16)
+            index_quantization (str, optional): Quantize the HNSW index: 'halfvec' indexes vector::halfvec,
+                'binary' indexes binary_quantize(vector) and re-ranks candidates with full distances
+            rerank_factor (int): Candidates fetched per requested result for the binary first pass
+            replica_connection_strings (List[str], optional): Connection strings of read replicas
+            replica_pools (List[Any], optional): Connection pools of read replicas (overrides replica_connection_strings).
+                The ``a*`` read methods can't use these sync pools and run the sync reads in a thread instead
+            read_your_writes_window (float): Seconds after a write during which reads for the same user or id
+                stay on the primary
+            replica_retry_interval (float): Seconds a failed replica is skipped before it is tried again
+            enable_async (bool): Serve the ``a*`` coroutine methods from a psycopg AsyncConnectionPool (psycopg3 only)
+            async_connection_pool (Any, optional): psycopg AsyncConnectionPool to use for the coroutine methods
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
         self.connection_pool = None
+        self.filter_columns = list(filter_columns) if filter_columns is not None else ["user_id", "agent_id", "run_id"]
+        self.filter_index_mode = filter_index_mode
+        self.payload_gin_index = payload_gin_index
+        self.payload_containment_filters = payload_containment_filters
+        self.partitioning = partitioning
+        self.partition_count = partition_count
+        self._tenant_partitions = set()
+        self.search_params = {
+            "ef_search": hnsw_ef_search,
+            "iterative_scan": hnsw_iterative_scan,
+            "max_scan_tuples": hnsw_max_scan_tuples,
+        }
+        self.exact_search_threshold = exact_search_threshold
+        self.row_count_cache_ttl = row_count_cache_ttl
+        self._row_count_cache = OrderedDict()
+        self._row_count_hits = 0
+        self._row_count_misses = 0
+        self._row_count_lock = threading.Lock()
+        self.copy_threshold = copy_threshold
+        self.vector_type = vector_type
+        self.index_quantization = index_quantization
+        self.rerank_factor = rerank_factor
+        for key in self.filter_columns:
+            if not _IDENTIFIER_RE.match(key) or key in _RESERVED_COLUMNS:
+                raise ValueError(f"Invalid filter column name: {key}")
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
         if connection_pool is not None:
@@ -88,7 +243,6 @@ class PGVector(VectorStoreBase):
                 # Append sslmode to connection string if provided
                 if 'sslmode=' in connection_string:
                     # Replace existing sslmode
-                    import re
                     connection_string = re.sub(r'sslmode=[^ ]*', f'sslmode={sslmode}', connection_string)
                 else:
                     # Add sslmode to connection string
@@ -99,26 +253,71 @@ class PGVector(VectorStoreBase):
                 connection_string = f"{connection_string}?sslmode={sslmode}"
         
         if self.connection_pool is None:
-            if PSYCOPG_VERSION == 3:
-                # psycopg3 ConnectionPool
-                self.connection_pool = ConnectionPool(conninfo=connection_string, min_size=minconn, max_size=maxconn, open=True)
-            else:
-                # psycopg2 ThreadedConnectionPool
-                self.connection_pool = ConnectionPool(minconn=minconn, maxconn=maxconn, dsn=connection_string)
+            self.connection_pool = self._create_pool(connection_string, minconn, maxconn)
+
+        # The async pool is opened lazily because it binds to the running event loop
+        if (enable_async or async_connection_pool is not None) and PSYCOPG_VERSION != 3:
+            raise ImportError("Async pgvector requires psycopg3. Please install it using 'pip install psycopg[pool]'")
+        if enable_async and async_connection_pool is None and connection_string is None:
+            raise ValueError("enable_async with a custom connection_pool requires async_connection_pool")
+        self.async_enabled = bool(enable_async or async_connection_pool is not None)
+        self._async_pool = async_connection_pool
+        self._async_pool_args = (connection_string, minconn, maxconn)
+        self._async_pool_lock = None
+
+        # Read replicas: search/list/get/col_info go here, everything else stays on the primary
+        if replica_pools:
+            self.replica_pools = list(replica_pools)
+            self._replica_conninfos = None
+        else:
+            self._replica_conninfos = list(replica_connection_strings or [])
+            self.replica_pools = [self._create_pool(conninfo, minconn, maxconn) for conninfo in self._replica_conninfos]
+        # Async replica pools are opened lazily, like the async primary pool
+        self._async_replica_pools = {}
+        self.read_your_writes_window = read_your_writes_window
+        self.replica_retry_interval = replica_retry_interval
+        self._replica_cycle = itertools.cycle(range(len(self.replica_pools)))
+        self._replica_down_until = {}
+        self._recent_writes = OrderedDict()
+        self._recent_writes_lock = threading.Lock()
 
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col()
+        self._partition_strategy = self._detect_partitioning()
+        if self._partition_strategy != self.partitioning:
+            logger.warning(
+                f"Collection {collection_name} exists with partitioning={self._partition_strategy}, "
+                f"ignoring configured partitioning={self.partitioning}"
+            )
+        self._column_keys = self._detect_filter_columns()
+        stored_type = self._detect_vector_type()
+        if stored_type and stored_type != self.vector_type:
+            logger.warning(
+                f"Collection {collection_name} stores {stored_type} vectors, ignoring configured "
+                f"vector_type={self.vector_type}; run migrate_vector_storage() to convert it"
+            )
+            self.vector_type = stored_type
+
+    @staticmethod
+    def _create_pool(conninfo: str, minconn: int, maxconn: int):
+        if PSYCOPG_VERSION == 3:
+            # psycopg3 ConnectionPool
+            return ConnectionPool(conninfo=conninfo, min_size=minconn, max_size=maxconn, open=True)
+        # psycopg2 ThreadedConnectionPool
+        return ConnectionPool(minconn=minconn, maxconn=maxconn, dsn=conninfo)
 
     @contextmanager
-    def _get_cursor(self, commit: bool = False):
+    def _get_cursor(self, commit: bool = False, pool=None):
         """
         Unified context manager to get a cursor from the appropriate pool.
         Auto-commits or rolls back based on exception, and returns the connection to the pool.
+        Uses the primary pool unless ``pool`` is given.
         """
+        pool = pool or self.connection_pool
         if PSYCOPG_VERSION == 3:
             # psycopg3 auto-manages commit/rollback and pool return
-            with self.connection_pool.connection() as conn:
+            with pool.connection() as conn:
                 with conn.cursor() as cur:
                     try:
                         yield cur
@@ -130,7 +329,7 @@ class PGVector(VectorStoreBase):
                         raise
         else:
             # psycopg2 manual getconn/putconn
-            conn = self.connection_pool.getconn()
+            conn = pool.getconn()
             cur = conn.cursor()
             try:
                 yield cur
@@ -142,7 +341,59 @@ class PGVector(VectorStoreBase):
                 raise exc
             finally:
                 cur.close()
-                self.connection_pool.putconn(conn)
+                pool.putconn(conn)
+
+    def _note_write(self, user_ids=(), vector_ids=()) -> None:
+        """Remember recently written users and ids so their reads stay on the primary."""
+        if not self.replica_pools or not self.read_your_writes_window:
+            return
+        now = time.monotonic()
+        keys = [f"user:{u}" for u in user_ids if u] + [f"id:{i}" for i in vector_ids]
+        # Writes come from concurrent request threads; move_to_end/popitem on a shared OrderedDict aren't atomic
+        with self._recent_writes_lock:
+            for key in keys:
+                self._recent_writes[key] = now
+                self._recent_writes.move_to_end(key)
+            while len(self._recent_writes) > _RECENT_WRITES_SIZE:
+                self._recent_writes.popitem(last=False)
+
+    def _recently_written(self, key: str) -> bool:
+        written_at = self._recent_writes.get(key)
+        return written_at is not None and time.monotonic() - written_at < self.read_your_writes_window
+
+    def _pick_replica(self, user_id=None, vector_id=None) -> Optional[int]:
+        """Return the index of a healthy replica for a read, or None to read from the primary."""
+        if not self.replica_pools:
+            return None
+        if user_id is not None and self._recently_written(f"user:{user_id}"):
+            return None
+        if vector_id is not None and self._recently_written(f"id:{vector_id}"):
+            return None
+        now = time.monotonic()
+        for _ in range(len(self.replica_pools)):
+            index = next(self._replica_cycle)
+            if self._replica_down_until.get(index, 0) <= now:
+                return index
+        return None
+
+    def _run_read(self, fn, user_id=None, vector_id=None, commit: bool = False):
+        """
+        Run ``fn(cursor)`` on a read replica, falling back to the primary.
+
+        A replica that fails with a connection-level error is skipped for ``replica_retry_interval``
+        seconds and the read is retried on the primary. Query errors are raised as usual.
+        """
+        index = self._pick_replica(user_id=user_id, vector_id=vector_id)
+        if index is not None:
+            connection_errors = (OperationalError,) if PSYCOPG_VERSION == 3 else (OperationalError, PoolError)
+            try:
+                with self._get_cursor(commit=commit, pool=self.replica_pools[index]) as cur:
+                    return fn(cur)
+            except connection_errors as e:
+                self._replica_down_until[index] = time.monotonic() + self.replica_retry_interval
+                logger.warning(f"Read replica {index} failed, falling back to primary: {e}")
+        with self._get_cursor(commit=commit) as cur:
+            return fn(cur)
 
     def create_col(self) -> None:
         """
@@ -151,60 +402,656 @@ class PGVector(VectorStoreBase):
         """
         with self._get_cursor(commit=True) as cur:
             cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            if self.partitioning:
+                self._create_partitioned_table(cur)
+            else:
+                cur.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.collection_name} (
+                        id UUID PRIMARY KEY,
+                        vector {self._vector_column_type},
+                        payload JSONB
+                    );
+                    """
+                )
+            self._create_vector_index(cur)
+            self._create_filter_indexes(cur)
+
+    @property
+    def _vector_column_type(self) -> str:
+        return f"{self.vector_type}({self.embedding_model_dims})"
+
+    @property
+    def _quantized_index(self) -> Optional[str]:
+        """The effective index quantization; a halfvec index on a halfvec column is just the plain index."""
+        if not self.use_hnsw or (self.use_diskann and self.embedding_model_dims < 2000 and self.vector_type == "vector"):
+            return None
+        if self.index_quantization == "halfvec" and self.vector_type == "halfvec":
+            return None
+        return self.index_quantization
+
+    def _create_vector_index(self, cur) -> None:
+        """Create the ANN index matching the configured storage type and index quantization."""
+        if self.use_diskann and self.embedding_model_dims < 2000 and self.vector_type == "vector":
+            cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
+            if cur.fetchone():
+                # Create DiskANN index if extension is installed for faster search
+                cur.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
+                    ON {self.collection_name}
+                    USING diskann (vector);
+                    """
+                )
+        elif self.use_hnsw:
+            if self._quantized_index == "binary":
+                index_name = f"{self.collection_name}_hnsw_bit_idx"
+                index_expr = f"(binary_quantize(vector)::bit({self.embedding_model_dims})) bit_hamming_ops"
+            elif self._quantized_index == "halfvec":
+                index_name = f"{self.collection_name}_hnsw_halfvec_idx"
+                index_expr = f"(vector::halfvec({self.embedding_model_dims})) halfvec_cosine_ops"
+            else:
+                index_name = f"{self.collection_name}_hnsw_idx"
+                index_expr = f"vector {self.vector_type}_cosine_ops"
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {self.collection_name}
+                USING hnsw ({index_expr})
+                """
+            )
+
+    def _detect_vector_type(self) -> Optional[str]:
+        """Return the type of the stored vector column ('vector' or 'halfvec')."""
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT udt_name FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s AND column_name = 'vector'
+                """,
+                (self.collection_name,),
+            )
+            result = cur.fetchone()
+        return result[0] if result else None
+
+    def migrate_vector_storage(self) -> None:
+        """
+        Convert an existing collection to the configured vector type and index quantization.
+
+        Drops ANN indexes that no longer match, rewrites the vector column when its type changes
+        (the table is locked for the duration) and builds the configured index. For large tables
+        scripts/migrations/003_pgvector_quantized_indexes.sql builds the new index concurrently.
+        """
+        target_type = self.vector_type
+        logger.info(
+            f"Migrating collection {self.collection_name} to {target_type} storage, "
+            f"index_quantization={self.index_quantization}"
+        )
+        with self._get_cursor(commit=True) as cur:
+            for suffix in ("hnsw_idx", "hnsw_halfvec_idx", "hnsw_bit_idx"):
+                cur.execute(f"DROP INDEX IF EXISTS {self.collection_name}_{suffix}")
             cur.execute(
                 f"""
-                CREATE TABLE IF NOT EXISTS {self.collection_name} (
-                    id UUID PRIMARY KEY,
-                    vector vector({self.embedding_model_dims}),
-                    payload JSONB
-                );
+                ALTER TABLE {self.collection_name}
+                ALTER COLUMN vector TYPE {target_type}({self.embedding_model_dims})
+                USING vector::{target_type}({self.embedding_model_dims})
                 """
             )
-            if self.use_diskann and self.embedding_model_dims < 2000:
-                cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
-                if cur.fetchone():
-                    # Create DiskANN index if extension is installed for faster search
+            self._create_vector_index(cur)
+
+    def _create_partitioned_table(self, cur) -> None:
+        """
+        Create the collection as a table partitioned on user_id.
+
+        The partition key has to be part of the primary key and can't be a generated column, so
+        user_id is kept in a plain column filled on insert. Hash layouts get ``partition_count``
+        partitions up front; list layouts start with a DEFAULT partition and add one partition per
+        tenant on first insert. Indexes created on the parent cascade to every partition, so each
+        partition gets its own HNSW graph.
+        """
+        strategy = "HASH" if self.partitioning == "hash" else "LIST"
+        cur.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.collection_name} (
+                id UUID NOT NULL,
+                vector {self._vector_column_type},
+                payload JSONB,
+                {PARTITION_KEY} TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (id, {PARTITION_KEY})
+            ) PARTITION BY {strategy} ({PARTITION_KEY});
+            """
+        )
+        if self.partitioning == "hash":
+            for remainder in range(self.partition_count):
+                cur.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.collection_name}_p{self.partition_count}_{remainder}
+                    PARTITION OF {self.collection_name}
+                    FOR VALUES WITH (MODULUS {self.partition_count}, REMAINDER {remainder})
+                    """
+                )
+        else:
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.collection_name}_default PARTITION OF {self.collection_name} DEFAULT"
+            )
+
+    def _detect_partitioning(self) -> Optional[str]:
+        """Return the partition strategy of the existing collection table ('hash', 'list' or None)."""
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT pt.partstrat FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = 'public' AND c.relname = %s
+                """,
+                (self.collection_name,),
+            )
+            result = cur.fetchone()
+        if not result:
+            return None
+        return {"h": "hash", "l": "list"}.get(result[0])
+
+    def _tenant_partition_name(self, user_id: str) -> str:
+        digest = hashlib.md5(user_id.encode("utf-8")).hexdigest()[:16]
+        return f"{self.collection_name}_u_{digest}"
+
+    def _ensure_tenant_partitions(self, user_ids) -> None:
+        """
+        Create list partitions for tenants seen for the first time.
+
+        Runs in its own transaction ahead of the insert. If the DEFAULT partition already holds rows
+        for a tenant, Postgres refuses the new partition and the rows keep routing to DEFAULT until
+        ``promote_tenant`` moves them; such tenants are not retried. Any other failure is retried on
+        the tenant's next insert.
+        """
+        for user_id in user_ids:
+            if not user_id or user_id in self._tenant_partitions:
+                continue
+            try:
+                with self._get_cursor(commit=True) as cur:
                     cur.execute(
                         f"""
-                        CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
-                        ON {self.collection_name}
-                        USING diskann (vector);
+                        CREATE TABLE IF NOT EXISTS {self._tenant_partition_name(user_id)}
+                        PARTITION OF {self.collection_name} FOR VALUES IN ({_quote_literal(user_id)})
                         """
                     )
-            elif self.use_hnsw:
+            except Exception as e:
+                sqlstate = getattr(e, "sqlstate", None) or getattr(e, "pgcode", None)
+                if sqlstate != _CHECK_VIOLATION:
+                    logger.warning(f"Could not create partition for user {user_id}, will retry: {e}")
+                    continue
+                logger.warning(f"User {user_id} already has rows in DEFAULT, rows stay there until promoted: {e}")
+            self._tenant_partitions.add(user_id)
+
+    def list_partitions(self) -> List[dict]:
+        """
+        List the partitions of a partitioned collection.
+
+        Returns:
+            List[dict]: Partition name, bound expression and estimated row count.
+        """
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                WHERE p.relname = %s
+                ORDER BY c.relname
+                """,
+                (self.collection_name,),
+            )
+            return [{"name": r[0], "bound": r[1], "rows": max(r[2], 0)} for r in cur.fetchall()]
+
+    def split_partition(self, partition_name: str) -> List[str]:
+        """
+        Split a hash partition in two by doubling its modulus.
+
+        A partition with MODULUS m, REMAINDER r is detached and replaced by (2m, r) and (2m, r + m),
+        and its rows are re-routed through the parent. Other partitions are untouched, so hot
+        partitions can be split independently.
+
+        Args:
+            partition_name (str): Name of the hash partition to split.
+
+        Returns:
+            List[str]: Names of the two new partitions.
+        """
+        if self._partition_strategy != "hash":
+            raise ValueError("split_partition requires a hash-partitioned collection")
+        match = re.fullmatch(rf"{re.escape(self.collection_name)}_p(\d+)_(\d+)", partition_name)
+        if not match:
+            raise ValueError(f"Not a hash partition of {self.collection_name}: {partition_name}")
+        modulus, remainder = int(match.group(1)), int(match.group(2))
+        new_modulus = modulus * 2
+        new_partitions = [
+            (f"{self.collection_name}_p{new_modulus}_{r}", r) for r in (remainder, remainder + modulus)
+        ]
+
+        logger.info(f"Splitting partition {partition_name} into {[name for name, _ in new_partitions]}")
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"ALTER TABLE {self.collection_name} DETACH PARTITION {partition_name}")
+            for name, r in new_partitions:
                 cur.execute(
                     f"""
-                    CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
-                    ON {self.collection_name}
-                    USING hnsw (vector vector_cosine_ops)
+                    CREATE TABLE {name} PARTITION OF {self.collection_name}
+                    FOR VALUES WITH (MODULUS {new_modulus}, REMAINDER {r})
+                    """
+                )
+            cur.execute(
+                f"""
+                INSERT INTO {self.collection_name} (id, vector, payload, {PARTITION_KEY})
+                SELECT id, vector, payload, {PARTITION_KEY} FROM {partition_name}
+                """
+            )
+            cur.execute(f"DROP TABLE {partition_name}")
+        return [name for name, _ in new_partitions]
+
+    def promote_tenant(self, user_id: str) -> str:
+        """
+        Move a tenant's rows out of the DEFAULT partition into a dedicated list partition.
+
+        Args:
+            user_id (str): Tenant to promote.
+
+        Returns:
+            str: Name of the tenant partition.
+        """
+        if self._partition_strategy != "list":
+            raise ValueError("promote_tenant requires a list-partitioned collection")
+        partition_name = self._tenant_partition_name(user_id)
+        default_name = f"{self.collection_name}_default"
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(
+                f"""
+                CREATE TEMP TABLE _mem0_moved ON COMMIT DROP AS
+                SELECT id, vector, payload, {PARTITION_KEY} FROM {default_name}
+                WHERE {PARTITION_KEY} = {_quote_literal(user_id)}
+                """
+            )
+            cur.execute(f"DELETE FROM {default_name} WHERE {PARTITION_KEY} = %s", (user_id,))
+            cur.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {partition_name}
+                PARTITION OF {self.collection_name} FOR VALUES IN ({_quote_literal(user_id)})
+                """
+            )
+            cur.execute(
+                f"""
+                INSERT INTO {self.collection_name} (id, vector, payload, {PARTITION_KEY})
+                SELECT id, vector, payload, {PARTITION_KEY} FROM _mem0_moved
+                """
+            )
+        self._tenant_partitions.add(user_id)
+        return partition_name
+
+    def demote_tenant(self, user_id: str) -> None:
+        """
+        Fold a tenant's dedicated list partition back into the DEFAULT partition.
+
+        Args:
+            user_id (str): Tenant to demote.
+        """
+        if self._partition_strategy != "list":
+            raise ValueError("demote_tenant requires a list-partitioned collection")
+        partition_name = self._tenant_partition_name(user_id)
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"ALTER TABLE {self.collection_name} DETACH PARTITION {partition_name}")
+            cur.execute(
+                f"""
+                INSERT INTO {self.collection_name}_default (id, vector, payload, {PARTITION_KEY})
+                SELECT id, vector, payload, {PARTITION_KEY} FROM {partition_name}
+                """
+            )
+            cur.execute(f"DROP TABLE {partition_name}")
+        self._tenant_partitions.discard(user_id)
+
+    def _create_filter_indexes(self, cur) -> None:
+        """
+        Create the indexes backing scoping and payload filters.
+
+        In 'generated' mode each scoping key becomes a stored generated column with a btree index,
+        in 'expression' mode the btree is built on ``payload->>'key'`` directly. Statements are
+        idempotent, so this also serves as the migration for collections created before.
+        """
+        for key in self.filter_columns:
+            if self.filter_index_mode == "generated":
+                cur.execute(
+                    f"""
+                    ALTER TABLE {self.collection_name}
+                    ADD COLUMN IF NOT EXISTS {key} TEXT GENERATED ALWAYS AS (payload->>'{key}') STORED
                     """
                 )
+                cur.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.collection_name}_{key}_idx ON {self.collection_name} ({key})"
+                )
+            elif self.filter_index_mode == "expression":
+                cur.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.collection_name}_{key}_expr_idx
+                    ON {self.collection_name} ((payload->>'{key}'))
+                    """
+                )
+        if self.payload_gin_index:
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_payload_gin_idx
+                ON {self.collection_name}
+                USING gin (payload jsonb_path_ops)
+                """
+            )
+
+    def _detect_filter_columns(self) -> set:
+        """Return the scoping keys backed by a real column (generated, or the partition key)."""
+        with self._get_cursor() as cur:
+            cur.execute(
+                """
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = 'public' AND table_name = %s
+                """,
+                (self.collection_name,),
+            )
+            existing = {row[0] for row in cur.fetchall()}
+        keys = set(self.filter_columns)
+        if self._partition_strategy:
+            keys.add(PARTITION_KEY)
+        return existing & keys
+
+    def migrate_filter_indexes(self) -> None:
+        """
+        Add the filter columns and indexes to an existing collection.
+
+        Adding stored generated columns rewrites the table under an exclusive lock; for large
+        collections prefer scripts/migrations/002_pgvector_filter_indexes.sql, which builds
+        expression indexes concurrently.
+        """
+        logger.info(f"Migrating filter indexes for collection {self.collection_name}")
+        with self._get_cursor(commit=True) as cur:
+            self._create_filter_indexes(cur)
+        self._column_keys = self._detect_filter_columns()
+
+    def _build_filter_clause(self, filters: Optional[dict]) -> tuple:
+        """
+        Translate filters into a WHERE clause that the filter indexes can serve.
+
+        Scoping keys compare against their column (which also lets Postgres prune partitions), or against ``payload->>'key'`` with
+        the key inlined so the planner can match an expression index. Other keys compare
+        ``payload->>key`` with ``str(value)``, or use JSONB containment (served by the GIN index)
+        when ``payload_containment_filters`` is enabled; containment compares JSON types, so it
+        only matches values stored with the same type as the filter value.
+
+        Returns:
+            tuple: (where clause, list of parameters)
+        """
+        filter_conditions = []
+        filter_params = []
+
+        for k, v in (filters or {}).items():
+            if k in self._column_keys:
+                filter_conditions.append(f"{k} = %s")
+                filter_params.append(str(v))
+            elif k in self.filter_columns:
+                filter_conditions.append(f"payload->>'{k}' = %s")
+                filter_params.append(str(v))
+            elif self.payload_containment_filters:
+                filter_conditions.append("payload @> %s::jsonb")
+                filter_params.append(Json({k: v}))
+            else:
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    def _prepare_insert(self, payloads, ids) -> Optional[List[str]]:
+        """
+        Bookkeeping shared by the insert paths: invalidate cached row counts and, for partitioned
+        collections, make sure target partitions exist.
+
+        Returns:
+            List[str]: Partition key per row, or None for flat collections.
+        """
+        self._invalidate_row_counts(str((payload or {}).get("user_id")) for payload in payloads)
+        self._note_write(user_ids={(payload or {}).get("user_id") for payload in payloads}, vector_ids=ids)
+        if not self._partition_strategy:
+            return None
+        partition_keys = [str((payload or {}).get(PARTITION_KEY) or "") for payload in payloads]
+        if self._partition_strategy == "list":
+            self._ensure_tenant_partitions(set(partition_keys))
+        return partition_keys
+
+    def _copy_binary(self, cur, copy_sql: str, rows) -> None:
+        """Stream pre-encoded rows through ``COPY ... FROM STDIN (FORMAT BINARY)``."""
+        if PSYCOPG_VERSION == 3:
+            with cur.copy(copy_sql) as copy:
+                copy.write(_COPY_HEADER)
+                chunk = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) >= _COPY_CHUNK_ROWS:
+                        copy.write(b"".join(chunk))
+                        chunk = []
+                if chunk:
+                    copy.write(b"".join(chunk))
+                copy.write(_COPY_TRAILER)
+        else:
+            buffer = io.BytesIO()
+            buffer.write(_COPY_HEADER)
+            for row in rows:
+                buffer.write(row)
+            buffer.write(_COPY_TRAILER)
+            buffer.seek(0)
+            cur.copy_expert(copy_sql, buffer)
+
+    def _insert_rows(self, vectors, payloads, ids, partition_keys) -> tuple:
+        """
+        Build the rows for a plain INSERT.
+
+        Returns:
+            tuple: (column list, placeholders, row tuples)
+        """
+        json_payloads = [json.dumps(payload) for payload in payloads]
+        if partition_keys is not None:
+            data = [
+                (id, vector, payload, key)
+                for id, vector, payload, key in zip(ids, vectors, json_payloads, partition_keys)
+            ]
+            return f"id, vector, payload, {PARTITION_KEY}", "%s, %s, %s, %s", data
+        data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
+        return "id, vector, payload", "%s, %s, %s", data
+
+    def _copy_insert_rows(self, vectors, payloads, ids, partition_keys) -> tuple:
+        """
+        Build the COPY statement and binary-encoded rows for a bulk insert.
+
+        Returns:
+            tuple: (COPY statement, generator of encoded rows)
+        """
+        if partition_keys is not None:
+            columns = f"id, vector, payload, {PARTITION_KEY}"
+            rows = (
+                _encode_copy_row(
+                    [
+                        uuid.UUID(str(id)).bytes,
+                        _encode_vector(vector, self.vector_type),
+                        _encode_jsonb(payload),
+                        key.encode("utf-8"),
+                    ]
+                )
+                for id, vector, payload, key in zip(ids, vectors, payloads, partition_keys)
+            )
+        else:
+            columns = "id, vector, payload"
+            rows = (
+                _encode_copy_row([uuid.UUID(str(id)).bytes, _encode_vector(vector, self.vector_type), _encode_jsonb(payload)])
+                for id, vector, payload in zip(ids, vectors, payloads)
+            )
+        return f"COPY {self.collection_name} ({columns}) FROM STDIN (FORMAT BINARY)", rows
+
+    def _update_many_statements(self, ids, vectors, payloads) -> tuple:
+        """
+        Build the staging table, COPY and UPDATE statements plus encoded rows for ``update_many``.
+
+        Returns:
+            tuple: (CREATE TEMP TABLE statement, COPY statement, UPDATE statement, encoded rows)
+        """
+        rows = (
+            _encode_copy_row(
+                [
+                    uuid.UUID(str(id)).bytes,
+                    _encode_vector(vector, self.vector_type) if vector is not None else None,
+                    _encode_jsonb(payload),
+                ]
+            )
+            for id, vector, payload in zip(ids, vectors, payloads)
+        )
+        partition_update = (
+            f", {PARTITION_KEY} = COALESCE(u.payload->>'{PARTITION_KEY}', t.{PARTITION_KEY})"
+            if self._partition_strategy
+            else ""
+        )
+        create_sql = f"""
+            CREATE TEMP TABLE _mem0_updates (
+                id UUID,
+                vector {self._vector_column_type},
+                payload JSONB
+            ) ON COMMIT DROP
+        """
+        update_sql = f"""
+            UPDATE {self.collection_name} AS t
+            SET vector = COALESCE(u.vector, t.vector),
+                payload = COALESCE(u.payload, t.payload){partition_update}
+            FROM _mem0_updates AS u
+            WHERE t.id = u.id
+        """
+        copy_sql = "COPY _mem0_updates (id, vector, payload) FROM STDIN (FORMAT BINARY)"
+        return create_sql, copy_sql, update_sql, rows
 
     def insert(self, vectors: list[list[float]], payloads=None, ids=None) -> None:
+        if self.copy_threshold is not None and len(vectors) >= self.copy_threshold:
+            return self.bulk_insert(vectors, payloads=payloads, ids=ids)
+
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        json_payloads = [json.dumps(payload) for payload in payloads]
+        partition_keys = self._prepare_insert(payloads, ids)
+        columns, placeholders, data = self._insert_rows(vectors, payloads, ids, partition_keys)
 
-        data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
         if PSYCOPG_VERSION == 3:
             with self._get_cursor(commit=True) as cur:
                 cur.executemany(
-                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                    f"INSERT INTO {self.collection_name} ({columns}) VALUES ({placeholders})",
                     data,
                 )
         else:
             with self._get_cursor(commit=True) as cur:
                 execute_values(
                     cur,
-                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s",
+                    f"INSERT INTO {self.collection_name} ({columns}) VALUES %s",
                     data,
                 )
 
+    def bulk_insert(self, vectors, payloads=None, ids=None) -> None:
+        """
+        Insert vectors with a binary COPY.
+
+        Vectors, payloads and ids are encoded client-side in the Postgres binary format (numpy
+        arrays are accepted as vectors), which skips the text rendering and per-row statement
+        overhead of ``insert``.
+
+        Args:
+            vectors (List[List[float]]): Vectors to insert.
+            payloads (List[Dict], optional): Payloads for each vector.
+            ids (List[str], optional): IDs for each vector, generated if omitted.
+        """
+        logger.info(f"Bulk inserting {len(vectors)} vectors into collection {self.collection_name}")
+        payloads = payloads or [{} for _ in vectors]
+        ids = ids or [str(uuid.uuid4()) for _ in vectors]
+        partition_keys = self._prepare_insert(payloads, ids)
+        copy_sql, rows = self._copy_insert_rows(vectors, payloads, ids, partition_keys)
+
+        with self._get_cursor(commit=True) as cur:
+            self._copy_binary(cur, copy_sql, rows)
+
+    def update_many(self, ids: List[str], vectors: Optional[list] = None, payloads: Optional[List[dict]] = None) -> None:
+        """
+        Update many vectors and/or payloads in one statement.
+
+        Updates are staged with a binary COPY into a temporary table and applied with a single
+        ``UPDATE ... FROM``. A None entry in ``vectors`` or ``payloads`` keeps the stored value.
+
+        Args:
+            ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): New vectors, aligned with ids.
+            payloads (List[Dict], optional): New payloads, aligned with ids.
+        """
+        if not ids:
+            return
+        vectors = vectors or [None] * len(ids)
+        payloads = payloads or [None] * len(ids)
+        logger.info(f"Updating {len(ids)} vectors in collection {self.collection_name}")
+        create_sql, copy_sql, update_sql, rows = self._update_many_statements(ids, vectors, payloads)
+
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(create_sql)
+            self._copy_binary(cur, copy_sql, rows)
+            cur.execute(update_sql)
+        self._note_write(user_ids={(payload or {}).get("user_id") for payload in payloads}, vector_ids=ids)
+
+    def _tenant_row_count(self, user_id: str) -> int:
+        """Return the number of rows for a user, cached for ``row_count_cache_ttl`` seconds."""
+        count = self._cached_row_count(user_id)
+        if count is not None:
+            return count
+
+        filter_clause, filter_params = self._build_filter_clause({"user_id": user_id})
+
+        def count_rows(cur):
+            cur.execute(f"SELECT COUNT(*) FROM {self.collection_name} {filter_clause}", filter_params)
+            return cur.fetchone()[0]
+
+        count = self._run_read(count_rows, user_id=user_id)
+        self._store_row_count(user_id, count)
+        return count
+
+    # The row count cache and its counters are shared by concurrent request threads, so every access
+    # goes through _row_count_lock.
+    def _cached_row_count(self, user_id: str) -> Optional[int]:
+        with self._row_count_lock:
+            cached = self._row_count_cache.get(user_id)
+            if cached is not None and time.monotonic() - cached[1] < self.row_count_cache_ttl:
+                self._row_count_hits += 1
+                return cached[0]
+            self._row_count_misses += 1
+            return None
+
+    def _store_row_count(self, user_id: str, count: int) -> None:
+        with self._row_count_lock:
+            self._row_count_cache[user_id] = (count, time.monotonic())
+            self._row_count_cache.move_to_end(user_id)
+            while len(self._row_count_cache) > _ROW_COUNT_CACHE_SIZE:
+                self._row_count_cache.popitem(last=False)
+
+    def _invalidate_row_counts(self, user_ids) -> None:
+        with self._row_count_lock:
+            for user_id in user_ids:
+                self._row_count_cache.pop(user_id, None)
+
+    def _use_exact_search(self, filters: Optional[dict], search_params: dict) -> bool:
+        """Decide whether to bypass the ANN index for this search."""
+        if search_params.get("exact") is not None:
+            return bool(search_params["exact"])
+        if not self.exact_search_threshold or not filters or "user_id" not in filters:
+            return False
+        return self._tenant_row_count(str(filters["user_id"])) <= self.exact_search_threshold
+
     def search(
         self,
         query: str,
         vectors: list[float],
         limit: Optional[int] = 5,
         filters: Optional[dict] = None,
+        search_params: Optional[dict] = None,
     ) -> List[OutputData]:
         """
         Search for similar vectors.
@@ -214,44 +1061,139 @@ class PGVector(VectorStoreBase):
             vectors (List[float]): Query vector.
             limit (int, optional): Number of results to return. Defaults to 5.
             filters (Dict, optional): Filters to apply to the search. Defaults to None.
+            search_params (Dict, optional): Per-request overrides of the collection search settings:
+                ef_search, iterative_scan, max_scan_tuples, and exact (True/False to force or skip
+                the exact-search path). Defaults to None.
 
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
+        params = {**self.search_params, **(search_params or {})}
+        sql, sql_params, settings = self._search_statement(
+            vectors, limit, filters, params, exact=self._use_exact_search(filters, params)
+        )
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+        def run_search(cur):
+            for name, value in settings:
+                cur.execute("SELECT set_config(%s, %s, true)", (name, value))
+            cur.execute(sql, sql_params)
+            return cur.fetchall()
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        # Commit when settings are applied so the transaction, and the SET LOCAL scope, ends here
+        results = self._run_read(run_search, user_id=(filters or {}).get("user_id"), commit=bool(settings))
 
-        with self._get_cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT id, vector <=> %s::vector AS distance, payload
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+
+    def _search_statement(self, vectors, limit, filters, params, exact: bool) -> tuple:
+        """
+        Build the search query for the collection's index layout.
+
+        Returns:
+            tuple: (SQL, parameters, list of (setting, value) pairs to apply with set_config)
+        """
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        query_vector = f"%s::{self._vector_column_type}"
+        settings = [(_HNSW_SETTINGS[k], str(v)) for k, v in params.items() if k in _HNSW_SETTINGS and v is not None]
+
+        if exact:
+            # The materialized CTE keeps the planner from driving the scan with the ANN index:
+            # candidates come from the filter indexes and are ranked exactly.
+            sql = f"""
+                WITH candidates AS MATERIALIZED (
+                    SELECT id, vector, payload FROM {self.collection_name} {filter_clause}
+                )
+                SELECT id, vector <=> {query_vector} AS distance, payload
+                FROM candidates
+                ORDER BY distance
+                LIMIT %s
+            """
+            sql_params = (*filter_params, vectors, limit)
+        elif self._quantized_index:
+            # First pass orders by the quantized expression so the quantized index serves it, then
+            # the candidates are re-ranked by full-precision distance in the same statement.
+            dims = self.embedding_model_dims
+            if self._quantized_index == "binary":
+                first_pass = f"binary_quantize(vector)::bit({dims}) <~> binary_quantize({query_vector})"
+                candidates = limit * self.rerank_factor
+            else:
+                first_pass = f"vector::halfvec({dims}) <=> %s::halfvec({dims})"
+                candidates = limit
+            sql = f"""
+                SELECT id, vector <=> {query_vector} AS distance, payload
+                FROM (
+                    SELECT id, vector, payload
+                    FROM {self.collection_name}
+                    {filter_clause}
+                    ORDER BY {first_pass}
+                    LIMIT %s
+                ) AS candidates
+                ORDER BY distance
+                LIMIT %s
+            """
+            sql_params = (vectors, *filter_params, vectors, candidates, limit)
+            # The HNSW scan stops after ef_search rows, which would silently cut the re-rank pool short
+            ef_search = params.get("ef_search") or _DEFAULT_EF_SEARCH
+            if candidates > ef_search:
+                settings = [(name, value) for name, value in settings if name != "hnsw.ef_search"]
+                settings.append(("hnsw.ef_search", str(min(candidates, _MAX_EF_SEARCH))))
+        else:
+            sql = f"""
+                SELECT id, vector <=> {query_vector} AS distance, payload
                 FROM {self.collection_name}
                 {filter_clause}
                 ORDER BY distance
                 LIMIT %s
-                """,
-                (vectors, *filter_params, limit),
-            )
+            """
+            sql_params = (vectors, *filter_params, limit)
 
-            results = cur.fetchall()
-        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+        return sql, sql_params, settings
+
+    def _delete_statement(self, vector_id: Optional[str] = None, user_id: Optional[str] = None) -> tuple:
+        """
+        Build a DELETE scoped by id and/or user_id.
+
+        user_id goes through ``_build_filter_clause``, so on partitioned collections it compares the
+        partition column and Postgres only touches the tenant's partition.
+        """
+        filter_clause, filter_params = self._build_filter_clause({"user_id": user_id} if user_id is not None else None)
+        if vector_id is not None:
+            filter_clause = f"{filter_clause} AND id = %s" if filter_clause else "WHERE id = %s"
+            filter_params.append(vector_id)
+        sql = f"DELETE FROM {self.collection_name} {filter_clause} RETURNING id, payload->>'user_id'"
+        return sql, filter_params
 
-    def delete(self, vector_id: str) -> None:
+    def delete(self, vector_id: str, user_id: Optional[str] = None) -> None:
         """
         Delete a vector by ID.
 
         Args:
             vector_id (str): ID of the vector to delete.
+            user_id (str, optional): Owner of the vector. Lets partitioned collections prune to the
+                tenant's partition instead of probing every partition's primary key index.
+        """
+        sql, params = self._delete_statement(vector_id=vector_id, user_id=user_id)
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(sql, params)
+            deleted = cur.fetchall()
+        self._note_write(user_ids=[row[1] for row in deleted], vector_ids=[vector_id])
+
+    def delete_all(self, user_id: str) -> int:
         """
+        Delete every vector owned by a user.
+
+        Args:
+            user_id (str): Owner whose vectors are deleted.
+
+        Returns:
+            int: Number of deleted vectors.
+        """
+        sql, params = self._delete_statement(user_id=user_id)
         with self._get_cursor(commit=True) as cur:
-            cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+            cur.execute(sql, params)
+            deleted = cur.fetchall()
+        self._invalidate_row_counts([user_id])
+        self._note_write(user_ids=[user_id], vector_ids=[str(row[0]) for row in deleted])
+        return len(deleted)
 
     def update(
         self,
@@ -273,7 +1215,13 @@ class PGVector(VectorStoreBase):
                     f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
                     (vector, vector_id),
                 )
-            if payload:
+            if payload and self._partition_strategy:
+                # Moving the row to another partition is handled by Postgres when user_id changes
+                cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s, {PARTITION_KEY} = %s WHERE id = %s",
+                    (Json(payload), str(payload.get(PARTITION_KEY) or ""), vector_id),
+                )
+            elif payload:
                 # Handle JSON serialization based on psycopg version
                 if PSYCOPG_VERSION == 3:
                     # psycopg3 uses psycopg.types.json.Json
@@ -287,7 +1235,7 @@ class PGVector(VectorStoreBase):
                         f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
                         (Json(payload), vector_id),
                     )
-
+        self._note_write(user_ids=[(payload or {}).get("user_id")], vector_ids=[vector_id])
 
     def get(self, vector_id: str) -> OutputData:
         """
@@ -299,15 +1247,17 @@ class PGVector(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        with self._get_cursor() as cur:
+        def fetch(cur):
             cur.execute(
                 f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
                 (vector_id,),
             )
-            result = cur.fetchone()
-            if not result:
-                return None
-            return OutputData(id=str(result[0]), score=None, payload=result[2])
+            return cur.fetchone()
+
+        result = self._run_read(fetch, vector_id=vector_id)
+        if not result:
+            return None
+        return OutputData(id=str(result[0]), score=None, payload=result[2])
 
     def list_cols(self) -> List[str]:
         """
@@ -325,6 +1275,43 @@ class PGVector(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
 
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Utilization of the primary connection pool.
+
+        Returns:
+            dict: size (open connections), in_use, available, waiting (psycopg3 only) and max.
+        """
+        pool = self.connection_pool
+        if PSYCOPG_VERSION == 3:
+            stats = pool.get_stats()
+            size, available = stats.get("pool_size", 0), stats.get("pool_available", 0)
+            return {
+                "size": size,
+                "in_use": size - available,
+                "available": available,
+                "waiting": stats.get("requests_waiting", 0),
+                "max": pool.max_size,
+            }
+        in_use, available = len(pool._used), len(pool._pool)
+        return {"size": in_use + available, "in_use": in_use, "available": available, "waiting": 0, "max": pool.maxconn}
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Hit/miss counters of the in-process caches.
+
+        Returns:
+            dict: Per cache name, hits, misses and current size.
+        """
+        with self._row_count_lock:
+            return {
+                "row_count": {
+                    "hits": self._row_count_hits,
+                    "misses": self._row_count_misses,
+                    "size": len(self._row_count_cache),
+                }
+            }
+
     def col_info(self) -> dict[str, Any]:
         """
         Get information about a collection.
@@ -332,19 +1319,13 @@ class PGVector(VectorStoreBase):
         Returns:
             Dict[str, Any]: Collection information.
         """
-        with self._get_cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT
-                    table_name,
-                    (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
-                    (SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))) as total_size
-                FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = %s
-            """,
-                (self.collection_name,),
-            )
-            result = cur.fetchone()
+        query, query_params = self._col_info_statement()
+
+        def fetch(cur):
+            cur.execute(query, query_params)
+            return cur.fetchone()
+
+        result = self._run_read(fetch)
         return {"name": result[0], "count": result[1], "size": result[2]}
 
     def list(
@@ -362,43 +1343,325 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
+        query, query_params = self._list_statement(filters, limit)
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+        def fetch(cur):
+            cur.execute(query, query_params)
+            return cur.fetchall()
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        results = self._run_read(fetch, user_id=(filters or {}).get("user_id"))
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def _col_info_statement(self) -> tuple:
+        if self._partition_strategy:
+            # The parent of a partitioned table has no storage of its own
+            size_expr = f"SELECT pg_size_pretty(SUM(pg_total_relation_size(relid))) FROM pg_partition_tree('{self.collection_name}')"
+        else:
+            size_expr = f"SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))"
+        query = f"""
+            SELECT
+                table_name,
+                (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
+                ({size_expr}) as total_size
+            FROM information_schema.tables
+            WHERE table_schema = 'public' AND table_name = %s
+        """
+        return query, (self.collection_name,)
+
+    def _list_statement(self, filters: Optional[dict], limit: Optional[int]) -> tuple:
+        filter_clause, filter_params = self._build_filter_clause(filters)
         query = f"""
             SELECT id, vector, payload
             FROM {self.collection_name}
             {filter_clause}
             LIMIT %s
         """
-
-        with self._get_cursor() as cur:
-            cur.execute(query, (*filter_params, limit))
-            results = cur.fetchall()
-        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
+        return query, (*filter_params, limit)
 
     def __del__(self) -> None:
         """
-        Close the database connection pool when the object is deleted.
+        Close the database connection pools when the object is deleted.
         """
-        try:
-            # Close pool appropriately
-            if PSYCOPG_VERSION == 3:
-                self.connection_pool.close()
-            else:
-                self.connection_pool.closeall()
-        except Exception:
-            pass
+        for pool in [self.connection_pool, *getattr(self, "replica_pools", [])]:
+            try:
+                # Close pool appropriately
+                if PSYCOPG_VERSION == 3:
+                    pool.close()
+                else:
+                    pool.closeall()
+            except Exception:
+                pass
 
     def reset(self) -> None:
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col()
+        self._partition_strategy = self._detect_partitioning()
+        self._tenant_partitions = set()
+        self._column_keys = self._detect_filter_columns()
+
+    # Async API: coroutine counterparts of the data methods, served by an AsyncConnectionPool.
+    # Schema handling stays synchronous and happens once in __init__.
+
+    async def _get_async_pool(self, replica: Optional[int] = None):
+        """Return the async pool of the primary, or of replica ``replica``, opening it on first use."""
+        pool = self._async_pool if replica is None else self._async_replica_pools.get(replica)
+        if pool is not None:
+            return pool
+        if self._async_pool_lock is None:
+            self._async_pool_lock = asyncio.Lock()
+        async with self._async_pool_lock:
+            _, minconn, maxconn = self._async_pool_args
+            if replica is None:
+                if self._async_pool is None:
+                    pool = AsyncConnectionPool(
+                        conninfo=self._async_pool_args[0], min_size=minconn, max_size=maxconn, open=False
+                    )
+                    await pool.open()
+                    self._async_pool = pool
+                return self._async_pool
+            if replica not in self._async_replica_pools:
+                pool = AsyncConnectionPool(
+                    conninfo=self._replica_conninfos[replica], min_size=minconn, max_size=maxconn, open=False
+                )
+                await pool.open()
+                self._async_replica_pools[replica] = pool
+            return self._async_replica_pools[replica]
+
+    @asynccontextmanager
+    async def _get_async_cursor(self, commit: bool = False, replica: Optional[int] = None):
+        """Async counterpart of ``_get_cursor`` on the async pool (of the primary, or of a replica)."""
+        if not self.async_enabled:
+            raise RuntimeError("Async pgvector is disabled; set enable_async=True")
+        pool = await self._get_async_pool(replica)
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    yield cur
+                    if commit:
+                        await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    logger.error("Error in async cursor context", exc_info=True)
+                    raise
+
+    @property
+    def _async_replicas_unavailable(self) -> bool:
+        """Replicas were passed as sync pools, so async reads have no async replica pool to use."""
+        return bool(self.replica_pools) and self._replica_conninfos is None
+
+    async def _arun_read(self, fn, user_id=None, vector_id=None, commit: bool = False):
+        """
+        Async counterpart of ``_run_read``: await ``fn(cursor)`` on a replica, falling back to the primary.
+
+        Shares the read-your-writes window and the down-replica bookkeeping with the sync reads.
+        """
+        index = self._pick_replica(user_id=user_id, vector_id=vector_id)
+        if index is not None:
+            try:
+                async with self._get_async_cursor(commit=commit, replica=index) as cur:
+                    return await fn(cur)
+            except OperationalError as e:
+                self._replica_down_until[index] = time.monotonic() + self.replica_retry_interval
+                logger.warning(f"Read replica {index} failed, falling back to primary: {e}")
+        async with self._get_async_cursor(commit=commit) as cur:
+            return await fn(cur)
+
+    async def _aprepare_insert(self, payloads, ids) -> Optional[List[str]]:
+        if self._partition_strategy == "list":
+            # Creating a tenant partition is rare DDL; keep it off the event loop
+            return await asyncio.to_thread(self._prepare_insert, payloads, ids)
+        return self._prepare_insert(payloads, ids)
+
+    async def _acopy_binary(self, cur, copy_sql: str, rows) -> None:
+        async with cur.copy(copy_sql) as copy:
+            await copy.write(_COPY_HEADER)
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= _COPY_CHUNK_ROWS:
+                    await copy.write(b"".join(chunk))
+                    chunk = []
+            if chunk:
+                await copy.write(b"".join(chunk))
+            await copy.write(_COPY_TRAILER)
+
+    async def ainsert(self, vectors: List[List[float]], payloads=None, ids=None) -> None:
+        """Async version of ``insert``."""
+        if self.copy_threshold is not None and len(vectors) >= self.copy_threshold:
+            return await self.abulk_insert(vectors, payloads=payloads, ids=ids)
+
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        partition_keys = await self._aprepare_insert(payloads, ids)
+        columns, placeholders, data = self._insert_rows(vectors, payloads, ids, partition_keys)
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.executemany(
+                f"INSERT INTO {self.collection_name} ({columns}) VALUES ({placeholders})",
+                data,
+            )
+
+    async def abulk_insert(self, vectors, payloads=None, ids=None) -> None:
+        """Async version of ``bulk_insert``."""
+        logger.info(f"Bulk inserting {len(vectors)} vectors into collection {self.collection_name}")
+        payloads = payloads or [{} for _ in vectors]
+        ids = ids or [str(uuid.uuid4()) for _ in vectors]
+        partition_keys = await self._aprepare_insert(payloads, ids)
+        copy_sql, rows = self._copy_insert_rows(vectors, payloads, ids, partition_keys)
+        async with self._get_async_cursor(commit=True) as cur:
+            await self._acopy_binary(cur, copy_sql, rows)
+
+    async def aupdate_many(
+        self, ids: List[str], vectors: Optional[list] = None, payloads: Optional[List[dict]] = None
+    ) -> None:
+        """Async version of ``update_many``."""
+        if not ids:
+            return
+        vectors = vectors or [None] * len(ids)
+        payloads = payloads or [None] * len(ids)
+        logger.info(f"Updating {len(ids)} vectors in collection {self.collection_name}")
+        create_sql, copy_sql, update_sql, rows = self._update_many_statements(ids, vectors, payloads)
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.execute(create_sql)
+            await self._acopy_binary(cur, copy_sql, rows)
+            await cur.execute(update_sql)
+        self._note_write(user_ids={(payload or {}).get("user_id") for payload in payloads}, vector_ids=ids)
+
+    async def _atenant_row_count(self, user_id: str) -> int:
+        count = self._cached_row_count(user_id)
+        if count is not None:
+            return count
+        filter_clause, filter_params = self._build_filter_clause({"user_id": user_id})
+
+        async def count_rows(cur):
+            await cur.execute(f"SELECT COUNT(*) FROM {self.collection_name} {filter_clause}", filter_params)
+            return (await cur.fetchone())[0]
+
+        count = await self._arun_read(count_rows, user_id=user_id)
+        self._store_row_count(user_id, count)
+        return count
+
+    async def asearch(
+        self,
+        query: str,
+        vectors: List[float],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+        search_params: Optional[dict] = None,
+    ) -> List[OutputData]:
+        """Async version of ``search``."""
+        if self._async_replicas_unavailable:
+            return await asyncio.to_thread(self.search, query, vectors, limit, filters, search_params)
+        params = {**self.search_params, **(search_params or {})}
+        if params.get("exact") is not None:
+            exact = bool(params["exact"])
+        elif self.exact_search_threshold and filters and "user_id" in filters:
+            exact = await self._atenant_row_count(str(filters["user_id"])) <= self.exact_search_threshold
+        else:
+            exact = False
+        sql, sql_params, settings = self._search_statement(vectors, limit, filters, params, exact=exact)
+
+        async def run_search(cur):
+            for name, value in settings:
+                await cur.execute("SELECT set_config(%s, %s, true)", (name, value))
+            await cur.execute(sql, sql_params)
+            return await cur.fetchall()
+
+        # Commit when settings are applied so the transaction, and the SET LOCAL scope, ends here
+        results = await self._arun_read(run_search, user_id=(filters or {}).get("user_id"), commit=bool(settings))
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+
+    async def adelete(self, vector_id: str, user_id: Optional[str] = None) -> None:
+        """Async version of ``delete``."""
+        sql, params = self._delete_statement(vector_id=vector_id, user_id=user_id)
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.execute(sql, params)
+            deleted = await cur.fetchall()
+        self._note_write(user_ids=[row[1] for row in deleted], vector_ids=[vector_id])
+
+    async def adelete_all(self, user_id: str) -> int:
+        """Async version of ``delete_all``."""
+        sql, params = self._delete_statement(user_id=user_id)
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.execute(sql, params)
+            deleted = await cur.fetchall()
+        self._invalidate_row_counts([user_id])
+        self._note_write(user_ids=[user_id], vector_ids=[str(row[0]) for row in deleted])
+        return len(deleted)
+
+    async def aupdate(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[dict] = None,
+    ) -> None:
+        """Async version of ``update``."""
+        async with self._get_async_cursor(commit=True) as cur:
+            if vector:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
+                    (vector, vector_id),
+                )
+            if payload and self._partition_strategy:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s, {PARTITION_KEY} = %s WHERE id = %s",
+                    (Json(payload), str(payload.get(PARTITION_KEY) or ""), vector_id),
+                )
+            elif payload:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
+                    (Json(payload), vector_id),
+                )
+        self._note_write(user_ids=[(payload or {}).get("user_id")], vector_ids=[vector_id])
+
+    async def aget(self, vector_id: str) -> OutputData:
+        """Async version of ``get``."""
+        if self._async_replicas_unavailable:
+            return await asyncio.to_thread(self.get, vector_id)
+
+        async def fetch(cur):
+            await cur.execute(
+                f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
+                (vector_id,),
+            )
+            return await cur.fetchone()
+
+        result = await self._arun_read(fetch, vector_id=vector_id)
+        if not result:
+            return None
+        return OutputData(id=str(result[0]), score=None, payload=result[2])
+
+    async def alist(self, filters: Optional[dict] = None, limit: Optional[int] = 100) -> List[OutputData]:
+        """Async version of ``list``."""
+        if self._async_replicas_unavailable:
+            return await asyncio.to_thread(self.list, filters, limit)
+        query, query_params = self._list_statement(filters, limit)
+
+        async def fetch(cur):
+            await cur.execute(query, query_params)
+            return await cur.fetchall()
+
+        results = await self._arun_read(fetch, user_id=(filters or {}).get("user_id"))
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
+
+    async def acol_info(self) -> dict[str, Any]:
+        """Async version of ``col_info``."""
+        if self._async_replicas_unavailable:
+            return await asyncio.to_thread(self.col_info)
+        query, query_params = self._col_info_statement()
+
+        async def fetch(cur):
+            await cur.execute(query, query_params)
+            return await cur.fetchone()
+
+        result = await self._arun_read(fetch)
+        return {"name": result[0], "count": result[1], "size": result[2]}
+
+    async def aclose(self) -> None:
+        """Close the async connection pools."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+        replica_pools, self._async_replica_pools = self._async_replica_pools, {}
+        for pool in replica_pools.values():
+            await pool.close()
@@ -1,15 +1,21 @@
+import asyncio
+import concurrent.futures
 import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.local.qdrant_local import QdrantLocal
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    KeywordIndexParams,
+    KeywordIndexType,
     MatchValue,
     PointIdsList,
     PointStruct,
+    QueryRequest,
     Range,
     VectorParams,
 )
@@ -31,6 +37,13 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        wait: bool = True,
+        upsert_batch_size: int = 256,
+        upsert_parallel: int = 1,
+        enable_async: bool = False,
+        async_client: AsyncQdrantClient = None,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,10 +58,20 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            prefer_grpc (bool, optional): Use the gRPC transport for a remote server. Defaults to False.
+            grpc_port (int, optional): gRPC port of the remote server. Defaults to 6334.
+            wait (bool, optional): Wait until writes are applied before returning. With False, writes are only
+                acknowledged and may not be visible to an immediately following search. Defaults to True.
+            upsert_batch_size (int, optional): Points per upsert request. Defaults to 256.
+            upsert_parallel (int, optional): Upsert requests in flight at once (remote servers only). Defaults to 1.
+            enable_async (bool, optional): Serve the ``a*`` coroutine methods from an AsyncQdrantClient
+                (remote servers only). Defaults to False.
+            async_client (AsyncQdrantClient, optional): Existing async client; implies enable_async. Defaults to None.
         """
         if client:
             self.client = client
             self.is_local = False
+            params = None
         else:
             params = {}
             if api_key:
@@ -58,7 +81,7 @@ class Qdrant(VectorStoreBase):
             if host and port:
                 params["host"] = host
                 params["port"] = port
-            
+
             if not params:
                 params["path"] = path
                 self.is_local = True
@@ -67,12 +90,30 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                if prefer_grpc:
+                    params["prefer_grpc"] = True
+                    params["grpc_port"] = grpc_port
 
             self.client = QdrantClient(**params)
 
+        self.async_client = async_client
+        if enable_async and async_client is None:
+            if self.is_local:
+                # A local storage folder can only be opened by one client instance
+                raise ValueError("enable_async is not supported for local Qdrant (path); use a server or async_client")
+            if params is None:
+                raise ValueError("enable_async with a custom client requires async_client")
+            self.async_client = AsyncQdrantClient(**params)
+        self.async_enabled = self.async_client is not None
+
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.wait = wait
+        self.upsert_batch_size = upsert_batch_size
+        # The embedded local client (also behind a passed-in client) is not safe to call from several threads
+        embedded = self.is_local or isinstance(getattr(self.client, "_client", None), QdrantLocal)
+        self.upsert_parallel = 1 if embedded else max(1, upsert_parallel)
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -104,39 +145,63 @@ class Qdrant(VectorStoreBase):
         if self.is_local:
             logger.debug("Skipping payload index creation for local Qdrant (not supported)")
             return
-            
+
         common_fields = ["user_id", "agent_id", "run_id", "actor_id"]
-        
+
         for field in common_fields:
+            # user_id is the tenant key: Qdrant co-locates each tenant's points and skips the global HNSW
+            # graph for tenant-filtered searches
+            field_schema = (
+                KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True) if field == "user_id" else "keyword"
+            )
             try:
                 self.client.create_payload_index(
                     collection_name=self.collection_name,
                     field_name=field,
-                    field_schema="keyword"
+                    field_schema=field_schema,
                 )
                 logger.info(f"Created index for {field} in collection {self.collection_name}")
             except Exception as e:
                 logger.debug(f"Index for {field} might already exist: {e}")
 
+    def _points(self, vectors: list, payloads: list = None, ids: list = None) -> list:
+        return [
+            PointStruct(
+                id=idx if ids is None else ids[idx],
+                vector=vector,
+                payload=payloads[idx] if payloads else {},
+            )
+            for idx, vector in enumerate(vectors)
+        ]
+
+    def _chunks(self, points: list) -> list:
+        size = max(1, self.upsert_batch_size)
+        return [points[start:start + size] for start in range(0, len(points), size)]
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
         Insert vectors into a collection.
 
+        Points are upserted in chunks of upsert_batch_size, up to upsert_parallel chunks at a time.
+
         Args:
             vectors (list): List of vectors to insert.
             payloads (list, optional): List of payloads corresponding to vectors. Defaults to None.
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        points = [
-            PointStruct(
-                id=idx if ids is None else ids[idx],
-                vector=vector,
-                payload=payloads[idx] if payloads else {},
-            )
-            for idx, vector in enumerate(vectors)
-        ]
-        self.client.upsert(collection_name=self.collection_name, points=points)
+        chunks = self._chunks(self._points(vectors, payloads, ids))
+
+        def upsert(chunk):
+            self.client.upsert(collection_name=self.collection_name, points=chunk, wait=self.wait)
+
+        if len(chunks) <= 1 or self.upsert_parallel == 1:
+            for chunk in chunks:
+                upsert(chunk)
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.upsert_parallel, len(chunks))) as executor:
+            # list() re-raises the first failed chunk
+            list(executor.map(upsert, chunks))
 
     def _create_filter(self, filters: dict) -> Filter:
         """
@@ -181,6 +246,29 @@ class Qdrant(VectorStoreBase):
         )
         return hits.points
 
+    def _batch_requests(self, vectors: list, limit: int, filters: dict) -> list:
+        query_filter = self._create_filter(filters) if filters else None
+        return [QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True) for vector in vectors]
+
+    def search_batch(self, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search several query vectors in one query_batch_points request.
+
+        Args:
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results, one list of points per query vector.
+        """
+        if not len(vectors):
+            return []
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name, requests=self._batch_requests(vectors, limit, filters)
+        )
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -193,6 +281,7 @@ class Qdrant(VectorStoreBase):
             points_selector=PointIdsList(
                 points=[vector_id],
             ),
+            wait=self.wait,
         )
 
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
@@ -205,7 +294,7 @@ class Qdrant(VectorStoreBase):
             payload (dict, optional): Updated payload. Defaults to None.
         """
         point = PointStruct(id=vector_id, vector=vector, payload=payload)
-        self.client.upsert(collection_name=self.collection_name, points=[point])
+        self.client.upsert(collection_name=self.collection_name, points=[point], wait=self.wait)
 
     def get(self, vector_id: int) -> dict:
         """
@@ -268,3 +357,82 @@ class Qdrant(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col(self.embedding_model_dims, self.on_disk)
+
+    def _require_async(self) -> AsyncQdrantClient:
+        if not self.async_enabled:
+            raise RuntimeError("Async Qdrant is disabled; set enable_async=True")
+        return self.async_client
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """Async counterpart of ``insert``; chunks are upserted concurrently up to upsert_parallel."""
+        client = self._require_async()
+        chunks = self._chunks(self._points(vectors, payloads, ids))
+        semaphore = asyncio.Semaphore(self.upsert_parallel)
+
+        async def upsert(chunk):
+            async with semaphore:
+                await client.upsert(collection_name=self.collection_name, points=chunk, wait=self.wait)
+
+        await asyncio.gather(*(upsert(chunk) for chunk in chunks))
+
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Async counterpart of ``search``."""
+        client = self._require_async()
+        query_filter = self._create_filter(filters) if filters else None
+        hits = await client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            limit=limit,
+        )
+        return hits.points
+
+    async def asearch_batch(self, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Async counterpart of ``search_batch``."""
+        client = self._require_async()
+        if not len(vectors):
+            return []
+        responses = await client.query_batch_points(
+            collection_name=self.collection_name, requests=self._batch_requests(vectors, limit, filters)
+        )
+        return [response.points for response in responses]
+
+    async def adelete(self, vector_id: int):
+        """Async counterpart of ``delete``."""
+        await self._require_async().delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=[vector_id]),
+            wait=self.wait,
+        )
+
+    async def aupdate(self, vector_id: int, vector: list = None, payload: dict = None):
+        """Async counterpart of ``update``."""
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await self._require_async().upsert(collection_name=self.collection_name, points=[point], wait=self.wait)
+
+    async def aget(self, vector_id: int) -> dict:
+        """Async counterpart of ``get``."""
+        result = await self._require_async().retrieve(
+            collection_name=self.collection_name, ids=[vector_id], with_payload=True
+        )
+        return result[0] if result else None
+
+    async def alist(self, filters: dict = None, limit: int = 100) -> list:
+        """Async counterpart of ``list``."""
+        query_filter = self._create_filter(filters) if filters else None
+        return await self._require_async().scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+
+    async def acol_info(self) -> dict:
+        """Async counterpart of ``col_info``."""
+        return await self._require_async().get_collection(collection_name=self.collection_name)
+
+    async def aclose(self):
+        """Close the async client."""
+        if self.async_client is not None:
+            await self.async_client.close()
@@ -10,6 +10,7 @@ from redis.commands.search.query import Query
 from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.query.filter import Tag
+from redisvl.utils.token_escaper import TokenEscaper
 
 from mem0.memory.utils import extract_json
 from mem0.vector_stores.base import VectorStoreBase
@@ -37,6 +38,10 @@ DEFAULT_FIELDS = [
 
 excluded_keys = {"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"}
 
+RETURN_FIELDS = ["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at", "updated_at"]
+
+_escaper = TokenEscaper()
+
 
 class MemoryResult:
     def __init__(self, id: str, payload: dict, score: float = None):
@@ -51,6 +56,7 @@ class RedisDB(VectorStoreBase):
         redis_url: str,
         collection_name: str,
         embedding_model_dims: int,
+        batch_size: int = 500,
     ):
         """
         Initialize the Redis vector store.
@@ -59,8 +65,12 @@ class RedisDB(VectorStoreBase):
             redis_url (str): Redis URL.
             collection_name (str): Collection name.
             embedding_model_dims (int): Embedding model dimensions.
+            batch_size (int, optional): Commands per pipeline for bulk writes and batched searches. Defaults to 500.
         """
         self.embedding_model_dims = embedding_model_dims
+        self.batch_size = batch_size
+        # Filter expression templates keyed by filter shape (keys and which values are lists)
+        self._filter_templates = {}
         index_schema = {
             "name": collection_name,
             "prefix": f"mem0:{collection_name}",
@@ -119,88 +129,132 @@ class RedisDB(VectorStoreBase):
 
         return index
 
-    def insert(self, vectors: list, payloads: list = None, ids: list = None):
-        data = []
-        for vector, payload, id in zip(vectors, payloads, ids):
-            # Start with required fields
-            entry = {
-                "memory_id": id,
-                "hash": payload["hash"],
-                "memory": payload["data"],
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Conditionally add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    entry[field] = payload[field]
-
-            # Add metadata excluding specific keys
-            entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
-            data.append(entry)
-        self.index.load(data, id_field="memory_id")
-
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
+    def _filter_expression(self, filters: dict = None) -> str:
+        """
+        Build the tag filter expression for filters, reusing a template compiled once per filter shape.
 
-        v = VectorQuery(
-            vector=np.array(vectors, dtype=np.float32).tobytes(),
-            vector_field_name="embedding",
-            return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
-            filter_expression=filter,
-            num_results=limit,
+        Returns "*" when there is nothing to filter on.
+        """
+        items = [(key, value) for key, value in (filters or {}).items() if value is not None]
+        if not items:
+            return "*"
+        shape = tuple((key, isinstance(value, list)) for key, value in items)
+        template = self._filter_templates.get(shape)
+        if template is None:
+            conditions = [Tag(key) == f"MEM0PH{i}" for i, (key, _) in enumerate(shape)]
+            template = str(reduce(lambda x, y: x & y, conditions)).replace("%", "%%")
+            for i in range(len(shape)):
+                template = template.replace(f"MEM0PH{i}", "%s", 1)
+            self._filter_templates[shape] = template
+        values = tuple(
+            "|".join(_escaper.escape(str(v)) for v in value) if isinstance(value, list) else _escaper.escape(str(value))
+            for _, value in items
         )
+        return template % values
 
-        results = self.index.query(v)
-
-        return [
-            MemoryResult(
-                id=result["memory_id"],
-                score=result["vector_distance"],
-                payload={
-                    "hash": result["hash"],
-                    "data": result["memory"],
-                    "created_at": datetime.fromtimestamp(
-                        int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds"),
-                    **(
-                        {
-                            "updated_at": datetime.fromtimestamp(
-                                int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                            ).isoformat(timespec="microseconds")
-                        }
-                        if "updated_at" in result
-                        else {}
-                    ),
-                    **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result},
-                    **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-                },
-            )
-            for result in results
-        ]
-
-    def delete(self, vector_id):
-        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
-
-    def update(self, vector_id=None, vector=None, payload=None):
-        data = {
+    def _entry(self, vector_id, vector, payload, updated: bool = False) -> dict:
+        entry = {
             "memory_id": vector_id,
             "hash": payload["hash"],
             "memory": payload["data"],
             "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
             "embedding": np.array(vector, dtype=np.float32).tobytes(),
         }
+        if updated:
+            entry["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
 
+        # Conditionally add optional fields
         for field in ["agent_id", "run_id", "user_id"]:
             if field in payload:
-                data[field] = payload[field]
+                entry[field] = payload[field]
+
+        # Add metadata excluding specific keys
+        entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return entry
+
+    def _key(self, vector_id) -> str:
+        return f"{self.schema['index']['prefix']}:{vector_id}"
 
-        data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+    def insert(self, vectors: list, payloads: list = None, ids: list = None):
+        data = [self._entry(id, vector, payload) for vector, payload, id in zip(vectors, payloads, ids)]
+        # SearchIndex.load writes through a pipeline, one round trip per batch_size entries
+        self.index.load(data, id_field="memory_id", batch_size=self.batch_size)
+
+    def _to_result(self, result) -> MemoryResult:
+        return MemoryResult(
+            id=result["memory_id"],
+            score=result["vector_distance"],
+            payload={
+                "hash": result["hash"],
+                "data": result["memory"],
+                "created_at": datetime.fromtimestamp(
+                    int(result["created_at"]), tz=pytz.timezone("US/Pacific")
+                ).isoformat(timespec="microseconds"),
+                **(
+                    {
+                        "updated_at": datetime.fromtimestamp(
+                            int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
+                        ).isoformat(timespec="microseconds")
+                    }
+                    if result.get("updated_at")
+                    else {}
+                ),
+                **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result},
+                **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
+            },
+        )
+
+    def _vector_query(self, vectors: list, limit: int, filter_expression: str) -> VectorQuery:
+        return VectorQuery(
+            vector=np.array(vectors, dtype=np.float32).tobytes(),
+            vector_field_name="embedding",
+            return_fields=RETURN_FIELDS,
+            filter_expression=filter_expression,
+            num_results=limit,
+        )
+
+    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+        v = self._vector_query(vectors, limit, self._filter_expression(filters))
+        results = self.index.query(v)
+        return [self._to_result(result) for result in results]
+
+    def search_batch(self, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Run several KNN queries in one pipeline.
+
+        Args:
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results, one list per query vector.
+        """
+        filter_expression = self._filter_expression(filters)
+        queries = [self._vector_query(vector, limit, filter_expression) for vector in vectors]
+        if not queries:
+            return []
+        batches = self.index.batch_query(queries, batch_size=self.batch_size)
+        return [[self._to_result(result) for result in results] for results in batches]
+
+    def delete(self, vector_id):
+        self.index.drop_keys(self._key(vector_id))
+
+    def delete_many(self, vector_ids: list):
+        """Delete several vectors, batch_size keys per pipeline."""
+        if vector_ids:
+            self.index.drop_keys([self._key(vector_id) for vector_id in vector_ids], batch_size=self.batch_size)
+
+    def update(self, vector_id=None, vector=None, payload=None):
+        data = self._entry(vector_id, vector, payload, updated=True)
+        self.index.load(data=[data], keys=[self._key(vector_id)], id_field="memory_id")
+
+    def update_many(self, ids: list, vectors: list, payloads: list):
+        """Update several vectors and payloads, batch_size entries per pipeline."""
+        data = [self._entry(id, vector, payload, updated=True) for id, vector, payload in zip(ids, vectors, payloads)]
+        self.index.load(
+            data=data, keys=[self._key(id) for id in ids], id_field="memory_id", batch_size=self.batch_size
+        )
 
     def get(self, vector_id):
         result = self.index.fetch(vector_id)
@@ -256,11 +310,9 @@ class RedisDB(VectorStoreBase):
         """
         List all recent created memories from the vector store.
         """
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
-        query = Query(str(filter)).sort_by("created_at", asc=False)
+        query = Query(self._filter_expression(filters)).sort_by("created_at", asc=False)
         if limit is not None:
-            query = Query(str(filter)).sort_by("created_at", asc=False).paging(0, limit)
+            query = query.paging(0, limit)
 
         results = self.index.search(query)
         return [
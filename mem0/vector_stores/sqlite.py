@@ -0,0 +1,546 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload keys stored in their own indexed columns; filters on them are resolved by SQLite indexes
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_META_TABLE = "mem0_collections"
+_IN_CHUNK = 500
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # distance for euclidean, similarity otherwise
+    payload: Optional[Dict]  # metadata
+
+
+class SQLiteVectorStore(VectorStoreBase):
+    """
+    Embedded vector store keeping payloads and vector blobs in a single SQLite file.
+
+    Every collection is a table with user_id / agent_id / run_id columns indexed for scoping. Searches load
+    the matching rows into a NumPy matrix once and score them with a single matrix product; the matrices of
+    recently searched scopes are kept in an LRU that is invalidated by writes, including writes from other
+    connections to the same file.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        distance_strategy: str = "cosine",
+        vector_dtype: str = "float32",
+        cache_size: int = 64,
+        synchronous: str = "NORMAL",
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Initialize the SQLite vector store.
+
+        Args:
+            collection_name (str): Name of the collection (table).
+            path (str, optional): Directory holding the database file, or the path of a .db file.
+                Defaults to /tmp/sqlite.
+            embedding_model_dims (int, optional): Dimension of the embedding vector. Defaults to 1536.
+            distance_strategy (str, optional): 'cosine', 'inner_product' or 'euclidean'. Defaults to "cosine".
+            vector_dtype (str, optional): 'float32' or 'int8' (per-vector scaled) blob storage. Defaults to "float32".
+            cache_size (int, optional): Number of scope matrices kept in memory. Defaults to 64.
+            synchronous (str, optional): SQLite synchronous pragma; 'NORMAL' is crash-safe in WAL mode,
+                'FULL' also survives power loss. Defaults to "NORMAL".
+            busy_timeout (float, optional): Seconds to wait for a lock held by another connection. Defaults to 5.0.
+        """
+        if not _IDENTIFIER.match(collection_name):
+            raise ValueError(f"Invalid collection name '{collection_name}': use letters, digits and underscores")
+
+        self.collection_name = collection_name
+        self.embedding_model_dims = embedding_model_dims
+        self.distance_strategy = distance_strategy.lower()
+        self.vector_dtype = vector_dtype
+        self.cache_size = cache_size
+
+        path = path or "/tmp/sqlite"
+        if path.endswith(".db"):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.db_path = path
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.db_path = os.path.join(path, "vectors.db")
+
+        self._lock = threading.RLock()
+        self._cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._generation = 0
+        self._conn = sqlite3.connect(self.db_path, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid synchronous pragma '{synchronous}'")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {_META_TABLE} "
+            "(name TEXT PRIMARY KEY, dims INTEGER NOT NULL, distance TEXT NOT NULL, dtype TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._data_version = self._read_data_version()
+
+        self.create_col(collection_name, embedding_model_dims, self.distance_strategy)
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def create_col(self, name: str, vector_size: int = None, distance: str = None):
+        """
+        Create a new collection.
+
+        Args:
+            name (str): Name of the collection.
+            vector_size (int, optional): Dimension of the vectors. Defaults to embedding_model_dims.
+            distance (str, optional): Distance strategy. Defaults to distance_strategy.
+        """
+        if not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid collection name '{name}': use letters, digits and underscores")
+        vector_size = vector_size or self.embedding_model_dims
+        distance = (distance or self.distance_strategy).lower()
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT dims, distance, dtype FROM {_META_TABLE} WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and row != (vector_size, distance, self.vector_dtype):
+                raise ValueError(
+                    f"Collection '{name}' exists with dims={row[0]}, distance={row[1]}, dtype={row[2]}; "
+                    f"requested dims={vector_size}, distance={distance}, dtype={self.vector_dtype}"
+                )
+            with self._conn:
+                self._conn.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS "{name}" (
+                        id TEXT PRIMARY KEY,
+                        user_id TEXT,
+                        agent_id TEXT,
+                        run_id TEXT,
+                        vector BLOB NOT NULL,
+                        scale REAL NOT NULL DEFAULT 1.0,
+                        payload TEXT NOT NULL
+                    )
+                    """
+                )
+                for column in SCOPE_COLUMNS:
+                    self._conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}_{column}_idx" ON "{name}" ({column})')
+                self._conn.execute(
+                    f"INSERT OR IGNORE INTO {_META_TABLE} (name, dims, distance, dtype) VALUES (?, ?, ?, ?)",
+                    (name, vector_size, distance, self.vector_dtype),
+                )
+            self._invalidate_all()
+
+    def _encode(self, vectors: np.ndarray) -> Tuple[List[bytes], np.ndarray]:
+        """Encode a float32 matrix as blobs, with per-vector scales for int8 storage."""
+        if self.distance_strategy == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        if self.vector_dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            quantized = np.rint(vectors / scales[:, None]).astype(np.int8)
+            return [row.tobytes() for row in quantized], scales.astype(np.float64)
+        vectors = vectors.astype(np.float32, copy=False)
+        return [row.tobytes() for row in vectors], np.ones(len(vectors))
+
+    def _decode(self, blobs: List[bytes], scales: List[float]) -> np.ndarray:
+        """Decode blobs into one float32 matrix."""
+        dtype = np.int8 if self.vector_dtype == "int8" else np.float32
+        matrix = np.frombuffer(b"".join(blobs), dtype=dtype).reshape(len(blobs), self.embedding_model_dims)
+        if self.vector_dtype == "int8":
+            return matrix.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+        return matrix
+
+    def _as_matrix(self, vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.shape[1] != self.embedding_model_dims:
+            raise ValueError(f"Expected vectors of dimension {self.embedding_model_dims}, got {matrix.shape[1]}")
+        return matrix
+
+    @staticmethod
+    def _scope_values(payload: Dict) -> Tuple:
+        return tuple(None if payload.get(column) is None else str(payload[column]) for column in SCOPE_COLUMNS)
+
+    def _where(self, filters: Optional[Dict]) -> Tuple[str, List]:
+        """
+        Build a WHERE clause for equality / list filters.
+
+        Scope keys use the indexed columns; other keys are matched with json_extract on the payload.
+        """
+        if not filters:
+            return "", []
+        clauses, params = [], []
+        for key, value in filters.items():
+            if key in SCOPE_COLUMNS:
+                column = key
+            else:
+                column = "json_extract(payload, ?)"
+                params.append(f'$."{key}"')
+            if isinstance(value, list):
+                if not value:
+                    return " WHERE 0", []
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return " WHERE " + " AND ".join(clauses), params
+
+    @staticmethod
+    def _cache_key(filters: Optional[Dict]) -> str:
+        return json.dumps(filters or {}, sort_keys=True, default=str)
+
+    def _invalidate_all(self):
+        self._cache.clear()
+        self._generation += 1
+
+    def _invalidate(self, scopes: List[Tuple]):
+        """Drop cached matrices whose scope filters could match rows with the given scope values."""
+        self._generation += 1
+        for key, (filters, _, _) in list(self._cache.items()):
+            conditions = [
+                (i, filters[column] if isinstance(filters[column], list) else [filters[column]])
+                for i, column in enumerate(SCOPE_COLUMNS)
+                if column in filters
+            ]
+            if any(all(scope[i] in values for i, values in conditions) for scope in scopes):
+                del self._cache[key]
+
+    def _check_external_writes(self):
+        """Clear the cache if another connection committed to the database since the last check."""
+        data_version = self._read_data_version()
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._invalidate_all()
+
+    def _candidates(self, filters: Optional[Dict]) -> Tuple[List[str], np.ndarray]:
+        """Return the ids and vector matrix of the rows matching filters, through the scope LRU."""
+        key = self._cache_key(filters)
+        with self._lock:
+            self._check_external_writes()
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return entry[1], entry[2]
+            self._cache_misses += 1
+            generation = self._generation
+            where, params = self._where(filters)
+            rows = self._conn.execute(
+                f'SELECT id, vector, scale FROM "{self.collection_name}"{where}', params
+            ).fetchall()
+
+        ids = [row[0] for row in rows]
+        if rows:
+            matrix = self._decode([row[1] for row in rows], [row[2] for row in rows])
+        else:
+            matrix = np.empty((0, self.embedding_model_dims), dtype=np.float32)
+
+        with self._lock:
+            # A write between loading and caching may have changed the rows; serve them but don't cache
+            if self._generation == generation and self.cache_size > 0:
+                self._cache[key] = (dict(filters or {}), ids, matrix)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return ids, matrix
+
+    def _score(self, queries: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Score every query against every row; higher is better except for euclidean."""
+        if self.distance_strategy == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms == 0, 1, norms)
+        scores = queries @ matrix.T
+        if self.distance_strategy == "euclidean":
+            squared = (
+                np.einsum("ij,ij->i", queries, queries)[:, None]
+                - 2 * scores
+                + np.einsum("ij,ij->i", matrix, matrix)[None, :]
+            )
+            return np.sqrt(np.maximum(squared, 0))
+        return scores
+
+    def _top_k(self, scores: np.ndarray, limit: int) -> np.ndarray:
+        ascending = self.distance_strategy == "euclidean"
+        keyed = scores if ascending else -scores
+        if limit < len(keyed):
+            top = np.argpartition(keyed, limit - 1)[:limit]
+        else:
+            top = np.arange(len(keyed))
+        return top[np.argsort(keyed[top], kind="stable")]
+
+    def _fetch_payloads(self, ids: List[str]) -> Dict[str, Dict]:
+        payloads = {}
+        with self._lock:
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start:start + _IN_CHUNK]
+                rows = self._conn.execute(
+                    f'SELECT id, payload FROM "{self.collection_name}" WHERE id IN ({", ".join("?" * len(chunk))})',
+                    chunk,
+                ).fetchall()
+                payloads.update((row[0], json.loads(row[1])) for row in rows)
+        return payloads
+
+    def _search_matrix(self, queries: np.ndarray, limit: int, filters: Optional[Dict]) -> List[List[OutputData]]:
+        ids, matrix = self._candidates(filters)
+        if not ids or limit <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = self._score(queries, matrix)
+        hits = [[(ids[i], float(row[i])) for i in self._top_k(row, limit)] for row in scores]
+        payloads = self._fetch_payloads(list({hit_id for query_hits in hits for hit_id, _ in query_hits}))
+        return [
+            [
+                OutputData(id=hit_id, score=score, payload=payloads[hit_id])
+                for hit_id, score in query_hits
+                if hit_id in payloads
+            ]
+            for query_hits in hits
+        ]
+
+    def insert(self, vectors: List[list], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None):
+        """
+        Insert vectors into a collection in a single transaction.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (Optional[List[Dict]], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if not len(vectors):
+            return
+
+        matrix = self._as_matrix(vectors)
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(matrix))]
+        if payloads is None:
+            payloads = [{} for _ in range(len(matrix))]
+        if len(ids) != len(matrix) or len(payloads) != len(matrix):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+
+        blobs, scales = self._encode(matrix)
+        rows = [
+            (vector_id, *self._scope_values(payload), blob, float(scale), json.dumps(payload, default=str))
+            for vector_id, payload, blob, scale in zip(ids, payloads, blobs, scales)
+        ]
+        with self._lock:
+            old_scopes = self._existing_scopes(ids)
+            with self._conn:
+                self._conn.executemany(
+                    f'INSERT OR REPLACE INTO "{self.collection_name}" '
+                    "(id, user_id, agent_id, run_id, vector, scale, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            self._invalidate(old_scopes + [row[1:4] for row in rows])
+
+        logger.info(f"Inserted {len(rows)} vectors into collection {self.collection_name}")
+
+    def _existing_scopes(self, ids: List[str]) -> List[Tuple]:
+        scopes = []
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            scopes.extend(
+                self._conn.execute(
+                    f'SELECT user_id, agent_id, run_id FROM "{self.collection_name}" '
+                    f'WHERE id IN ({", ".join("?" * len(chunk))})',
+                    chunk,
+                ).fetchall()
+            )
+        return scopes
+
+    def search(
+        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Search for similar vectors.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[list]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results.
+        """
+        return self._search_matrix(self._as_matrix(vectors)[:1], limit, filters)[0]
+
+    def search_batch(
+        self, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search several query vectors against the same filtered candidates with one matrix product.
+
+        Args:
+            vectors (List[list]): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Search results, one list per query vector.
+        """
+        return self._search_matrix(self._as_matrix(vectors), limit, filters)
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self._lock:
+            old_scopes = self._existing_scopes([vector_id])
+            with self._conn:
+                self._conn.execute(f'DELETE FROM "{self.collection_name}" WHERE id = ?', (vector_id,))
+            self._invalidate(old_scopes)
+        logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
+
+    def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None):
+        """
+        Update a vector and its payload in a single transaction.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (Optional[List[float]], optional): Updated vector. Defaults to None.
+            payload (Optional[Dict], optional): Updated payload. Defaults to None.
+        """
+        assignments, params, scopes = [], [], []
+        if vector is not None:
+            blobs, scales = self._encode(self._as_matrix(vector))
+            assignments += ["vector = ?", "scale = ?"]
+            params += [blobs[0], float(scales[0])]
+        if payload is not None:
+            scopes.append(self._scope_values(payload))
+            assignments += [f"{column} = ?" for column in SCOPE_COLUMNS] + ["payload = ?"]
+            params += [*scopes[0], json.dumps(payload, default=str)]
+        if not assignments:
+            return
+
+        with self._lock:
+            old_scopes = self._existing_scopes([vector_id])
+            if not old_scopes:
+                raise ValueError(f"Vector {vector_id} not found")
+            with self._conn:
+                self._conn.execute(
+                    f'UPDATE "{self.collection_name}" SET {", ".join(assignments)} WHERE id = ?',
+                    params + [vector_id],
+                )
+            self._invalidate(old_scopes + scopes)
+        logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
+
+    def get(self, vector_id: str) -> OutputData:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector, or None if it does not exist.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT payload FROM "{self.collection_name}" WHERE id = ?', (vector_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return OutputData(id=vector_id, score=None, payload=json.loads(row[0]))
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        with self._lock:
+            rows = self._conn.execute(f"SELECT name FROM {_META_TABLE} ORDER BY name").fetchall()
+        return [row[0] for row in rows]
+
+    def delete_col(self):
+        """Delete a collection."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(f'DROP TABLE IF EXISTS "{self.collection_name}"')
+                self._conn.execute(f"DELETE FROM {_META_TABLE} WHERE name = ?", (self.collection_name,))
+            self._invalidate_all()
+        logger.info(f"Deleted collection {self.collection_name}")
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Hit/miss counters of the scope matrix cache.
+
+        Returns:
+            Dict: Per cache name, hits, misses and current size.
+        """
+        with self._lock:
+            return {"scope": {"hits": self._cache_hits, "misses": self._cache_misses, "size": len(self._cache)}}
+
+    def col_info(self) -> Dict:
+        """
+        Get information about a collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        with self._lock:
+            count = self._conn.execute(f'SELECT COUNT(*) FROM "{self.collection_name}"').fetchone()[0]
+        return {
+            "name": self.collection_name,
+            "count": count,
+            "dimension": self.embedding_model_dims,
+            "distance": self.distance_strategy,
+            "vector_dtype": self.vector_dtype,
+            "path": self.db_path,
+        }
+
+    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+        """
+        List vectors in a collection.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[OutputData]: List of vectors.
+        """
+        where, params = self._where(filters)
+        query = f'SELECT id, payload FROM "{self.collection_name}"{where} ORDER BY rowid'
+        if limit:
+            query += " LIMIT ?"
+            params = params + [limit]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [[OutputData(id=row[0], score=None, payload=json.loads(row[1])) for row in rows]]
+
+    def reset(self):
+        """Reset by delete the collection and recreate it."""
+        logger.warning(f"Resetting collection {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name, self.embedding_model_dims, self.distance_strategy)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
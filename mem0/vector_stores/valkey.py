@@ -7,6 +7,7 @@ import numpy as np
 import pytz
 import valkey
 from pydantic import BaseModel
+from valkey.commands.search.result import Result
 from valkey.exceptions import ResponseError
 
 from mem0.memory.utils import extract_json
@@ -52,6 +53,8 @@ class ValkeyDB(VectorStoreBase):
         hnsw_m: int = 16,
         hnsw_ef_construction: int = 200,
         hnsw_ef_runtime: int = 10,
+        batch_size: int = 500,
+        transactional: bool = False,
     ):
         """
         Initialize the Valkey vector store.
@@ -65,6 +68,9 @@ class ValkeyDB(VectorStoreBase):
             hnsw_m (int, optional): HNSW M parameter (connections per node). Defaults to 16.
             hnsw_ef_construction (int, optional): HNSW ef_construction parameter. Defaults to 200.
             hnsw_ef_runtime (int, optional): HNSW ef_runtime parameter. Defaults to 10.
+            batch_size (int, optional): Commands per pipeline for bulk writes and batched searches. Defaults to 500.
+            transactional (bool, optional): Wrap each bulk write batch in MULTI/EXEC so it applies atomically.
+                Defaults to False.
         """
         self.embedding_model_dims = embedding_model_dims
         self.collection_name = collection_name
@@ -74,6 +80,11 @@ class ValkeyDB(VectorStoreBase):
         self.hnsw_m = hnsw_m
         self.hnsw_ef_construction = hnsw_ef_construction
         self.hnsw_ef_runtime = hnsw_ef_runtime
+        self.batch_size = batch_size
+        self.transactional = transactional
+        # Filter templates keyed by filter keys, and KNN clauses keyed by (limit, ef_runtime)
+        self._filter_templates = {}
+        self._knn_clauses = {}
 
         # Validate index type
         if self.index_type not in ["hnsw", "flat"]:
@@ -265,54 +276,107 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error creating collection {collection_name}: {e}")
             raise
 
+    def _hash_data(self, vector_id, vector, payload, updated: bool = False) -> dict:
+        """
+        Build the hash fields stored for a vector.
+
+        Args:
+            vector_id (str): ID of the vector.
+            vector (list): Vector data.
+            payload (dict): Payload data; created_at is filled in when missing.
+            updated (bool, optional): Store updated_at when the payload has it. Defaults to False.
+
+        Returns:
+            dict: Hash fields.
+        """
+        # Ensure created_at is present
+        if "created_at" not in payload:
+            payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
+
+        # Prepare the hash data
+        hash_data = {
+            "memory_id": vector_id,
+            "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
+            "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+        }
+
+        # Add updated_at if available
+        if updated and "updated_at" in payload:
+            hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
+
+        # Add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                hash_data[field] = payload[field]
+
+        # Add metadata
+        hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return hash_data
+
+    def _write_batches(self, items, write, action: str):
+        """
+        Queue write(pipeline, item) for every item, executing one pipeline per batch_size items.
+
+        Args:
+            items (list): (vector_id, ...) tuples to write.
+            write (callable): Queues the commands for one item on the pipeline.
+            action (str): Verb used in log messages.
+        """
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            pipeline = self.client.pipeline(transaction=self.transactional)
+            queued = 0
+            for item in batch:
+                try:
+                    write(pipeline, item)
+                    queued += 1
+                except KeyError as e:
+                    logger.error(f"Error {action} vector with ID {item[0]}: Missing required field {e}")
+            if not queued:
+                continue
+            try:
+                pipeline.execute()
+                logger.debug(f"Successfully {action} {queued} vectors")
+            except Exception as e:
+                logger.exception(f"Error {action} {queued} vectors: {e}")
+                raise
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
         Insert vectors and their payloads into the index.
 
+        Hashes are written through pipelines, one round trip per batch_size vectors.
+
         Args:
             vectors (list): List of vectors to insert.
             payloads (list, optional): List of payloads corresponding to the vectors.
             ids (list, optional): List of IDs for the vectors.
         """
-        for vector, payload, id in zip(vectors, payloads, ids):
-            try:
-                # Create the key for the hash
-                key = f"{self.prefix}:{id}"
-
-                # Check for required fields and provide defaults if missing
-                if "data" not in payload:
-                    # Silently use default value for missing 'data' field
-                    pass
-
-                # Ensure created_at is present
-                if "created_at" not in payload:
-                    payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-                # Prepare the hash data
-                hash_data = {
-                    "memory_id": id,
-                    "hash": payload.get("hash", f"hash_{id}"),  # Use a default hash if not provided
-                    "memory": payload.get("data", f"data_{id}"),  # Use a default data if not provided
-                    "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                    "embedding": np.array(vector, dtype=np.float32).tobytes(),
-                }
-
-                # Add optional fields
-                for field in ["agent_id", "run_id", "user_id"]:
-                    if field in payload:
-                        hash_data[field] = payload[field]
+        self._write_batches(
+            list(zip(ids, vectors, payloads)),
+            lambda pipeline, item: pipeline.hset(f"{self.prefix}:{item[0]}", mapping=self._hash_data(*item)),
+            "inserting",
+        )
 
-                # Add metadata
-                hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+    def _filter_expression(self, filters=None):
+        """
+        Build the tag filter expression, reusing a template compiled once per set of filter keys.
 
-                # Store in Valkey
-                self.client.hset(key, mapping=hash_data)
-                logger.debug(f"Successfully inserted vector with ID {id}")
-            except KeyError as e:
-                logger.error(f"Error inserting vector with ID {id}: Missing required field {e}")
-            except Exception as e:
-                logger.exception(f"Error inserting vector with ID {id}: {e}")
-                raise
+        Each key-value pair becomes a tag filter (@key:{value}); None values are ignored and values are
+        used as-is. Returns None when there is nothing to filter on.
+        """
+        if not filters:
+            return None
+        keys = tuple(key for key, value in filters.items() if value is not None)
+        if not keys:
+            return None
+        template = self._filter_templates.get(keys)
+        if template is None:
+            template = " ".join(f"@{key}:{{%s}}" for key in keys)
+            self._filter_templates[keys] = template
+        return template % tuple(filters[key] for key in keys)
 
     def _build_search_query(self, knn_part, filters=None):
         """
@@ -330,25 +394,25 @@ class ValkeyDB(VectorStoreBase):
             str: The complete search query string in format "filter_expr =>[KNN...]"
                 or "*=>[KNN...]" if no valid filters.
         """
-        # No filters, just use the KNN search
-        if not filters or not any(value is not None for key, value in filters.items()):
+        filter_expr = self._filter_expression(filters)
+        if filter_expr is None:
             return f"*=>{knn_part}"
-
-        # Build filter expression
-        filter_parts = []
-        for key, value in filters.items():
-            if value is not None:
-                # Use the correct filter syntax for Valkey
-                filter_parts.append(f"@{key}:{{{value}}}")
-
-        # No valid filter parts
-        if not filter_parts:
-            return f"*=>{knn_part}"
-
-        # Combine filter parts with proper syntax
-        filter_expr = " ".join(filter_parts)
         return f"{filter_expr} =>{knn_part}"
 
+    def _knn_part(self, limit, ef_runtime=None):
+        """Return the KNN clause for limit and ef_runtime, cached per combination."""
+        # EF_RUNTIME only applies to HNSW indexes
+        if self.index_type != "hnsw":
+            ef_runtime = None
+        knn_part = self._knn_clauses.get((limit, ef_runtime))
+        if knn_part is None:
+            if ef_runtime is not None:
+                knn_part = f"[KNN {limit} @embedding $vec_param EF_RUNTIME {ef_runtime} AS vector_score]"
+            else:
+                knn_part = f"[KNN {limit} @embedding $vec_param AS vector_score]"
+            self._knn_clauses[(limit, ef_runtime)] = knn_part
+        return knn_part
+
     def _execute_search(self, query, params):
         """
         Execute a search query.
@@ -427,15 +491,8 @@ class ValkeyDB(VectorStoreBase):
         # Convert the vector to bytes
         vector_bytes = np.array(vectors, dtype=np.float32).tobytes()
 
-        # Build the KNN part with optional EF_RUNTIME for HNSW
-        if self.index_type == "hnsw" and ef_runtime is not None:
-            knn_part = f"[KNN {limit} @embedding $vec_param EF_RUNTIME {ef_runtime} AS vector_score]"
-        else:
-            # For FLAT indexes or when ef_runtime is None, use basic KNN
-            knn_part = f"[KNN {limit} @embedding $vec_param AS vector_score]"
-
         # Build the complete query
-        q = self._build_search_query(knn_part, filters)
+        q = self._build_search_query(self._knn_part(limit, ef_runtime), filters)
 
         # Log the query for debugging (only in debug mode)
         logger.debug(f"Valkey search query: {q}")
@@ -449,6 +506,34 @@ class ValkeyDB(VectorStoreBase):
         # Process the results
         return self._process_search_results(results)
 
+    def search_batch(self, vectors: list, limit: int = 5, filters: dict = None, ef_runtime: int = None):
+        """
+        Run several KNN queries in one pipeline.
+
+        Args:
+            vectors (list): Query vectors.
+            limit (int, optional): Maximum number of results per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+            ef_runtime (int, optional): HNSW ef_runtime parameter. Only used with HNSW index. Defaults to None.
+
+        Returns:
+            list: List of OutputData lists, one per query vector.
+        """
+        q = self._build_search_query(self._knn_part(limit, ef_runtime), filters)
+        results = []
+        for start in range(0, len(vectors), self.batch_size):
+            pipeline = self.client.ft(self.collection_name).pipeline(transaction=False)
+            for vector in vectors[start:start + self.batch_size]:
+                pipeline.search(q, query_params={"vec_param": np.array(vector, dtype=np.float32).tobytes()})
+            try:
+                responses = pipeline.execute()
+            except ResponseError as e:
+                logger.error(f"Batch search failed with query '{q}': {e}")
+                raise
+            # Pipelined replies are not parsed by the client
+            results.extend(self._process_search_results(Result(response, True)) for response in responses)
+        return results
+
     def delete(self, vector_id):
         """
         Delete a vector from the index.
@@ -464,6 +549,19 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error deleting vector with ID {vector_id}: {e}")
             raise
 
+    def delete_many(self, vector_ids: list):
+        """
+        Delete several vectors, one round trip per batch_size keys.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        self._write_batches(
+            [(vector_id,) for vector_id in vector_ids],
+            lambda pipeline, item: pipeline.delete(f"{self.prefix}:{item[0]}"),
+            "deleting",
+        )
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector in the index.
@@ -476,38 +574,8 @@ class ValkeyDB(VectorStoreBase):
         try:
             key = f"{self.prefix}:{vector_id}"
 
-            # Check for required fields and provide defaults if missing
-            if "data" not in payload:
-                # Silently use default value for missing 'data' field
-                pass
-
-            # Ensure created_at is present
-            if "created_at" not in payload:
-                payload["created_at"] = datetime.now(pytz.timezone(self.timezone)).isoformat()
-
-            # Prepare the hash data
-            hash_data = {
-                "memory_id": vector_id,
-                "hash": payload.get("hash", f"hash_{vector_id}"),  # Use a default hash if not provided
-                "memory": payload.get("data", f"data_{vector_id}"),  # Use a default data if not provided
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Add updated_at if available
-            if "updated_at" in payload:
-                hash_data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
-
-            # Add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    hash_data[field] = payload[field]
-
-            # Add metadata
-            hash_data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
             # Update in Valkey
-            self.client.hset(key, mapping=hash_data)
+            self.client.hset(key, mapping=self._hash_data(vector_id, vector, payload, updated=True))
             logger.debug(f"Successfully updated vector with ID {vector_id}")
         except KeyError as e:
             logger.error(f"Error updating vector with ID {vector_id}: Missing required field {e}")
@@ -515,6 +583,23 @@ class ValkeyDB(VectorStoreBase):
             logger.exception(f"Error updating vector with ID {vector_id}: {e}")
             raise
 
+    def update_many(self, ids: list, vectors: list, payloads: list):
+        """
+        Update several vectors, one round trip per batch_size vectors.
+
+        Args:
+            ids (list): IDs of the vectors to update.
+            vectors (list): New vector data.
+            payloads (list): New payload data.
+        """
+        self._write_batches(
+            list(zip(ids, vectors, payloads)),
+            lambda pipeline, item: pipeline.hset(
+                f"{self.prefix}:{item[0]}", mapping=self._hash_data(*item, updated=True)
+            ),
+            "updating",
+        )
+
     def _format_timestamp(self, timestamp, timezone=None):
         """
         Format a timestamp with the specified timezone.
@@ -750,20 +835,8 @@ class ValkeyDB(VectorStoreBase):
         Returns:
             str: The query string. Returns "*" if no valid filters provided.
         """
-        # Default query
-        q = "*"
-
-        # Add filters if provided
-        if filters and any(value is not None for key, value in filters.items()):
-            filter_conditions = []
-            for key, value in filters.items():
-                if value is not None:
-                    filter_conditions.append(f"@{key}:{{{value}}}")
-
-            if filter_conditions:
-                q = " ".join(filter_conditions)
-
-        return q
+        filter_expr = self._filter_expression(filters)
+        return "*" if filter_expr is None else filter_expr
 
     def list(self, filters: dict = None, limit: int = None) -> list:
         """
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+FAISS 索引类型基准测试
+
+对比不同 index_type（HNSW / IVF / PQ / SQ）相对精确 Flat 索引的 recall@k、检索延迟和构建耗时。
+recall 以同一数据集上的 Flat 检索结果为基准。
+
+使用方法：
+    python performance_monitoring/benchmark_faiss_index.py --rows 200000 --queries 500
+    python performance_monitoring/benchmark_faiss_index.py --index-types HNSW32 "IVF1024,SQ8" --search-params nprobe=32
+
+每个索引类型使用独立的临时目录，结束后会删除。
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from mem0.vector_stores.faiss import FAISS
+
+DEFAULT_INDEX_TYPES = ["Flat", "HNSW32", "IVF1024,Flat", "IVF1024,SQ8", "IVF1024,PQ32"]
+
+
+def make_vectors(count: int, dims: int, clusters: int = 64, seed: int = 42) -> np.ndarray:
+    """Clustered synthetic embeddings; uniform noise would make every index look equally bad"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=count)
+    return centers[labels] + rng.normal(scale=0.3, size=(count, dims)).astype(np.float32)
+
+
+def parse_search_params(items):
+    params = {}
+    for item in items or []:
+        name, value = item.split("=", 1)
+        params[name] = float(value) if "." in value else int(value)
+    return params
+
+
+def run_index_type(index_type: str, data, queries, ids, payloads, baseline, args) -> dict:
+    path = tempfile.mkdtemp(prefix="mem0_faiss_bench_")
+    try:
+        store = FAISS(
+            collection_name="bench",
+            path=os.path.join(path, "bench"),
+            distance_strategy=args.distance,
+            embedding_model_dims=args.dims,
+            persistence="log",
+            index_type=None if index_type == "Flat" else index_type,
+            search_params=args.search_params,
+            background_training=False,
+            omp_threads=args.threads,
+        )
+        start = time.perf_counter()
+        for offset in range(0, len(data), args.batch_size):
+            end = offset + args.batch_size
+            store.insert(data[offset:end], payloads=payloads[offset:end], ids=ids[offset:end])
+        build_seconds = time.perf_counter() - start
+
+        latencies = []
+        results = []
+        filters = {"user_id": "user_0"} if args.filtered else None
+        for query in queries:
+            start = time.perf_counter()
+            hits = store.search("", [query], limit=args.k, filters=filters)
+            latencies.append((time.perf_counter() - start) * 1000)
+            results.append([hit.id for hit in hits])
+        store.close()
+
+        if baseline is not None:
+            recall = statistics.mean(
+                len(set(expected) & set(got)) / max(len(expected), 1) for expected, got in zip(baseline, results)
+            )
+        else:
+            recall = 1.0
+
+        latencies.sort()
+        result = {
+            "index_type": index_type,
+            "built_as": store.col_info()["index_type"],
+            "build_seconds": round(build_seconds, 2),
+            "recall_at_k": round(recall, 4),
+            "p50_ms": round(latencies[len(latencies) // 2], 3),
+            "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        }
+        print(
+            f"  {index_type:<16} build {result['build_seconds']:>8.2f}s  recall@{args.k} {result['recall_at_k']:.4f}  "
+            f"p50 {result['p50_ms']:.3f}ms  p95 {result['p95_ms']:.3f}ms"
+        )
+        return result, results
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FAISS index types against the flat baseline")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=int(os.getenv("EMBEDDING_MODEL_DIMS", "1536")))
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=100, help="Distinct user_id values in payloads")
+    parser.add_argument("--distance", choices=["euclidean", "inner_product", "cosine"], default="euclidean")
+    parser.add_argument("--index-types", nargs="+", default=DEFAULT_INDEX_TYPES)
+    parser.add_argument("--search-params", nargs="*", help="Index parameters, e.g. nprobe=32 efSearch=128")
+    parser.add_argument("--threads", type=int, help="OpenMP threads (faiss.omp_set_num_threads)")
+    parser.add_argument("--filtered", action="store_true", help="Search with a user_id filter")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+    args.search_params = parse_search_params(args.search_params)
+
+    random.seed(42)
+    print(f"=== FAISS index benchmark: {args.rows} rows, {args.queries} queries, {args.dims} dims ===")
+    data = make_vectors(args.rows, args.dims)
+    queries = make_vectors(args.queries, args.dims, seed=7).tolist()
+    ids = [str(uuid.uuid4()) for _ in range(args.rows)]
+    payloads = [{"user_id": f"user_{random.randrange(args.users)}"} for _ in range(args.rows)]
+
+    # Flat 结果作为 recall 基准，始终最先运行
+    index_types = ["Flat"] + [index_type for index_type in args.index_types if index_type != "Flat"]
+    results = []
+    baseline = None
+    for index_type in index_types:
+        result, hits = run_index_type(index_type, data, queries, ids, payloads, baseline, args)
+        if baseline is None:
+            baseline = hits
+        results.append(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"rows": args.rows, "k": args.k, "dims": args.dims, "filtered": args.filtered, "results": results},
+                f,
+                indent=2,
+            )
+        print(f"结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Memory / AsyncMemory 离线端到端基准测试
+
+在进程内驱动完整的 add / search 流水线，不访问任何网络服务：
+- LLM 使用 provider "mock"（确定性的事实抽取 / 记忆更新 JSON 响应，可配置模拟延迟）
+- Embedder 使用 provider "mock"（基于 token 哈希的确定性向量，维度可配置）
+- 向量存储使用进程内的 faiss 或 sqlite
+
+输出：
+1. 各阶段耗时（LLM 事实抽取 / 记忆更新、embedding、向量检索 / 写入、history 写入）及占 add 总耗时的比例
+2. 不同并发度下 Memory（线程池）与 AsyncMemory（asyncio.gather）的吞吐和 p50/p95/p99 延迟
+3. 每次 add / search 的内存分配（tracemalloc：分配块数、字节数、峰值）及分配最多的源文件
+
+使用方法：
+    python performance_monitoring/benchmark_memory_offline.py --adds 500 --searches 500 --concurrency 1 4 16
+    python performance_monitoring/benchmark_memory_offline.py --llm-latency 0.2 --vector-store sqlite --output /tmp/mem_offline.json
+
+LLM 延迟为 0 时测得的是流水线代码自身的开销，适合在 CI 中发现性能回退。
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# 必须在导入 mem0 之前设置：关闭遥测，迁移库写入临时目录而不是 ~/.mem0
+WORK_DIR = tempfile.mkdtemp(prefix="mem0_offline_bench_")
+os.environ["MEM0_TELEMETRY"] = "False"
+os.environ["MEM0_DIR"] = WORK_DIR
+
+from mem0.memory.main import AsyncMemory, Memory
+
+TOPICS = {
+    "food": ["sushi", "ramen", "dumplings", "pizza", "tacos", "curry", "hotpot", "salad"],
+    "city": ["Beijing", "Shanghai", "Hangzhou", "Shenzhen", "Chengdu", "Tokyo", "Berlin", "Lisbon"],
+    "hobby": ["running", "chess", "painting", "cycling", "photography", "swimming", "guitar", "hiking"],
+    "job": ["engineer", "teacher", "designer", "doctor", "writer", "chef", "lawyer", "nurse"],
+}
+TEMPLATES = [
+    "I really like {food}. I live in {city}.",
+    "My hobby is {hobby}. I work as a {job}.",
+    "I moved to {city} last year. I usually eat {food} on weekends.",
+    "I am a {job} and I enjoy {hobby} after work.",
+]
+
+
+def make_message(rng: random.Random) -> str:
+    return rng.choice(TEMPLATES).format(**{key: rng.choice(values) for key, values in TOPICS.items()})
+
+
+def make_query(rng: random.Random) -> str:
+    key = rng.choice(list(TOPICS))
+    return f"what {key} does the user like {rng.choice(TOPICS[key])}"
+
+
+def percentiles(latencies_ms: list) -> dict:
+    if not latencies_ms:
+        return {}
+    values = sorted(latencies_ms)
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(round(q * (len(values) - 1))))], 3)
+
+    return {"count": len(values), "p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99)}
+
+
+class StageRecorder:
+    """Wraps component methods on a Memory instance and records per-call durations by stage"""
+
+    def __init__(self):
+        self.durations = defaultdict(list)
+
+    def wrap(self, obj, method: str, stage):
+        original = getattr(obj, method)
+        durations = self.durations
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                name = stage(args, kwargs) if callable(stage) else stage
+                durations[name].append((time.perf_counter() - start) * 1000)
+
+        setattr(obj, method, timed)
+
+    def instrument(self, memory):
+        def llm_stage(args, kwargs):
+            messages = kwargs.get("messages") or args[0]
+            return "llm.extract_facts" if messages[0]["role"] == "system" else "llm.update_memory"
+
+        self.wrap(memory.llm, "generate_response", llm_stage)
+        self.wrap(memory.embedding_model, "embed", "embedder.embed")
+        for method in ("search", "insert", "update", "delete", "get", "list"):
+            self.wrap(memory.vector_store, method, f"vector_store.{method}")
+        self.wrap(memory.db, "add_history", "history.add_history")
+
+    def reset(self):
+        self.durations.clear()
+
+    def summary(self, total_ms: float) -> dict:
+        stages = {}
+        for name, values in sorted(self.durations.items()):
+            spent = sum(values)
+            stages[name] = {
+                **percentiles(values),
+                "total_ms": round(spent, 3),
+                "share": round(spent / total_ms, 4) if total_ms else None,
+            }
+        return stages
+
+
+def make_config(name: str, args) -> dict:
+    path = os.path.join(WORK_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return {
+        "llm": {
+            "provider": "mock",
+            "config": {
+                "latency": args.llm_latency,
+                "latency_jitter": args.llm_jitter,
+                "update_ratio": args.update_ratio,
+                "seed": args.seed,
+            },
+        },
+        "embedder": {"provider": "mock", "config": {"embedding_dims": args.dims}},
+        "vector_store": {
+            "provider": args.vector_store,
+            "config": {"collection_name": "bench", "path": path, "embedding_model_dims": args.dims},
+        },
+        "history_db_path": os.path.join(path, "history.db"),
+    }
+
+
+def run_stages(args) -> dict:
+    """Sequential add/search with per-stage breakdown"""
+    memory = Memory.from_config(make_config("stages", args))
+    recorder = StageRecorder()
+    recorder.instrument(memory)
+    rng = random.Random(args.seed)
+
+    result = {}
+    for op, count in (("add", args.adds), ("search", args.searches)):
+        recorder.reset()
+        latencies = []
+        for i in range(count):
+            user_id = f"user_{i % args.users}"
+            start = time.perf_counter()
+            if op == "add":
+                memory.add(make_message(rng), user_id=user_id)
+            else:
+                memory.search(make_query(rng), user_id=user_id, limit=args.k)
+            latencies.append((time.perf_counter() - start) * 1000)
+        total = sum(latencies)
+        result[op] = {
+            **percentiles(latencies),
+            "ops_per_sec": round(count / (total / 1000), 1) if total else None,
+            "stages": recorder.summary(total),
+        }
+        print(f"  {op:<7} p50 {result[op].get('p50_ms', 0):.3f}ms  p99 {result[op].get('p99_ms', 0):.3f}ms")
+        for name, stage in result[op]["stages"].items():
+            print(f"    {name:<24} {stage['count']:>6} calls  p50 {stage['p50_ms']:.3f}ms  share {stage['share']:.1%}")
+    return result
+
+
+def run_sync_concurrency(concurrency: int, args) -> dict:
+    memory = Memory.from_config(make_config(f"sync_{concurrency}", args))
+    rng = random.Random(args.seed)
+    jobs = [(f"user_{i % args.users}", make_message(rng), make_query(rng)) for i in range(args.adds)]
+
+    def timed(fn, *fn_args, **kwargs):
+        start = time.perf_counter()
+        fn(*fn_args, **kwargs)
+        return (time.perf_counter() - start) * 1000
+
+    result = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        latencies = list(executor.map(lambda job: timed(memory.add, job[1], user_id=job[0]), jobs))
+        result["add"] = {**percentiles(latencies), "ops_per_sec": round(len(jobs) / (time.perf_counter() - start), 1)}
+
+        start = time.perf_counter()
+        latencies = list(
+            executor.map(lambda job: timed(memory.search, job[2], user_id=job[0], limit=args.k), jobs[: args.searches])
+        )
+        result["search"] = {
+            **percentiles(latencies),
+            "ops_per_sec": round(len(latencies) / (time.perf_counter() - start), 1),
+        }
+    return result
+
+
+async def run_async_concurrency(concurrency: int, args) -> dict:
+    memory = await AsyncMemory.from_config(make_config(f"async_{concurrency}", args))
+    rng = random.Random(args.seed)
+    jobs = [(f"user_{i % args.users}", make_message(rng), make_query(rng)) for i in range(args.adds)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(coro):
+        async with semaphore:
+            start = time.perf_counter()
+            await coro
+            return (time.perf_counter() - start) * 1000
+
+    result = {}
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(memory.add(message, user_id=user)) for user, message, _ in jobs))
+    result["add"] = {**percentiles(latencies), "ops_per_sec": round(len(jobs) / (time.perf_counter() - start), 1)}
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(timed(memory.search(query, user_id=user, limit=args.k)) for user, _, query in jobs[: args.searches])
+    )
+    result["search"] = {**percentiles(latencies), "ops_per_sec": round(len(latencies) / (time.perf_counter() - start), 1)}
+    return result
+
+
+def run_allocations(args) -> dict:
+    """tracemalloc over a warm Memory; reported separately because tracing slows every allocation"""
+    memory = Memory.from_config(make_config("allocations", args))
+    rng = random.Random(args.seed)
+    for i in range(args.users):
+        memory.add(make_message(rng), user_id=f"user_{i}")
+
+    result = {}
+    for op in ("add", "search"):
+        tracemalloc.start(1)
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for i in range(args.alloc_ops):
+            user_id = f"user_{i % args.users}"
+            if op == "add":
+                memory.add(make_message(rng), user_id=user_id)
+            else:
+                memory.search(make_query(rng), user_id=user_id, limit=args.k)
+        _, peak = tracemalloc.get_traced_memory()
+        diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+        tracemalloc.stop()
+
+        grown = [stat for stat in diff if stat.size_diff > 0]
+        result[op] = {
+            "ops": args.alloc_ops,
+            "net_blocks_per_op": round(sum(stat.count_diff for stat in diff) / args.alloc_ops, 1),
+            "net_bytes_per_op": round(sum(stat.size_diff for stat in diff) / args.alloc_ops, 1),
+            "peak_bytes": peak - baseline,
+            "top_files": [
+                {"file": stat.traceback[0].filename, "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in sorted(grown, key=lambda stat: stat.size_diff, reverse=True)[:5]
+            ],
+        }
+        print(
+            f"  {op:<7} net {result[op]['net_blocks_per_op']:>8.1f} blocks/op  "
+            f"{result[op]['net_bytes_per_op'] / 1024:>8.1f} KB/op  peak {result[op]['peak_bytes'] / 1024:.1f} KB"
+        )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Memory/AsyncMemory pipeline benchmark")
+    parser.add_argument("--adds", type=int, default=300, help="Memory.add calls per run")
+    parser.add_argument("--searches", type=int, default=300, help="Memory.search calls per run")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--users", type=int, default=20, help="Distinct user_id values")
+    parser.add_argument("--k", type=int, default=10, help="Search limit")
+    parser.add_argument("--dims", type=int, default=int(os.getenv("EMBEDDING_MODEL_DIMS", "1536")))
+    parser.add_argument("--vector-store", choices=["faiss", "sqlite"], default="faiss")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated seconds per LLM call")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="Uniform random seconds added per LLM call")
+    parser.add_argument("--update-ratio", type=float, default=0.2, help="Share of facts the mock LLM turns into UPDATE")
+    parser.add_argument("--alloc-ops", type=int, default=50, help="Operations traced with tracemalloc")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print(
+        f"=== offline Memory benchmark: {args.adds} adds, {args.searches} searches, {args.dims} dims, "
+        f"{args.vector_store}, llm latency {args.llm_latency}s ==="
+    )
+    try:
+        print("--- stages (sequential) ---")
+        results = {"stages": run_stages(args), "concurrency": [], "allocations": None}
+
+        print("--- concurrency ---")
+        for concurrency in args.concurrency:
+            sync_result = run_sync_concurrency(concurrency, args)
+            async_result = asyncio.run(run_async_concurrency(concurrency, args))
+            results["concurrency"].append({"concurrency": concurrency, "sync": sync_result, "async": async_result})
+            print(
+                f"  x{concurrency:<4} Memory add {sync_result['add']['ops_per_sec']:>8.1f}/s "
+                f"search {sync_result['search']['ops_per_sec']:>8.1f}/s  |  "
+                f"AsyncMemory add {async_result['add']['ops_per_sec']:>8.1f}/s "
+                f"search {async_result['search']['ops_per_sec']:>8.1f}/s"
+            )
+
+        print("--- allocations ---")
+        results["allocations"] = run_allocations(args)
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "adds": args.adds,
+                    "searches": args.searches,
+                    "dims": args.dims,
+                    "vector_store": args.vector_store,
+                    "llm_latency": args.llm_latency,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+pgvector 写入吞吐基准测试
+
+对比 PGVector 的三条写入路径（rows/sec）：
+1. insert      - executemany / execute_values 逐行 INSERT
+2. bulk_insert - COPY ... FROM STDIN (FORMAT BINARY)
+3. update_many - 二进制 COPY 到临时表 + 单条 UPDATE ... FROM
+
+使用方法：
+1. 启动本地 Postgres 容器：
+   docker run -d --name mem0-bench-pg -e POSTGRES_PASSWORD=postgres -p 5432:5432 pgvector/pgvector:pg16
+2. 运行基准测试：
+   python performance_monitoring/benchmark_pgvector_ingest.py --rows 20000 --batch-size 1000
+
+连接参数读取与 server/main.py 相同的环境变量（POSTGRES_HOST/PORT/DB/USER/PASSWORD）。
+测试使用独立的集合 mem0_ingest_bench，结束后会删除。
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from mem0.vector_stores.pgvector import PGVector
+
+BENCH_COLLECTION = "mem0_ingest_bench"
+
+
+def make_store(dims: int) -> PGVector:
+    return PGVector(
+        dbname=os.getenv("POSTGRES_DB", "postgres"),
+        collection_name=BENCH_COLLECTION,
+        embedding_model_dims=dims,
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        diskann=False,
+        hnsw=True,
+        copy_threshold=None,
+    )
+
+
+def make_batch(size: int, dims: int, users: int):
+    vectors = [[random.random() for _ in range(dims)] for _ in range(size)]
+    payloads = [
+        {"data": f"memory {uuid.uuid4().hex[:8]}", "user_id": f"user_{random.randrange(users)}"}
+        for _ in range(size)
+    ]
+    ids = [str(uuid.uuid4()) for _ in range(size)]
+    return vectors, payloads, ids
+
+
+def run_path(name: str, fn, batches) -> dict:
+    """Run one write path over all batches and return its throughput"""
+    rows = 0
+    start = time.perf_counter()
+    for batch in batches:
+        fn(*batch)
+        rows += len(batch[0])
+    elapsed = time.perf_counter() - start
+    result = {"path": name, "rows": rows, "seconds": round(elapsed, 3), "rows_per_sec": round(rows / elapsed, 1)}
+    print(f"  {name:<12} {rows:>8} rows  {elapsed:>8.2f}s  {result['rows_per_sec']:>10.1f} rows/sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pgvector ingest paths")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows written per path")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dims", type=int, default=int(os.getenv("EMBEDDING_MODEL_DIMS", "1536")))
+    parser.add_argument("--users", type=int, default=100, help="Distinct user_id values in payloads")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    random.seed(42)
+    store = make_store(args.dims)
+    store.reset()
+    print(f"=== pgvector ingest benchmark: {args.rows} rows, batch {args.batch_size}, {args.dims} dims ===")
+
+    def batches():
+        for _ in range(args.rows // args.batch_size):
+            yield make_batch(args.batch_size, args.dims, args.users)
+
+    # 预先生成数据，避免把数据构造时间计入吞吐
+    insert_batches = list(batches())
+    copy_batches = list(batches())
+    written_ids = [ids for _, _, ids in copy_batches]
+    update_batches = [
+        (ids, [[random.random() for _ in range(args.dims)] for _ in ids], None) for ids in written_ids
+    ]
+
+    results = []
+    try:
+        results.append(run_path("insert", lambda v, p, i: store.insert(v, payloads=p, ids=i), insert_batches))
+        results.append(run_path("bulk_insert", lambda v, p, i: store.bulk_insert(v, payloads=p, ids=i), copy_batches))
+        results.append(run_path("update_many", lambda i, v, p: store.update_many(i, vectors=v, payloads=p), update_batches))
+    finally:
+        store.delete_col()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"rows": args.rows, "batch_size": args.batch_size, "dims": args.dims, "results": results}, f, indent=2)
+        print(f"结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
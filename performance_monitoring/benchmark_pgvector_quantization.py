@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+pgvector 量化存储基准测试
+
+对比不同 vector_type / index_quantization 组合的 HNSW 索引大小、检索延迟和 recall@k。
+recall 以同一集合上的精确检索（search_params={"exact": True}）为基准。
+
+使用方法：
+1. 启动本地 Postgres 容器（pgvector >= 0.7）：
+   docker run -d --name mem0-bench-pg -e POSTGRES_PASSWORD=postgres -p 5432:5432 pgvector/pgvector:pg16
+2. 运行基准测试：
+   python performance_monitoring/benchmark_pgvector_quantization.py --rows 50000 --queries 200
+
+连接参数读取与 server/main.py 相同的环境变量（POSTGRES_HOST/PORT/DB/USER/PASSWORD）。
+每个组合使用独立的 mem0_quant_bench_* 集合，结束后会删除。
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from mem0.vector_stores.pgvector import PGVector
+
+VARIANTS = {
+    "float32": {"vector_type": "vector", "index_quantization": None},
+    "halfvec_index": {"vector_type": "vector", "index_quantization": "halfvec"},
+    "halfvec_storage": {"vector_type": "halfvec", "index_quantization": None},
+    "binary_rerank": {"vector_type": "vector", "index_quantization": "binary"},
+}
+
+
+def make_store(name: str, dims: int, variant: dict, rerank_factor: int) -> PGVector:
+    return PGVector(
+        dbname=os.getenv("POSTGRES_DB", "postgres"),
+        collection_name=f"mem0_quant_bench_{name}",
+        embedding_model_dims=dims,
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        diskann=False,
+        hnsw=True,
+        rerank_factor=rerank_factor,
+        **variant,
+    )
+
+
+def make_vectors(count: int, dims: int, clusters: int = 64):
+    """Clustered synthetic embeddings; uniform noise would make every index look equally bad"""
+    centers = [[random.gauss(0, 1) for _ in range(dims)] for _ in range(clusters)]
+    vectors = []
+    for _ in range(count):
+        center = random.choice(centers)
+        vectors.append([c + random.gauss(0, 0.3) for c in center])
+    return vectors
+
+
+def hnsw_index_size(store: PGVector) -> int:
+    with store._get_cursor() as cur:
+        cur.execute(
+            """
+            SELECT COALESCE(SUM(pg_relation_size(c.oid)), 0)
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = %s::regclass AND c.relname LIKE '%%hnsw%%'
+            """,
+            (store.collection_name,),
+        )
+        return int(cur.fetchone()[0])
+
+
+def run_variant(name: str, variant: dict, data, queries, args) -> dict:
+    store = make_store(name, args.dims, variant, args.rerank_factor)
+    store.reset()
+    try:
+        ids = [str(uuid.uuid4()) for _ in data]
+        for start in range(0, len(data), 1000):
+            batch = data[start:start + 1000]
+            store.bulk_insert(batch, payloads=[{"user_id": "bench"}] * len(batch), ids=ids[start:start + 1000])
+        with store._get_cursor(commit=True) as cur:
+            cur.execute(f"ANALYZE {store.collection_name}")
+
+        latencies = []
+        recalls = []
+        for query in queries:
+            exact = {r.id for r in store.search("", query, limit=args.k, search_params={"exact": True})}
+            start = time.perf_counter()
+            results = store.search("", query, limit=args.k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recalls.append(len(exact & {r.id for r in results}) / max(len(exact), 1))
+
+        latencies.sort()
+        result = {
+            "variant": name,
+            **variant,
+            "index_bytes": hnsw_index_size(store),
+            "recall_at_k": round(statistics.mean(recalls), 4),
+            "p50_ms": round(latencies[len(latencies) // 2], 2),
+            "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        }
+        print(
+            f"  {name:<16} index {result['index_bytes'] / 1024 / 1024:>8.1f} MB  "
+            f"recall@{args.k} {result['recall_at_k']:.4f}  p50 {result['p50_ms']:.2f}ms  p95 {result['p95_ms']:.2f}ms"
+        )
+        return result
+    finally:
+        store.delete_col()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pgvector quantized storage and indexes")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=int(os.getenv("EMBEDDING_MODEL_DIMS", "1536")))
+    parser.add_argument("--rerank-factor", type=int, default=10)
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    random.seed(42)
+    print(f"=== pgvector quantization benchmark: {args.rows} rows, {args.queries} queries, {args.dims} dims ===")
+    data = make_vectors(args.rows, args.dims)
+    queries = make_vectors(args.queries, args.dims)
+
+    results = [run_variant(name, VARIANTS[name], data, queries, args) for name in args.variants]
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"rows": args.rows, "k": args.k, "dims": args.dims, "results": results}, f, indent=2)
+        print(f"结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
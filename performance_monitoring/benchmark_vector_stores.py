@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+向量存储跨 provider 一致性与性能基准测试
+
+对同一份合成数据，在多个 mem0 向量存储 provider 上运行相同的工作负载：
+1. insert  - 批量写入（rows/sec）
+2. search  - 按 user_id 过滤的检索（p50/p95/p99 延迟、QPS、相对精确暴力检索的 recall@k）
+3. get / list / update / delete - 单条操作延迟
+4. 一致性检查 - 过滤是否生效、get 是否返回写入的 payload、update/delete 是否可见，
+   并记录各 provider 的行为差异（list 返回结构、score 语义、get 不存在 id 时的行为）
+
+进程内 provider（无需外部服务）：faiss、sqlite、qdrant（本地目录）、chroma（本地目录）。
+需要容器的 provider：pgvector、redis、elasticsearch，连接参数读取环境变量：
+    POSTGRES_HOST/PORT/DB/USER/PASSWORD、REDIS_URL、ELASTICSEARCH_HOST/PORT/USER/PASSWORD
+
+使用方法：
+    python performance_monitoring/benchmark_vector_stores.py --sizes 1000 10000 --output /tmp/vs_bench.json
+    python performance_monitoring/benchmark_vector_stores.py --providers pgvector redis --sizes 10000
+    python performance_monitoring/benchmark_vector_stores.py --ci     # CI：仅进程内 provider，小数据集
+
+缺少依赖或连接失败的 provider 会被跳过并在结果中标记；任一一致性检查失败时退出码为 1。
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+IN_PROCESS_PROVIDERS = ["faiss", "sqlite", "qdrant", "chroma"]
+CONTAINER_PROVIDERS = ["pgvector", "redis", "elasticsearch"]
+
+
+def make_faiss(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.faiss import FAISS
+
+    return FAISS(collection_name=collection, path=os.path.join(workdir, collection), embedding_model_dims=dims)
+
+
+def make_sqlite(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.sqlite import SQLiteVectorStore
+
+    return SQLiteVectorStore(collection_name=collection, path=workdir, embedding_model_dims=dims)
+
+
+def make_qdrant(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.qdrant import Qdrant
+
+    return Qdrant(collection_name=collection, embedding_model_dims=dims, path=os.path.join(workdir, "qdrant"))
+
+
+def make_chroma(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.chroma import ChromaDB
+
+    return ChromaDB(collection_name=collection, path=os.path.join(workdir, "chroma"))
+
+
+def make_pgvector(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.pgvector import PGVector
+
+    return PGVector(
+        dbname=os.getenv("POSTGRES_DB", "postgres"),
+        collection_name=collection,
+        embedding_model_dims=dims,
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres"),
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        diskann=False,
+        hnsw=True,
+    )
+
+
+def make_redis(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.redis import RedisDB
+
+    return RedisDB(
+        redis_url=os.getenv("REDIS_URL", "redis://localhost:6379"), collection_name=collection, embedding_model_dims=dims
+    )
+
+
+def make_elasticsearch(collection: str, dims: int, workdir: str):
+    from mem0.vector_stores.elasticsearch import ElasticsearchDB
+
+    return ElasticsearchDB(
+        collection_name=collection,
+        host=os.getenv("ELASTICSEARCH_HOST", "http://localhost"),
+        port=int(os.getenv("ELASTICSEARCH_PORT", "9200")),
+        user=os.getenv("ELASTICSEARCH_USER", "elastic"),
+        password=os.getenv("ELASTICSEARCH_PASSWORD", "changeme"),
+        embedding_model_dims=dims,
+        refresh="wait_for",
+    )
+
+
+FACTORIES = {
+    "faiss": make_faiss,
+    "sqlite": make_sqlite,
+    "qdrant": make_qdrant,
+    "chroma": make_chroma,
+    "pgvector": make_pgvector,
+    "redis": make_redis,
+    "elasticsearch": make_elasticsearch,
+}
+
+
+def make_vectors(count: int, dims: int, rng, clusters: int = 64) -> np.ndarray:
+    """Clustered unit vectors: cosine, inner product and L2 then rank neighbours identically"""
+    centers = rng.normal(size=(clusters, dims)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, size=count)] + rng.normal(scale=0.3, size=(count, dims)).astype(
+        np.float32
+    )
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_payload(i: int, users: int) -> dict:
+    # redis/valkey 要求 hash / data / created_at 字段
+    return {
+        "user_id": f"user_{i % users}",
+        "data": f"memory {i}",
+        "hash": uuid.uuid4().hex,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def percentiles(latencies_ms: list) -> dict:
+    if not latencies_ms:
+        return {}
+    values = sorted(latencies_ms)
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(round(q * (len(values) - 1))))], 3)
+
+    total_s = sum(values) / 1000
+    return {
+        "count": len(values),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "ops_per_sec": round(len(values) / total_s, 1) if total_s else None,
+    }
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def unwrap_list(result):
+    """Normalize list() shapes: [[...]] (most stores), [...] (mongodb, sqlite-style), (points, offset) (qdrant)"""
+    if isinstance(result, tuple):
+        return list(result[0]), "tuple"
+    if isinstance(result, list) and len(result) == 1 and isinstance(result[0], list):
+        return result[0], "nested"
+    return list(result or []), "flat"
+
+
+def hit_id(hit) -> str:
+    return str(getattr(hit, "id", None) or hit.get("id"))
+
+
+def hit_payload(hit) -> dict:
+    payload = getattr(hit, "payload", None)
+    return payload if payload is not None else (hit.get("payload") if isinstance(hit, dict) else {}) or {}
+
+
+def run_workload(provider: str, size: int, args, rng) -> dict:
+    workdir = tempfile.mkdtemp(prefix=f"mem0_vs_bench_{provider}_")
+    collection = f"mem0_bench_{provider}_{size}"
+    result = {"provider": provider, "size": size}
+    store = None
+    try:
+        store = FACTORIES[provider](collection, args.dims, workdir)
+        if hasattr(store, "reset") and provider in CONTAINER_PROVIDERS:
+            store.reset()
+
+        vectors = make_vectors(size, args.dims, rng)
+        ids = [str(uuid.uuid4()) for _ in range(size)]
+        payloads = [make_payload(i, args.users) for i in range(size)]
+
+        # 1. 批量写入
+        start = time.perf_counter()
+        for offset in range(0, size, args.batch_size):
+            end = offset + args.batch_size
+            store.insert(vectors[offset:end].tolist(), payloads=payloads[offset:end], ids=ids[offset:end])
+        elapsed = time.perf_counter() - start
+        result["insert"] = {"rows": size, "seconds": round(elapsed, 3), "rows_per_sec": round(size / elapsed, 1)}
+
+        # 2. 按用户过滤检索 + recall@k（同一用户内的精确暴力检索为基准）
+        users = [f"user_{u}" for u in range(args.users)]
+        user_rows = {user: np.array([i for i in range(size) if payloads[i]["user_id"] == user]) for user in users}
+        latencies, recalls, filter_violations = [], [], 0
+        for q in range(args.queries):
+            user = users[q % len(users)]
+            query = make_vectors(1, args.dims, rng)[0]
+            rows = user_rows[user]
+            expected = {ids[i] for i in rows[np.argsort(-(vectors[rows] @ query))[: args.k]]}
+            hits, ms = timed(store.search, "", query.tolist(), limit=args.k, filters={"user_id": user})
+            latencies.append(ms)
+            got = [hit_id(hit) for hit in hits]
+            recalls.append(len(expected & set(got)) / max(len(expected), 1))
+            filter_violations += sum(1 for hit in hits if hit_payload(hit).get("user_id") != user)
+        result["search"] = percentiles(latencies)
+        result["recall_at_k"] = round(float(np.mean(recalls)), 4) if recalls else None
+
+        # score 语义：用已存向量检索自身，看分数是升序（距离）还是降序（相似度）
+        probe = store.search("", vectors[0].tolist(), limit=3, filters={"user_id": payloads[0]["user_id"]})
+        scores = [getattr(hit, "score", None) for hit in probe]
+        if len(scores) > 1 and None not in scores:
+            score_order = "ascending_distance" if scores[0] <= scores[-1] else "descending_similarity"
+        else:
+            score_order = "unknown"
+
+        # 3. get / list
+        sample = random.sample(range(size), min(args.ops, size))
+        latencies, get_mismatches = [], 0
+        for i in sample:
+            got, ms = timed(store.get, ids[i])
+            latencies.append(ms)
+            if got is None or hit_payload(got).get("data") != payloads[i]["data"]:
+                get_mismatches += 1
+        result["get"] = percentiles(latencies)
+
+        latencies, list_shape, list_violations = [], None, 0
+        for user in users[: args.ops]:
+            listed, ms = timed(store.list, filters={"user_id": user}, limit=100)
+            latencies.append(ms)
+            items, list_shape = unwrap_list(listed)
+            list_violations += sum(1 for item in items if hit_payload(item).get("user_id") != user)
+        result["list"] = percentiles(latencies)
+
+        # 4. update / delete
+        latencies, update_mismatches = [], 0
+        updated = sample[: max(1, len(sample) // 2)]
+        for i in updated:
+            payload = dict(payloads[i], data=f"updated {i}", updated_at=datetime.now(timezone.utc).isoformat())
+            _, ms = timed(store.update, ids[i], vector=vectors[i].tolist(), payload=payload)
+            latencies.append(ms)
+        result["update"] = percentiles(latencies)
+        for i in updated:
+            got = store.get(ids[i])
+            if got is None or hit_payload(got).get("data") != f"updated {i}":
+                update_mismatches += 1
+
+        latencies, delete_leaks, get_missing = [], 0, None
+        deleted = sample[len(updated):] or sample[:1]
+        for i in deleted:
+            _, ms = timed(store.delete, ids[i])
+            latencies.append(ms)
+        result["delete"] = percentiles(latencies)
+        for i in deleted:
+            hits = store.search("", vectors[i].tolist(), limit=args.k, filters={"user_id": payloads[i]["user_id"]})
+            delete_leaks += sum(1 for hit in hits if hit_id(hit) == ids[i])
+            try:
+                missing = store.get(ids[i])
+                get_missing = get_missing or ("none" if missing is None else "returns_record")
+                if missing is not None:
+                    delete_leaks += 1
+            except Exception as e:
+                get_missing = get_missing or f"raises_{type(e).__name__}"
+
+        result["quirks"] = {"list_shape": list_shape, "score_order": score_order, "get_missing": get_missing}
+        result["conformance"] = {
+            "search_respects_filter": filter_violations == 0,
+            "list_respects_filter": list_violations == 0,
+            "get_returns_payload": get_mismatches == 0,
+            "update_visible": update_mismatches == 0,
+            "delete_visible": delete_leaks == 0,
+        }
+        print(
+            f"  {provider:<14} {size:>8}  insert {result['insert']['rows_per_sec']:>10.1f} rows/s  "
+            f"search p50 {result['search'].get('p50_ms', 0):.3f}ms p99 {result['search'].get('p99_ms', 0):.3f}ms  "
+            f"recall@{args.k} {result['recall_at_k']:.4f}  "
+            f"conformance {'OK' if all(result['conformance'].values()) else 'FAIL'}"
+        )
+    except ImportError as e:
+        result["skipped"] = f"missing dependency: {e}"
+        print(f"  {provider:<14} {size:>8}  skipped ({result['skipped']})")
+    except Exception as e:
+        if store is None:
+            result["skipped"] = f"unavailable: {type(e).__name__}: {e}"
+            print(f"  {provider:<14} {size:>8}  skipped ({result['skipped']})")
+        else:
+            result["error"] = f"{type(e).__name__}: {e}"
+            print(f"  {provider:<14} {size:>8}  ERROR {result['error']}")
+    finally:
+        if store is not None:
+            try:
+                store.delete_col()
+            except Exception:
+                pass
+            if hasattr(store, "close"):
+                try:
+                    store.close()
+                except Exception:
+                    pass
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-provider vector store conformance and performance benchmark")
+    parser.add_argument("--providers", nargs="+", choices=list(FACTORIES), default=IN_PROCESS_PROVIDERS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000], help="Corpus sizes to run")
+    parser.add_argument("--queries", type=int, default=200, help="Filtered searches per corpus size")
+    parser.add_argument("--ops", type=int, default=50, help="get/list/update/delete operations per corpus size")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=int(os.getenv("EMBEDDING_MODEL_DIMS", "384")))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--users", type=int, default=20, help="Distinct user_id values in payloads")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--ci", action="store_true", help="In-process providers only, small corpus")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.ci:
+        args.providers = [provider for provider in args.providers if provider in IN_PROCESS_PROVIDERS]
+        args.sizes = [min(size, 2000) for size in args.sizes[:1]]
+        args.queries = min(args.queries, 50)
+        args.ops = min(args.ops, 20)
+        args.dims = min(args.dims, 128)
+
+    random.seed(args.seed)
+    print(
+        f"=== vector store benchmark: providers {', '.join(args.providers)}, sizes {args.sizes}, "
+        f"{args.queries} queries, {args.dims} dims ==="
+    )
+    results = []
+    for size in args.sizes:
+        for provider in args.providers:
+            # 每个 provider 使用相同的随机序列，数据和查询完全一致
+            results.append(run_workload(provider, size, args, np.random.default_rng(args.seed + size)))
+
+    failed = [r for r in results if "error" in r or not all(r.get("conformance", {}).values())]
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "sizes": args.sizes,
+                    "queries": args.queries,
+                    "k": args.k,
+                    "dims": args.dims,
+                    "users": args.users,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"结果已保存到: {args.output}")
+
+    if failed:
+        names = ", ".join(f"{r['provider']}@{r['size']}" for r in failed)
+        print(f"✗ {len(failed)} run(s) failed conformance: {names}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Mem0 REST API 负载测试（回放 JSONL 请求轨迹）
+
+读取 /memories、/search、/profile 等调用组成的 JSONL 轨迹，按两种模式回放到 server/main.py：
+1. open-loop   - 按目标 RPS（--rps）或轨迹原始时间戳（--speed 倍速）定时发出请求，不等待响应；
+                 延迟从计划发送时刻算起，避免 coordinated omission
+2. closed-loop - N 个虚拟用户（--users）各自串行发送，可配置思考时间（--think-time）
+两种模式都保持同一 user_id 的请求顺序（前一个请求完成后才发送下一个）。
+
+输出每个路由的 p50/p95/p99 延迟、错误率，以及按时间窗口统计的吞吐（--interval 秒）。
+
+轨迹格式（每行一个 JSON 对象，ts 为相对秒数，可省略）：
+    {"ts": 0.12, "method": "POST", "path": "/memories", "body": {"messages": [...], "user_id": "u1"}}
+    {"ts": 0.30, "method": "GET", "path": "/profile", "params": {"user_id": "u1"}}
+
+使用方法：
+1. 以离线 provider 启动服务（无需 LLM / embedding API，向量存储在进程内）：
+   cd server && PROVIDER_MODE=mock VECTOR_STORE_PROVIDER=sqlite VECTOR_STORE_PATH=/tmp/mem0_vs \\
+       HISTORY_DB_PATH=/tmp/mem0_history.db uvicorn main:app --port 18088 --workers 1
+   （PROVIDER_MODE=replay 时回放 REPLAY_CASSETTE_DIR 下录制的真实响应）
+2. 生成或准备轨迹：
+   python performance_monitoring/load_test.py --synthesize 2000 --trace /tmp/trace.jsonl
+3. 回放：
+   python performance_monitoring/load_test.py --trace /tmp/trace.jsonl --mode open --rps 50 --output /tmp/load.json
+   python performance_monitoring/load_test.py --trace /tmp/trace.jsonl --mode closed --users 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+# 添加项目路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+MESSAGES = [
+    "I really like sushi. I live in Hangzhou.",
+    "My hobby is running. I work as an engineer.",
+    "I moved to Shenzhen last year and I usually eat hotpot on weekends.",
+    "My daughter is learning piano. She is seven years old.",
+    "I am allergic to peanuts. I prefer tea over coffee.",
+]
+QUERIES = ["what food does the user like", "where does the user live", "what are the user's hobbies", "family"]
+
+
+def route_of(request: dict) -> str:
+    return f"{request.get('method', 'GET').upper()} {ID_SEGMENT.sub('/{id}', request['path'])}"
+
+
+def user_of(request: dict) -> str:
+    body = request.get("body") or {}
+    params = request.get("params") or {}
+    return body.get("user_id") or params.get("user_id") or body.get("agent_id") or body.get("run_id") or "-"
+
+
+def load_trace(path: str, limit: int = None) -> list:
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                requests.append(json.loads(line))
+                if limit and len(requests) >= limit:
+                    break
+    return requests
+
+
+def synthesize_trace(count: int, users: int, mix: dict, rps: float, seed: int) -> list:
+    """Random trace with the given route mix; timestamps follow a Poisson process at rps"""
+    rng = random.Random(seed)
+    routes, weights = zip(*mix.items())
+    trace, ts = [], 0.0
+    for _ in range(count):
+        ts += rng.expovariate(rps)
+        user_id = f"load_user_{rng.randrange(users)}"
+        route = rng.choices(routes, weights)[0]
+        messages = [{"role": "user", "content": rng.choice(MESSAGES)}]
+        if route == "memories":
+            request = {"method": "POST", "path": "/memories", "body": {"messages": messages, "user_id": user_id}}
+        elif route == "search":
+            request = {"method": "POST", "path": "/search", "body": {"query": rng.choice(QUERIES), "user_id": user_id}}
+        elif route == "get_all":
+            request = {"method": "GET", "path": "/memories", "params": {"user_id": user_id}}
+        elif route == "profile":
+            request = {"method": "POST", "path": "/profile", "body": {"messages": messages, "user_id": user_id}}
+        elif route == "get_profile":
+            request = {"method": "GET", "path": "/profile", "params": {"user_id": user_id}}
+        else:
+            raise ValueError(f"Unknown route in mix: {route}")
+        trace.append({"ts": round(ts, 4), **request})
+    return trace
+
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for item in value.split(","):
+        name, weight = item.split("=", 1)
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def percentiles(latencies_ms: list) -> dict:
+    if not latencies_ms:
+        return {}
+    values = sorted(latencies_ms)
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(round(q * (len(values) - 1))))], 2)
+
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": round(values[-1], 2)}
+
+
+class Recorder:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.start = None
+        self.samples = []  # (route, finished_at, latency_ms, service_ms, ok, status)
+
+    def record(self, route, scheduled, sent, finished, ok, status):
+        self.samples.append(
+            (route, finished - self.start, (finished - scheduled) * 1000, (finished - sent) * 1000, ok, status)
+        )
+
+    def summary(self) -> dict:
+        by_route = defaultdict(list)
+        for sample in self.samples:
+            by_route[sample[0]].append(sample)
+        elapsed = max((sample[1] for sample in self.samples), default=0.0)
+
+        routes = {}
+        for route, samples in sorted(by_route.items()):
+            errors = [s for s in samples if not s[4]]
+            statuses = defaultdict(int)
+            for s in samples:
+                statuses[str(s[5])] += 1
+            routes[route] = {
+                "requests": len(samples),
+                "error_rate": round(len(errors) / len(samples), 4),
+                "statuses": dict(statuses),
+                "latency": percentiles([s[2] for s in samples]),
+                "service_time": percentiles([s[3] for s in samples]),
+            }
+
+        timeline = defaultdict(lambda: {"completed": 0, "errors": 0})
+        for sample in self.samples:
+            bucket = int(sample[1] // self.interval)
+            timeline[bucket]["completed"] += 1
+            timeline[bucket]["errors"] += 0 if sample[4] else 1
+        return {
+            "requests": len(self.samples),
+            "errors": sum(1 for s in self.samples if not s[4]),
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_rps": round(len(self.samples) / elapsed, 2) if elapsed else None,
+            "latency": percentiles([s[2] for s in self.samples]),
+            "routes": routes,
+            "timeline": [
+                {
+                    "t": round(bucket * self.interval, 3),
+                    "rps": round(timeline[bucket]["completed"] / self.interval, 2),
+                    "errors": timeline[bucket]["errors"],
+                }
+                for bucket in sorted(timeline)
+            ],
+        }
+
+
+async def send(client: httpx.AsyncClient, request: dict, scheduled: float, recorder: Recorder):
+    sent = time.perf_counter()
+    try:
+        response = await client.request(
+            request.get("method", "GET").upper(),
+            request["path"],
+            params=request.get("params"),
+            json=request.get("body"),
+        )
+        ok, status = response.status_code < 400, response.status_code
+    except httpx.HTTPError as e:
+        ok, status = False, type(e).__name__
+    recorder.record(route_of(request), scheduled, sent, time.perf_counter(), ok, status)
+
+
+async def run_open_loop(client, trace, args, recorder):
+    """Dispatch on schedule; a user's request waits for that user's previous one, counted from its scheduled time"""
+    if args.rps:
+        offsets = [i / args.rps for i in range(len(trace))]
+    else:
+        first = trace[0].get("ts", 0.0)
+        offsets = [(request.get("ts", first) - first) / args.speed for request in trace]
+
+    locks = defaultdict(asyncio.Lock)
+
+    async def dispatch(request, scheduled):
+        async with locks[user_of(request)]:
+            await send(client, request, scheduled, recorder)
+
+    tasks = []
+    for request, offset in zip(trace, offsets):
+        scheduled = recorder.start + offset
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if args.duration and time.perf_counter() - recorder.start > args.duration:
+            break
+        tasks.append(asyncio.create_task(dispatch(request, scheduled)))
+    await asyncio.gather(*tasks)
+
+
+async def run_closed_loop(client, trace, args, recorder):
+    """N virtual users; every user_id is pinned to one virtual user so its requests stay in order"""
+    queues = defaultdict(list)
+    pinned = {}
+    for request in trace:
+        user = user_of(request)
+        if user not in pinned:
+            pinned[user] = len(pinned) % args.users
+        queues[pinned[user]].append(request)
+
+    async def virtual_user(requests):
+        for request in requests:
+            if args.duration and time.perf_counter() - recorder.start > args.duration:
+                return
+            await send(client, request, time.perf_counter(), recorder)
+            if args.think_time:
+                await asyncio.sleep(args.think_time)
+
+    await asyncio.gather(*(virtual_user(queues[i]) for i in range(args.users)))
+
+
+async def run(trace, args) -> dict:
+    recorder = Recorder(args.interval)
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        recorder.start = time.perf_counter()
+        if args.mode == "open":
+            await run_open_loop(client, trace, args, recorder)
+        else:
+            await run_closed_loop(client, trace, args, recorder)
+    return recorder.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a JSONL request trace against the Mem0 REST API")
+    parser.add_argument("--trace", required=True, help="JSONL trace to replay (or to write with --synthesize)")
+    parser.add_argument("--base-url", default="http://localhost:18088")
+    parser.add_argument("--mode", choices=["open", "closed"], default="open")
+    parser.add_argument("--rps", type=float, help="Open loop: fixed request rate instead of trace timestamps")
+    parser.add_argument("--speed", type=float, default=1.0, help="Open loop: trace timestamp speed-up factor")
+    parser.add_argument("--users", type=int, default=8, help="Closed loop: virtual users")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Closed loop: seconds between requests")
+    parser.add_argument("--duration", type=float, help="Stop dispatching after this many seconds")
+    parser.add_argument("--limit", type=int, help="Replay only the first N requests of the trace")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-connections", type=int, default=256)
+    parser.add_argument("--interval", type=float, default=1.0, help="Throughput timeline bucket in seconds")
+    parser.add_argument("--synthesize", type=int, help="Write a synthetic trace with this many requests and exit")
+    parser.add_argument("--synth-users", type=int, default=50)
+    parser.add_argument("--synth-rps", type=float, default=20.0)
+    parser.add_argument("--mix", default="memories=0.3,search=0.5,get_all=0.1,get_profile=0.1")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        trace = synthesize_trace(args.synthesize, args.synth_users, parse_mix(args.mix), args.synth_rps, args.seed)
+        with open(args.trace, "w", encoding="utf-8") as f:
+            for request in trace:
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+        print(f"轨迹已保存到: {args.trace} ({len(trace)} requests)")
+        return
+
+    trace = load_trace(args.trace, args.limit)
+    pacing = f"{args.rps} rps" if args.rps else f"trace timing x{args.speed}"
+    print(
+        f"=== load test: {len(trace)} requests, {args.mode} loop "
+        f"({pacing if args.mode == 'open' else f'{args.users} users'}) -> {args.base_url} ==="
+    )
+    result = asyncio.run(run(trace, args))
+
+    print(
+        f"  total {result['requests']} requests  {result['errors']} errors  {result['elapsed_seconds']}s  "
+        f"{result['throughput_rps']} rps  p50 {result['latency'].get('p50_ms')}ms  p99 {result['latency'].get('p99_ms')}ms"
+    )
+    for route, stats in result["routes"].items():
+        print(
+            f"  {route:<24} {stats['requests']:>6} req  err {stats['error_rate']:.2%}  "
+            f"p50 {stats['latency'].get('p50_ms')}ms  p95 {stats['latency'].get('p95_ms')}ms  "
+            f"p99 {stats['latency'].get('p99_ms')}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"trace": args.trace, "mode": args.mode, "base_url": args.base_url, "results": result}, f, indent=2
+            )
+        print(f"结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -231,5 +231,7 @@ step_start = perf_logger.start_timer()
 step_duration = perf_logger.end_timer(step_start)
 perf_logger.log_step("step_name", step_duration, {"context": "info"})
 
-性能日志将保存在 /tmp/mem0_performance.log 文件中，格式为JSON，方便后续分析。
+每个步骤的耗时始终写入内存中的指标注册表（服务端通过 /metrics 暴露）。
+逐条事件日志默认关闭，设置 MEM0_PERF_LOG_SAMPLE_RATE（0-1）按比例采样后写入 /tmp/mem0_performance.log，
+格式为JSON，方便后续分析；错误事件不受采样影响，始终写入该文件。
 """
\ No newline at end of file
@@ -1,45 +1,425 @@
+import atexit
+import bisect
+import contextvars
+import itertools
 import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
+import random
+import re
+import threading
 import time
+import uuid
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _geometric_bounds(low: float, high: float, growth: float) -> list:
+    return [low * growth ** i for i in range(int(math.log(high / low) / math.log(growth)) + 2)]
+
+
+class Histogram:
+    """
+    固定桶的延迟直方图（毫秒）
+
+    桶边界按几何级数增长（默认每档 ×1.1，相对误差 ≤10%），覆盖 1µs 到 10 分钟，
+    分位数由桶计数估算，记录一次只需一次二分查找和几次加法。
+    """
+
+    GROWTH = 1.1
+    MIN_MS = 0.001
+    MAX_MS = 600000.0
+    BOUNDS = _geometric_bounds(MIN_MS, MAX_MS, GROWTH)
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float):
+        self.counts[bisect.bisect_left(self.BOUNDS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "Histogram"):
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """估算分位数：返回目标样本所在桶的上界（截断到观测到的最大值）"""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                upper = self.BOUNDS[i] if i < len(self.BOUNDS) else self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p90_ms": round(self.percentile(0.90), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+        }
+
+
+class _Stripe:
+    __slots__ = ("lock", "histograms", "counters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms: Dict[Tuple, Histogram] = {}
+        self.counters: Dict[Tuple, float] = {}
+
+
+class MetricsRegistry:
+    """
+    进程内指标注册表：按 (名称, 标签) 聚合的直方图和计数器
+
+    每个线程首次写入时按顺序分到一个条带（stripe），每个条带一把锁，线程之间几乎不会竞争；
+    导出时合并所有条带。标签应为低基数（如 provider、status），不要放 user_id。
+    """
+
+    def __init__(self, stripes: int = 16):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        # 不用 threading.get_ident() 取模：glibc 下它是对齐的 pthread 地址，低位全为 0
+        self._thread_slot = threading.local()
+        self._next_slot = itertools.count()
+        self._gauge_lock = threading.Lock()
+        self._gauges: Dict[Tuple, float] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple]]] = []
+
+    def _stripe(self) -> _Stripe:
+        try:
+            return self._thread_slot.stripe
+        except AttributeError:
+            stripe = self._thread_slot.stripe = self._stripes[next(self._next_slot) % len(self._stripes)]
+            return stripe
+
+    @staticmethod
+    def _key(name: str, labels: Optional[Dict[str, Any]]) -> Tuple:
+        return (name, tuple(sorted(labels.items()))) if labels else (name, ())
+
+    def observe(self, name: str, value_ms: float, labels: Optional[Dict[str, Any]] = None):
+        """记录一次耗时（毫秒）"""
+        key = self._key(name, labels)
+        stripe = self._stripe()
+        with stripe.lock:
+            histogram = stripe.histograms.get(key)
+            if histogram is None:
+                histogram = stripe.histograms[key] = Histogram()
+            histogram.record(value_ms)
+
+    def inc(self, name: str, amount: float = 1, labels: Optional[Dict[str, Any]] = None):
+        """计数器累加"""
+        key = self._key(name, labels)
+        stripe = self._stripe()
+        with stripe.lock:
+            stripe.counters[key] = stripe.counters.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        """设置瞬时值（如连接池占用）"""
+        with self._gauge_lock:
+            self._gauges[self._key(name, labels)] = value
+
+    def add_gauge(self, name: str, amount: float, labels: Optional[Dict[str, Any]] = None):
+        """瞬时值增减（如进行中的请求数）"""
+        key = self._key(name, labels)
+        with self._gauge_lock:
+            self._gauges[key] = self._gauges.get(key, 0) + amount
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple]]):
+        """
+        注册导出时才调用的采集函数
+
+        collector() 产出 (kind, name, labels, value)，kind 为 "gauge" 或 "counter"，
+        用于连接池、缓存命中率这类由组件自己维护的状态，避免在热路径上重复写入。
+        """
+        self._collectors.append(collector)
+
+    def gauges(self) -> Dict[Tuple, float]:
+        """当前所有瞬时值（含采集函数产出的 gauge）"""
+        with self._gauge_lock:
+            gauges = dict(self._gauges)
+        gauges.update(self._collected("gauge"))
+        return gauges
+
+    def _collected(self, kind: str) -> Dict[Tuple, float]:
+        values: Dict[Tuple, float] = {}
+        for collector in list(self._collectors):
+            try:
+                for item_kind, name, labels, value in collector():
+                    if item_kind == kind and value is not None:
+                        values[self._key(name, labels)] = value
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Metrics collector {collector!r} failed: {e}")
+        return values
+
+    def collect(self) -> Tuple[Dict[Tuple, Histogram], Dict[Tuple, float]]:
+        """合并所有条带，返回 (直方图, 计数器)，键为 (名称, 标签元组)"""
+        histograms: Dict[Tuple, Histogram] = {}
+        counters: Dict[Tuple, float] = {}
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key, histogram in stripe.histograms.items():
+                    merged = histograms.get(key)
+                    if merged is None:
+                        merged = histograms[key] = Histogram()
+                    merged.merge(histogram)
+                for key, value in stripe.counters.items():
+                    counters[key] = counters.get(key, 0) + value
+        counters.update(self._collected("counter"))
+        return histograms, counters
+
+    def snapshot(self) -> Dict[str, Any]:
+        """导出为可 JSON 序列化的字典"""
+        histograms, counters = self.collect()
+        return {
+            "histograms": [
+                {"name": name, "labels": dict(labels), **histogram.summary()}
+                for (name, labels), histogram in sorted(histograms.items())
+            ],
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value} for (name, labels), value in sorted(counters.items())
+            ],
+            "gauges": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.gauges().items())
+            ],
+        }
+
+    def reset(self):
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.histograms.clear()
+                stripe.counters.clear()
+        with self._gauge_lock:
+            self._gauges.clear()
+
+
+# Prometheus 导出用的桶边界（毫秒），内部直方图更细，导出时按这些边界累计
+PROMETHEUS_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+_PROMETHEUS_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _prometheus_name(name: str) -> str:
+    return _PROMETHEUS_NAME.sub("_", name)
+
+
+def _prometheus_labels(labels: Iterable[Tuple[str, Any]]) -> str:
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{_prometheus_name(key)}="{value}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _prometheus_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(
+    registry: MetricsRegistry,
+    histogram_family: str = "mem0_stage_duration_seconds",
+    name_label: str = "stage",
+    prefix: str = "mem0",
+) -> str:
+    """
+    按 Prometheus 文本格式（0.0.4）导出注册表
+
+    所有直方图合并为一个 histogram 族，原指标名放在 name_label 标签里（如 stage="add.llm.extract_facts"），
+    单位换算为秒；计数器导出为 <prefix>_<name>_total，瞬时值导出为 <prefix>_<name>。
+    """
+    histograms, counters = registry.collect()
+    lines = []
+
+    if histograms:
+        lines.append(f"# HELP {histogram_family} Duration in seconds, by {name_label}.")
+        lines.append(f"# TYPE {histogram_family} histogram")
+        for (name, labels), histogram in sorted(histograms.items()):
+            base_labels = ((name_label, name),) + labels
+            # 内部桶 i 的上界是 BOUNDS[i]，累计到不超过导出桶上界的所有内部桶
+            cumulative, index = 0, 0
+            for bound in PROMETHEUS_BUCKETS_MS:
+                while index < len(Histogram.BOUNDS) and Histogram.BOUNDS[index] <= bound:
+                    cumulative += histogram.counts[index]
+                    index += 1
+                le = _prometheus_value(bound / 1000.0)
+                lines.append(f"{histogram_family}_bucket{_prometheus_labels(base_labels + (('le', le),))} {cumulative}")
+            lines.append(f"{histogram_family}_bucket{_prometheus_labels(base_labels + (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{histogram_family}_sum{_prometheus_labels(base_labels)} {histogram.total / 1000.0!r}")
+            lines.append(f"{histogram_family}_count{_prometheus_labels(base_labels)} {histogram.count}")
+
+    for kind, values in (("counter", counters), ("gauge", registry.gauges())):
+        families: Dict[str, List[str]] = {}
+        for (name, labels), value in sorted(values.items()):
+            metric = f"{prefix}_{_prometheus_name(name)}" + ("_total" if kind == "counter" else "")
+            families.setdefault(metric, []).append(f"{metric}{_prometheus_labels(labels)} {_prometheus_value(value)}")
+        for metric, samples in families.items():
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(samples)
+
+    return "\n".join(lines) + "\n"
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """入队时不做格式化，json.dumps 和时间戳转换都在后台线程完成"""
+
+    def prepare(self, record):
+        return record
+
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record):
+        data = record.msg if isinstance(record.msg, dict) else {"message": record.getMessage()}
+        data.setdefault("timestamp", datetime.fromtimestamp(record.created).isoformat())
+        return f"{self.formatTime(record)} - {json.dumps(data, ensure_ascii=False)}"
+
+
+# 全局指标注册表，所有 PerformanceLogger 实例共享
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """获取全局指标注册表"""
+    return _metrics_registry
+
+
+class Span:
+    """
+    一个计时区间：同一请求内的所有 span 共享 request_id，通过 parent_id 组成树
+
+    context 是可写的字典，在 with 块内补充的字段（如结果数）会随事件日志一起输出。
+    """
+
+    __slots__ = ("name", "request_id", "span_id", "parent_id", "context")
+
+    def __init__(self, name: str, request_id: str, span_id: Optional[str], parent_id: Optional[str],
+                 context: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.request_id = request_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.context = context if context is not None else {}
+
+
+# 当前 span 随 contextvars 传递：asyncio 任务和 asyncio.to_thread 自动继承，
+# 线程池需用 contextvars.copy_context().run 提交
+_current_span: contextvars.ContextVar = contextvars.ContextVar("mem0_current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def current_request_id() -> Optional[str]:
+    """当前上下文的请求 id（不在任何 span 内时为 None）"""
+    span = _current_span.get()
+    return span.request_id if span is not None else None
+
+
+@contextmanager
+def request_context(request_id: Optional[str] = None):
+    """
+    绑定请求 id，块内新开的 span 都归属这个请求（如服务端用 X-Request-ID）
+
+    本身不计时，只作为 span 树的根。
+    """
+    request_id = request_id or new_request_id()
+    token = _current_span.set(Span("request", request_id, None, None))
+    try:
+        yield request_id
+    finally:
+        _current_span.reset(token)
 
 
 class PerformanceLogger:
-    """性能监控日志记录器"""
+    """
+    性能监控日志记录器
+
+    每个步骤的耗时都写入内存中的 MetricsRegistry（始终开启，开销为微秒级）；
+    逐条事件日志是可选的：按 sample_rate 采样，并通过队列由后台线程写入文件。
+    错误事件不采样，始终写入文件（首次出错时才创建文件和后台线程）。
+    """
 
-    def __init__(self, log_file_path: Optional[str] = None):
+    def __init__(self, log_file_path: Optional[str] = None, sample_rate: Optional[float] = None):
         self.log_file_path = log_file_path or "/tmp/mem0_performance.log"
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("MEM0_PERF_LOG_SAMPLE_RATE", "0"))
+        self.sample_rate = sample_rate
+        self.metrics = _metrics_registry
+        self._listener = None
+        self._writer_lock = threading.Lock()
         self.setup_logger()
 
     def setup_logger(self):
-        """设置性能日志记录器"""
-        # 创建日志目录
-        os.makedirs(os.path.dirname(self.log_file_path), exist_ok=True)
-
+        """设置性能日志记录器（队列 + 后台写文件线程）"""
         # 创建专门的性能日志记录器
         self.logger = logging.getLogger("mem0_performance")
         self.logger.setLevel(logging.INFO)
+        # 防止日志传播到root logger
+        self.logger.propagate = False
+
+        # 不记录逐条事件时推迟到第一次写错误事件再创建文件和后台线程
+        if self.sample_rate > 0:
+            self._ensure_writer()
+
+    def _ensure_writer(self):
+        """创建日志文件 handler 和后台写文件线程（幂等）"""
+        if self.logger.handlers:
+            return
+        with self._writer_lock:
+            # 避免重复添加handler
+            if self.logger.handlers:
+                return
+            # 创建日志目录
+            os.makedirs(os.path.dirname(self.log_file_path), exist_ok=True)
 
-        # 避免重复添加handler
-        if not self.logger.handlers:
-            # 文件handler
             file_handler = logging.FileHandler(self.log_file_path, encoding='utf-8')
             file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(_JsonFormatter())
 
-            # 格式化器
-            formatter = logging.Formatter('%(asctime)s - %(message)s')
-            file_handler.setFormatter(formatter)
-
-            self.logger.addHandler(file_handler)
+            log_queue = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(log_queue, file_handler)
+            self._listener.start()
+            self.logger.addHandler(_DeferredQueueHandler(log_queue))
+            atexit.register(self.close)
 
-            # 防止日志传播到root logger
-            self.logger.propagate = False
+    def _should_log(self) -> bool:
+        return self.sample_rate >= 1 or (self.sample_rate > 0 and random.random() < self.sample_rate)
 
     @contextmanager
-    def time_step(self, step_name: str, context: Dict[str, Any] = None):
+    def time_step(self, step_name: str, context: Dict[str, Any] = None, labels: Dict[str, Any] = None):
         """计时上下文管理器"""
         start_time = time.perf_counter()
         step_context = context or {}
@@ -47,55 +427,95 @@ class PerformanceLogger:
         try:
             yield step_context
         finally:
-            end_time = time.perf_counter()
-            duration = (end_time - start_time) * 1000  # 转换为毫秒
+            duration = (time.perf_counter() - start_time) * 1000  # 转换为毫秒
+            self.log_step(step_name, duration, step_context, labels)
 
-            log_data = {
-                "step": step_name,
-                "duration_ms": round(duration, 3),
-                "timestamp": datetime.now().isoformat(),
-                **step_context
-            }
+    @contextmanager
+    def span(self, name: str, context: Dict[str, Any] = None, labels: Dict[str, Any] = None):
+        """
+        嵌套计时区间：耗时按 name 写入直方图，事件日志附带 request_id / span_id / parent_id
 
-            self.logger.info(json.dumps(log_data, ensure_ascii=False))
+        不在任何 span 内时开启新请求（生成新的 request_id）；with 块内可向返回的字典补充字段。
+        异常会计入 errors 计数并原样抛出。
+        """
+        parent = _current_span.get()
+        current = Span(
+            name,
+            parent.request_id if parent is not None else new_request_id(),
+            format(next(_span_ids), "x"),
+            parent.span_id if parent is not None else None,
+            context,
+        )
+        token = _current_span.set(current)
+        start_time = time.perf_counter()
+        try:
+            yield current.context
+        except Exception as e:
+            current.context["error"] = type(e).__name__
+            self.log_error(name, e, {"request_id": current.request_id, "span_id": current.span_id})
+            raise
+        finally:
+            duration = (time.perf_counter() - start_time) * 1000
+            _current_span.reset(token)
+            self.metrics.observe(name, duration, labels)
+            if self._should_log():
+                self.logger.info({
+                    "step": name,
+                    "duration_ms": round(duration, 3),
+                    "request_id": current.request_id,
+                    "span_id": current.span_id,
+                    "parent_id": current.parent_id,
+                    **current.context
+                })
 
     def log_search_summary(self, total_duration_ms: float, query: str,
                           user_id: str, result_count: int, filters: Dict[str, Any] = None):
         """记录搜索总结信息"""
-        summary_data = {
-            "event": "search_summary",
-            "total_duration_ms": round(total_duration_ms, 3),
-            "query_length": len(query),
-            "user_id": user_id,
-            "result_count": result_count,
-            "filters": filters or {},
-            "timestamp": datetime.now().isoformat()
-        }
+        self.metrics.observe("search.total", total_duration_ms)
+        self.metrics.inc("search.results", result_count)
 
-        self.logger.info(json.dumps(summary_data, ensure_ascii=False))
+        if self._should_log():
+            self.logger.info({
+                "event": "search_summary",
+                "total_duration_ms": round(total_duration_ms, 3),
+                "query_length": len(query),
+                "user_id": user_id,
+                "result_count": result_count,
+                "filters": filters or {},
+            })
 
     def log_error(self, step_name: str, error: Exception, context: Dict[str, Any] = None):
-        """记录错误信息"""
-        error_data = {
+        """记录错误信息（错误不采样，始终写日志）"""
+        self.metrics.inc("errors", labels={"step": step_name, "error_type": type(error).__name__})
+
+        self._ensure_writer()
+        self.logger.info({
             "event": "error",
             "step": step_name,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "timestamp": datetime.now().isoformat(),
             **(context or {})
-        }
+        })
 
-        self.logger.info(json.dumps(error_data, ensure_ascii=False))
+    def log_step(self, step_name: str, duration_ms: float, context: Dict[str, Any] = None,
+                 labels: Dict[str, Any] = None):
+        """记录步骤耗时：写入直方图，按采样率写事件日志"""
+        self.metrics.observe(step_name, duration_ms, labels)
 
-    def log_step(self, step_name: str, duration_ms: float, context: Dict[str, Any] = None):
-        """简单的步骤日志记录方法"""
-        log_data = {
-            "step": step_name,
-            "duration_ms": round(duration_ms, 3),
-            "timestamp": datetime.now().isoformat(),
-            **(context or {})
-        }
-        self.logger.info(json.dumps(log_data, ensure_ascii=False))
+        if self._should_log():
+            self.logger.info({
+                "step": step_name,
+                "duration_ms": round(duration_ms, 3),
+                **(context or {})
+            })
+
+    def export_metrics(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """导出当前指标快照，指定 path 时同时写入 JSON 文件"""
+        snapshot = self.metrics.snapshot()
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        return snapshot
 
     def start_timer(self) -> float:
         """开始计时，返回开始时间"""
@@ -105,30 +525,40 @@ class PerformanceLogger:
         """结束计时，返回耗时（毫秒）"""
         return (time.perf_counter() - start_time) * 1000
 
+    def close(self):
+        """停止后台写日志线程并刷新剩余事件"""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
 
 # 全局性能日志记录器实例
 _global_perf_logger = None
 
 def get_performance_logger(log_file_path: Optional[str] = None) -> PerformanceLogger:
-    """获取全局性能日志记录器实例"""
+    """获取全局性能日志记录器实例（默认只记录指标，事件日志采样率读取 MEM0_PERF_LOG_SAMPLE_RATE）"""
     global _global_perf_logger
     if _global_perf_logger is None:
         _global_perf_logger = PerformanceLogger(log_file_path)
     return _global_perf_logger
 
 
-def enable_performance_logging(log_file_path: Optional[str] = None):
-    """启用性能日志记录"""
+def enable_performance_logging(log_file_path: Optional[str] = None, sample_rate: float = 1.0):
+    """启用性能日志记录（默认记录全部事件）"""
     global _global_perf_logger
-    _global_perf_logger = PerformanceLogger(log_file_path)
+    disable_performance_logging()
+    _global_perf_logger = PerformanceLogger(log_file_path, sample_rate=sample_rate)
     return _global_perf_logger
 
 
 def disable_performance_logging():
-    """禁用性能日志记录"""
+    """禁用性能日志记录（指标注册表保留）"""
     global _global_perf_logger
     if _global_perf_logger:
+        _global_perf_logger.close()
         for handler in _global_perf_logger.logger.handlers:
             handler.close()
         _global_perf_logger.logger.handlers.clear()
-        _global_perf_logger = None
\ No newline at end of file
+        _global_perf_logger = None
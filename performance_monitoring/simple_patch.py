@@ -160,8 +160,9 @@ except ImportError:
 
 总共只需要添加约25-30行代码，不会影响原有逻辑，性能开销极小。
 
-性能日志将输出到：/tmp/mem0_performance.log
-日志格式为JSON，包含每个步骤的耗时和上下文信息。
+每个步骤的耗时始终写入内存中的指标注册表（服务端通过 /metrics 暴露）。
+逐条事件日志默认关闭，设置 MEM0_PERF_LOG_SAMPLE_RATE（0-1）按比例采样后输出到：/tmp/mem0_performance.log
+日志格式为JSON，包含每个步骤的耗时和上下文信息；错误事件不受采样影响，始终写入该文件。
 """
 
 print(MODIFICATION_GUIDE)
\ No newline at end of file
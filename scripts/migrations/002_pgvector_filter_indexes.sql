@@ -0,0 +1,42 @@
+-- Migration: Index scoping filters on the pgvector memories table
+-- Date: 2026-10-19
+-- Description: Per-user search/list filter on payload->>'user_id' (and agent_id/run_id). Without an
+--              index these queries scan the table or post-filter the HNSW index. This migration builds
+--              btree expression indexes on the scoping keys plus a GIN index for other payload filters.
+--              All indexes are built CONCURRENTLY, so the table stays writable during the migration.
+-- Usage: psql -U your_user -d your_database -f scripts/migrations/002_pgvector_filter_indexes.sql
+-- Note: Replace `memories` with your POSTGRES_COLLECTION if it differs. CONCURRENTLY cannot run inside
+--       a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--       PGVector filters scoping keys as payload->>'key' whenever the generated column is missing, so these
+--       indexes are used in either filter_index_mode. New collections created with the default
+--       filter_index_mode='generated' get stored generated columns instead; to switch an existing
+--       table to generated columns call PGVector.migrate_filter_indexes() during a maintenance window
+--       (ADD COLUMN ... STORED rewrites the table under an exclusive lock).
+--       The GIN index only serves other payload keys when payload_containment_filters=True. Containment is
+--       type-sensitive (5 does not match '5'), so the default keeps payload->>'key' = 'value' text equality.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_user_id_expr_idx ON memories ((payload->>'user_id'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_agent_id_expr_idx ON memories ((payload->>'agent_id'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_run_id_expr_idx ON memories ((payload->>'run_id'));
+CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_payload_gin_idx ON memories USING gin (payload jsonb_path_ops);
+
+ANALYZE memories;
+
+-- Verify indexes were created
+DO $$
+DECLARE
+    idx_count INTEGER;
+BEGIN
+    SELECT COUNT(*)
+    INTO idx_count
+    FROM pg_indexes
+    WHERE tablename = 'memories'
+      AND indexname IN ('memories_user_id_expr_idx', 'memories_agent_id_expr_idx',
+                        'memories_run_id_expr_idx', 'memories_payload_gin_idx');
+
+    IF idx_count = 4 THEN
+        RAISE NOTICE 'Migration 002 completed successfully! Created 4 filter indexes.';
+    ELSE
+        RAISE WARNING 'Migration 002 may have issues. Expected 4 indexes, found %', idx_count;
+    END IF;
+END $$;
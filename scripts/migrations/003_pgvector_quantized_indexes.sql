@@ -0,0 +1,42 @@
+-- Migration: Quantized HNSW indexes for the pgvector memories table
+-- Date: 2026-10-19
+-- Description: The float32 HNSW index over 1536-dim vectors dominates Postgres RAM. This migration
+--              builds a smaller index next to the existing one; pick ONE of the options below to match
+--              the index_quantization setting of PGVectorConfig, then drop the old index.
+--                - halfvec: float16 index, about 2x smaller, recall almost unchanged
+--                - binary:  bit index, about 32x smaller, candidates re-ranked by full-precision distance
+-- Usage: psql -U your_user -d your_database -f scripts/migrations/003_pgvector_quantized_indexes.sql
+-- Note: Replace `memories` with your POSTGRES_COLLECTION and 1536 with EMBEDDING_MODEL_DIMS if they differ.
+--       Requires pgvector >= 0.7. CONCURRENTLY cannot run inside a transaction block.
+--       Converting the column itself to halfvec (vector_type='halfvec') rewrites the table; use
+--       PGVector.migrate_vector_storage() during a maintenance window for that.
+
+-- Option 1: halfvec index (index_quantization='halfvec')
+CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_hnsw_halfvec_idx
+ON memories USING hnsw ((vector::halfvec(1536)) halfvec_cosine_ops);
+
+-- Option 2: binary quantized index (index_quantization='binary')
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS memories_hnsw_bit_idx
+-- ON memories USING hnsw ((binary_quantize(vector)::bit(1536)) bit_hamming_ops);
+
+-- Once the new index is valid and the service runs with the matching config:
+-- DROP INDEX CONCURRENTLY IF EXISTS memories_hnsw_idx;
+
+-- Verify the new index is valid (an interrupted concurrent build leaves an invalid index behind)
+DO $$
+DECLARE
+    idx_valid BOOLEAN;
+BEGIN
+    SELECT i.indisvalid
+    INTO idx_valid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname IN ('memories_hnsw_halfvec_idx', 'memories_hnsw_bit_idx')
+    LIMIT 1;
+
+    IF idx_valid THEN
+        RAISE NOTICE 'Migration 003 completed successfully! Quantized HNSW index is valid.';
+    ELSE
+        RAISE WARNING 'Migration 003 may have issues. Quantized HNSW index is missing or invalid.';
+    END IF;
+END $$;
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+pgvector Partition Maintenance Script
+
+Inspect and rebalance a partitioned pgvector collection (see the `partitioning`
+option of PGVectorConfig).
+
+Usage:
+    python scripts/pgvector_partitions.py list
+    python scripts/pgvector_partitions.py split memories_p16_3
+    python scripts/pgvector_partitions.py promote <user_id>
+    python scripts/pgvector_partitions.py demote <user_id>
+
+Environment variables (same as server/main.py):
+    - POSTGRES_HOST / POSTGRES_PORT / POSTGRES_DB / POSTGRES_USER / POSTGRES_PASSWORD
+    - POSTGRES_COLLECTION: collection (table) name, default "memories"
+    - EMBEDDING_MODEL_DIMS: vector dimension, default 1536
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0.vector_stores.pgvector import PGVector
+
+
+def collection_exists(connection_string, collection_name):
+    """Check for the collection table with a plain connection (PGVector would create a missing one)"""
+    try:
+        import psycopg
+    except ImportError:
+        import psycopg2 as psycopg
+    conn = psycopg.connect(connection_string)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", (collection_name,))
+        return cur.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def get_store():
+    """Connect to the configured collection; exits if it doesn't exist instead of creating it"""
+    collection_name = os.getenv("POSTGRES_COLLECTION", "memories")
+    connection_string = (
+        f"postgresql://{os.getenv('POSTGRES_USER', 'postgres')}:{os.getenv('POSTGRES_PASSWORD', 'postgres')}"
+        f"@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}"
+        f"/{os.getenv('POSTGRES_DB', 'postgres')}"
+    )
+    if not collection_exists(connection_string, collection_name):
+        print(f"ERROR: collection '{collection_name}' does not exist")
+        sys.exit(1)
+    return PGVector(
+        dbname=None,
+        collection_name=collection_name,
+        embedding_model_dims=int(os.getenv("EMBEDDING_MODEL_DIMS", "1536")),
+        user=None,
+        password=None,
+        host=None,
+        port=None,
+        diskann=False,
+        hnsw=True,
+        connection_string=connection_string,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and rebalance pgvector partitions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List partitions with estimated row counts")
+    split_parser = subparsers.add_parser("split", help="Split a hash partition in two")
+    split_parser.add_argument("partition")
+    promote_parser = subparsers.add_parser("promote", help="Move a tenant from DEFAULT into its own list partition")
+    promote_parser.add_argument("user_id")
+    demote_parser = subparsers.add_parser("demote", help="Fold a tenant partition back into DEFAULT")
+    demote_parser.add_argument("user_id")
+    args = parser.parse_args()
+
+    store = get_store()
+    partitions = store.list_partitions()
+    if not partitions:
+        print(f"ERROR: collection '{store.collection_name}' is not partitioned")
+        sys.exit(1)
+
+    if args.command == "list":
+        for partition in partitions:
+            print(f"{partition['name']:<48} {partition['rows']:>12}  {partition['bound']}")
+        print(f"✓ {len(partitions)} partitions")
+    elif args.command == "split":
+        new_partitions = store.split_partition(args.partition)
+        print(f"✓ Split {args.partition} into {', '.join(new_partitions)}")
+    elif args.command == "promote":
+        partition = store.promote_tenant(args.user_id)
+        print(f"✓ Tenant '{args.user_id}' moved to {partition}")
+    elif args.command == "demote":
+        store.demote_tenant(args.user_id)
+        print(f"✓ Tenant '{args.user_id}' moved back to DEFAULT")
+
+
+if __name__ == "__main__":
+    main()
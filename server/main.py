@@ -1,18 +1,27 @@
 import logging
 import os
 import sys
+import functools
 import json
 from typing import Any, Dict, List, Optional
 from time import time
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from pydantic import BaseModel, Field
 
 from mem0 import Memory
 from mem0.user_profile import UserProfile
-from middleware import RequestLoggingMiddleware, log_request_body, log_response_data
+from mem0.utils.tracing import span
+from middleware import MetricsMiddleware, RequestLoggingMiddleware, log_request_body, log_response_data
+
+# performance_monitoring is put on sys.path by mem0.utils.tracing (and by PYTHONPATH in Docker)
+try:
+    from performance_logger import MetricsRegistry, get_metrics_registry, render_prometheus, request_context
+    METRICS_ENABLED = True
+except ImportError:
+    METRICS_ENABLED = False
 
 # Load environment variables first
 load_dotenv()
@@ -64,6 +73,19 @@ VOLCENGINE_DEEPSEEK_BASE_URL = os.environ.get(
 # PalServer configuration (for cold start)
 PALSERVER_BASE_URL = os.environ.get("PALSERVER_BASE_URL")
 
+# Offline / load-testing providers (see performance_monitoring/load_test.py)
+# PROVIDER_MODE: unset = real providers; "mock" = deterministic mock LLM + hash embedder;
+# "record" / "replay" / "auto" = wrap the real providers in replay cassettes under REPLAY_CASSETTE_DIR
+PROVIDER_MODE = os.environ.get("PROVIDER_MODE", "").lower()
+MOCK_LLM_LATENCY = float(os.environ.get("MOCK_LLM_LATENCY", "0"))
+REPLAY_CASSETTE_DIR = os.environ.get("REPLAY_CASSETTE_DIR", "/app/cassettes")
+REPLAY_LATENCY_SCALE = float(os.environ.get("REPLAY_LATENCY_SCALE", "1.0"))
+# VECTOR_STORE_PROVIDER: "pgvector" (default), or an in-process store ("faiss" / "sqlite") under VECTOR_STORE_PATH
+VECTOR_STORE_PROVIDER = os.environ.get("VECTOR_STORE_PROVIDER", "pgvector")
+VECTOR_STORE_PATH = os.environ.get("VECTOR_STORE_PATH", "/app/vector_store")
+# Seconds the UserProfile databases get to answer at startup in PROVIDER_MODE
+PROFILE_DB_TIMEOUT = float(os.environ.get("PROFILE_DB_TIMEOUT", "2"))
+
 # Neo4j configuration
 # NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://neo4j:7687")
 # NEO4J_USERNAME = os.environ.get("NEO4J_USERNAME", "neo4j")
@@ -117,19 +139,164 @@ DEFAULT_CONFIG = {
 }
 
 
+def apply_provider_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Swap in offline LLM/embedder/vector store providers according to PROVIDER_MODE and VECTOR_STORE_PROVIDER"""
+    if VECTOR_STORE_PROVIDER in ("faiss", "sqlite"):
+        config["vector_store"] = {
+            "provider": VECTOR_STORE_PROVIDER,
+            "config": {
+                "collection_name": POSTGRES_COLLECTION,
+                "path": VECTOR_STORE_PATH,
+                "embedding_model_dims": EMBEDDING_MODEL_DIMS,
+            },
+        }
+
+    if PROVIDER_MODE == "mock":
+        config["llm"] = {"provider": "mock", "config": {"latency": MOCK_LLM_LATENCY}}
+        config["embedder"] = {"provider": "mock", "config": {"embedding_dims": EMBEDDING_MODEL_DIMS}}
+    elif PROVIDER_MODE in ("record", "replay", "auto"):
+        llm, embedder = config["llm"], config["embedder"]
+        config["llm"] = {
+            "provider": "replay",
+            "config": {
+                "cassette_path": os.path.join(REPLAY_CASSETTE_DIR, "llm.jsonl.gz"),
+                "mode": PROVIDER_MODE,
+                "provider": llm["provider"],
+                "provider_config": llm["config"],
+                "latency_scale": REPLAY_LATENCY_SCALE,
+            },
+        }
+        config["embedder"] = {
+            "provider": "replay",
+            "config": {
+                "replay_cassette_path": os.path.join(REPLAY_CASSETTE_DIR, "embedder.jsonl.gz"),
+                "replay_mode": PROVIDER_MODE,
+                "replay_provider": embedder["provider"],
+                "replay_provider_config": embedder["config"],
+                "replay_latency_scale": REPLAY_LATENCY_SCALE,
+                "embedding_dims": embedder["config"].get("embedding_dims"),
+            },
+        }
+    elif PROVIDER_MODE:
+        raise ValueError(f"Invalid PROVIDER_MODE: {PROVIDER_MODE}. Must be one of mock, record, replay, auto")
+
+    if PROVIDER_MODE:
+        logger.info(
+            f"Provider overrides: mode={PROVIDER_MODE}, llm={config['llm']['provider']}, "
+            f"embedder={config['embedder']['provider']}, vector_store={config['vector_store']['provider']}"
+        )
+    return config
+
+
+DEFAULT_CONFIG = apply_provider_overrides(DEFAULT_CONFIG)
+
+
 MEMORY_INSTANCE = Memory.from_config(DEFAULT_CONFIG)
-USER_PROFILE_INSTANCE = UserProfile(
-    MEMORY_INSTANCE.config,
-    palserver_base_url=PALSERVER_BASE_URL
-)
+USER_PROFILE_CONFIG = MEMORY_INSTANCE.config
+if PROVIDER_MODE:
+    # Offline runs usually have no profile databases: give up in seconds instead of waiting out
+    # the 30s pool / server selection timeouts at startup
+    USER_PROFILE_CONFIG = USER_PROFILE_CONFIG.model_copy(deep=True)
+    USER_PROFILE_CONFIG.user_profile.postgres.update(
+        {"timeout": PROFILE_DB_TIMEOUT, "connect_timeout": max(1, int(PROFILE_DB_TIMEOUT))}
+    )
+    USER_PROFILE_CONFIG.user_profile.mongodb.update(
+        {
+            "server_selection_timeout_ms": int(PROFILE_DB_TIMEOUT * 1000),
+            "connect_timeout_ms": int(PROFILE_DB_TIMEOUT * 1000),
+        }
+    )
+try:
+    USER_PROFILE_INSTANCE = UserProfile(
+        USER_PROFILE_CONFIG,
+        palserver_base_url=PALSERVER_BASE_URL
+    )
+except Exception as e:
+    # Offline runs may have no PostgreSQL/MongoDB for profiles; /profile then answers 503
+    if not PROVIDER_MODE:
+        raise
+    logger.warning(f"UserProfile disabled in {PROVIDER_MODE} mode: {e}")
+    USER_PROFILE_INSTANCE = None
 
 # Initialize UserProfile databases (auto-create tables if not exist)
 try:
-    USER_PROFILE_INSTANCE.initialize_databases()
-    logger.info("UserProfile databases initialized (tables created if needed)")
+    if USER_PROFILE_INSTANCE is not None:
+        USER_PROFILE_INSTANCE.initialize_databases()
+        logger.info("UserProfile databases initialized (tables created if needed)")
 except Exception as e:
     logger.warning(f"Failed to initialize UserProfile databases: {e}")
-    logger.warning("UserProfile tables may need to be created manually")
+    if PROVIDER_MODE:
+        logger.warning(f"UserProfile disabled in {PROVIDER_MODE} mode")
+        USER_PROFILE_INSTANCE.close()
+        USER_PROFILE_INSTANCE = None
+    else:
+        logger.warning("UserProfile tables may need to be created manually")
+
+
+
+def instrument_methods(obj: Any, prefix: str, names: List[str]):
+    """Wrap the given methods of obj so every call is recorded as a span named <prefix>.<name>"""
+
+    def wrap(name, method):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            with span(f"{prefix}.{name}"):
+                return method(*args, **kwargs)
+
+        return timed
+
+    for name in names:
+        method = getattr(obj, name, None)
+        if callable(method):
+            setattr(obj, name, wrap(name, method))
+
+
+def collect_component_metrics():
+    """Yield pool utilization, cache and LLM token usage of the live instances at scrape time"""
+    components = [("memory", MEMORY_INSTANCE)]
+    if USER_PROFILE_INSTANCE is not None:
+        components.append(("profile", USER_PROFILE_INSTANCE))
+
+    pools = [(MEMORY_INSTANCE.config.vector_store.provider, getattr(MEMORY_INSTANCE, "vector_store", None))]
+    if USER_PROFILE_INSTANCE is not None:
+        pools += [("postgres", USER_PROFILE_INSTANCE.postgres), ("mongodb", USER_PROFILE_INSTANCE.mongodb)]
+    for client, component in pools:
+        pool_stats = getattr(component, "pool_stats", None)
+        if pool_stats is None:
+            continue
+        for field, value in pool_stats().items():
+            yield "gauge", f"pool_connections_{field}", {"client": client}, value
+
+    cache_stats = getattr(getattr(MEMORY_INSTANCE, "vector_store", None), "cache_stats", None)
+    if cache_stats is not None:
+        for cache, stats in cache_stats().items():
+            yield "counter", "cache_hits", {"cache": cache}, stats["hits"]
+            yield "counter", "cache_misses", {"cache": cache}, stats["misses"]
+            yield "gauge", "cache_entries", {"cache": cache}, stats["size"]
+
+    for component, instance in components:
+        llm = getattr(instance, "llm", None)
+        usage = getattr(llm, "usage", None)
+        if not usage:
+            continue
+        labels = {"component": component, "model": getattr(llm.config, "model", None) or "unknown"}
+        yield "counter", "llm_requests", labels, usage["requests"]
+        yield "counter", "llm_prompt_tokens", labels, usage["prompt_tokens"]
+        yield "counter", "llm_completion_tokens", labels, usage["completion_tokens"]
+
+
+if METRICS_ENABLED:
+    HTTP_METRICS = MetricsRegistry()
+    get_metrics_registry().register_collector(collect_component_metrics)
+    if USER_PROFILE_INSTANCE is not None:
+        instrument_methods(
+            USER_PROFILE_INSTANCE.postgres, "profile.postgres", ["upsert", "get", "delete", "get_missing_fields"]
+        )
+        instrument_methods(
+            USER_PROFILE_INSTANCE.mongodb,
+            "profile.mongodb",
+            ["upsert", "get", "update_field", "add_item", "update_item", "delete_item", "delete", "get_missing_fields"],
+        )
 
 logger.info("Mem0 Memory and UserProfile instances initialized successfully")
 logger.info(f"Logging level set to: {LOG_LEVEL}")
@@ -143,6 +310,10 @@ app = FastAPI(
 # Add request logging middleware
 app.add_middleware(RequestLoggingMiddleware, log_level=LOG_LEVEL)
 
+# Add request metrics middleware (outermost, so it also times request logging)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, registry=HTTP_METRICS, request_context=request_context)
+
 
 class Message(BaseModel):
     role: str = Field(..., description="Role of the message (user or assistant).")
@@ -313,6 +484,17 @@ def reset_memory():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+def metrics():
+    """Expose request, pipeline stage, pool, cache and LLM usage metrics in Prometheus text format."""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=503, detail="Metrics are not available: performance_monitoring is not installed.")
+    body = render_prometheus(
+        HTTP_METRICS, histogram_family="mem0_http_request_duration_seconds", name_label="route", prefix="mem0_http"
+    ) + render_prometheus(get_metrics_registry())
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
 @app.get("/", summary="Redirect to the OpenAPI documentation", include_in_schema=False)
 def home():
     """Redirect to the OpenAPI documentation."""
@@ -323,6 +505,13 @@ def home():
 # UserProfile Routes
 # ============================================
 
+def require_user_profile() -> UserProfile:
+    """Return the UserProfile instance, or 503 when it was disabled at startup"""
+    if USER_PROFILE_INSTANCE is None:
+        raise HTTPException(status_code=503, detail="User profile storage is not available in this deployment.")
+    return USER_PROFILE_INSTANCE
+
+
 @app.post("/profile", summary="Create or update user profile")
 def set_profile(profile_create: ProfileCreate):
     """
@@ -340,13 +529,14 @@ def set_profile(profile_create: ProfileCreate):
     # TODO: Add authentication/authorization
     # Verify user has permission to update this profile
     # Consider implementing JWT token validation or API key check
+    user_profile = require_user_profile()
 
     try:
         # Log request details in DEBUG mode
         request_data = profile_create.model_dump()
         log_request_body(request_data, "set_profile")
 
-        response = USER_PROFILE_INSTANCE.set_profile(
+        response = user_profile.set_profile(
             user_id=profile_create.user_id,
             messages=[m.model_dump() for m in profile_create.messages]
         )
@@ -386,13 +576,14 @@ def get_profile(
     # TODO: Add authentication/authorization
     # Verify user has permission to access this profile
     # Consider implementing JWT token validation or API key check
+    user_profile = require_user_profile()
 
     try:
         options = {"evidence_limit": evidence_limit}
         if fields:
             options["fields"] = [f.strip() for f in fields.split(",")]
 
-        response = USER_PROFILE_INSTANCE.get_profile(
+        response = user_profile.get_profile(
             user_id=user_id,
             options=options
         )
@@ -429,9 +620,10 @@ def get_missing_fields(
     # TODO: Add authentication/authorization
     # Verify user has permission to access this profile
     # Consider implementing JWT token validation or API key check
+    user_profile = require_user_profile()
 
     try:
-        response = USER_PROFILE_INSTANCE.get_missing_fields(
+        response = user_profile.get_missing_fields(
             user_id=user_id,
             source=source
         )
@@ -457,9 +649,10 @@ def delete_profile(user_id: str):
     # TODO: Add authentication/authorization
     # Verify user has permission to delete this profile
     # Consider implementing JWT token validation or API key check
+    user_profile = require_user_profile()
 
     try:
-        response = USER_PROFILE_INSTANCE.delete_profile(user_id=user_id)
+        response = user_profile.delete_profile(user_id=user_id)
         return JSONResponse(content=response)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
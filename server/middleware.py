@@ -7,7 +7,7 @@ Log level controlled by LOG_LEVEL environment variable.
 
 import json
 import logging
-from time import time
+from time import perf_counter, time
 from typing import Callable
 
 from fastapi import Request, Response
@@ -67,6 +67,50 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         )
 
 
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to record request latency and in-flight requests into a metrics registry.
+
+    Latency is observed per route template (e.g. /memories/{memory_id}), method and status, so
+    path parameters never turn into label values. Requests that match no route share one label.
+
+    When request_context is given, each request runs inside request_context(request_id) with the
+    id taken from the X-Request-ID header (or generated), and the id is echoed in the response.
+    """
+
+    def __init__(self, app: ASGIApp, registry, request_context: Callable = None, skip_paths: tuple = ("/metrics",)):
+        super().__init__(app)
+        self.registry = registry
+        self.request_context = request_context
+        self.skip_paths = skip_paths
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Process request and record its duration"""
+        if request.url.path in self.skip_paths:
+            return await call_next(request)
+
+        start_time = perf_counter()
+        self.registry.add_gauge("requests_in_flight", 1)
+        status = 500
+        try:
+            if self.request_context is None:
+                response = await call_next(request)
+            else:
+                with self.request_context(request.headers.get("x-request-id")) as request_id:
+                    response = await call_next(request)
+                response.headers["X-Request-ID"] = request_id
+            status = response.status_code
+            return response
+        finally:
+            self.registry.add_gauge("requests_in_flight", -1)
+            route = request.scope.get("route")
+            self.registry.observe(
+                getattr(route, "path", "unmatched"),
+                (perf_counter() - start_time) * 1000,
+                {"method": request.method, "status": status},
+            )
+
+
 def log_request_body(body_data: dict, endpoint_name: str):
     """
     Helper function to log request body in endpoints.
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Cassette Tests
+
+Offline tests for mem0/utils/cassette.py with cassette files in a temporary directory.
+No LLM or embedding provider required.
+
+Test coverage:
+1. A recorded cassette replays the same responses, plain and gzip-compressed
+2. Dates and whitespace are normalized out of the key
+3. Repeated recordings of one request are replayed round-robin
+4. Replay mode raises CassetteMiss for unrecorded requests and for a missing file
+5. Auto mode replays hits and records misses
+6. Embeddings are stored as base64 float32 and decoded back to lists of floats
+"""
+
+import base64
+import gzip
+import json
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from mem0.utils.cassette import Cassette, CassetteMiss
+
+MESSAGES = [{"role": "user", "content": "Today is 2025-09-21. I like tea."}]
+
+
+def unexpected_call():
+    raise AssertionError("the real call should not run during replay")
+
+
+def test_record_then_replay():
+    """Responses recorded in one session replay in the next, for plain and .gz cassettes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("calls.jsonl", "calls.jsonl.gz"):
+            path = os.path.join(tmp, "nested", name)
+            recorder = Cassette(path, mode="record")
+            reply = recorder.call("llm", {"messages": MESSAGES}, lambda: {"content": "likes tea"})
+            assert reply == {"content": "likes tea"}
+            recorder.call("llm", {"messages": []}, lambda: "empty")
+            assert len(recorder) == 2
+
+            if name.endswith(".gz"):
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    lines = f.read().splitlines()
+            else:
+                with open(path, encoding="utf-8") as f:
+                    lines = f.read().splitlines()
+            assert [json.loads(line)["kind"] for line in lines] == ["llm", "llm"]
+
+            player = Cassette(path, mode="replay", latency_scale=0)
+            assert len(player) == 2
+            assert player.call("llm", {"messages": MESSAGES}, unexpected_call) == {"content": "likes tea"}
+            assert player.call("llm", {"messages": []}, None) == "empty"
+
+
+def test_normalization():
+    """Requests differing only in dates, timestamps or whitespace share a key"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cassette = Cassette(os.path.join(tmp, "calls.jsonl"), mode="auto")
+        key = cassette.key("llm", {"prompt": "Today is 2025-09-21.\n  Extract   facts"})
+        assert cassette.key("llm", {"prompt": "Today is 2026-01-02. Extract facts"}) == key
+        timestamp_key = cassette.key("llm", ["Seen 2025-09-21T08:30:00.123Z"])
+        assert cassette.key("llm", ["Seen 2024-01-01 00:00:00"]) == timestamp_key
+        assert cassette.key("embed", {"prompt": "Today is 2025-09-21. Extract facts"}) != key
+        assert cassette.key("llm", {"prompt": "Today is 2025-09-21. Extract other facts"}) != key
+
+        # Custom patterns replace the default date mask
+        raw = Cassette(os.path.join(tmp, "raw.jsonl"), mode="auto", normalize_patterns=[r"req-\d+"])
+        assert raw.key("llm", "id req-1 on 2025-09-21") == raw.key("llm", "id  req-2 on 2025-09-21")
+        assert raw.key("llm", "on 2025-09-21") != raw.key("llm", "on 2025-09-22")
+
+
+def test_round_robin_replay():
+    """Each recording of a repeated request is replayed in turn, then the cycle restarts"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calls.jsonl")
+        recorder = Cassette(path, mode="record")
+        for answer in ("first", "second", "third"):
+            recorder.call("llm", {"messages": MESSAGES}, lambda answer=answer: answer)
+
+        player = Cassette(path, mode="replay", latency_scale=0)
+        replies = [player.call("llm", {"messages": MESSAGES}, None) for _ in range(4)]
+        assert replies == ["first", "second", "third", "first"]
+
+
+def test_replay_miss():
+    """Replay mode never calls through: unknown requests and missing files are errors"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calls.jsonl")
+        Cassette(path, mode="record").call("llm", {"messages": MESSAGES}, lambda: "recorded")
+
+        player = Cassette(path, mode="replay", latency_scale=0)
+        try:
+            player.call("llm", {"messages": []}, unexpected_call)
+        except CassetteMiss as e:
+            assert "llm" in str(e)
+        else:
+            raise AssertionError("expected CassetteMiss")
+
+        try:
+            Cassette(os.path.join(tmp, "missing.jsonl"), mode="replay")
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError("expected FileNotFoundError")
+
+
+def test_auto_mode_records_misses():
+    """Auto mode serves recorded requests and records the rest, which later sessions replay"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calls.jsonl")
+        Cassette(path, mode="record").call("llm", {"messages": MESSAGES}, lambda: "recorded")
+
+        calls = []
+        cassette = Cassette(path, mode="auto", latency_scale=0)
+        assert cassette.call("llm", {"messages": MESSAGES}, unexpected_call) == "recorded"
+        assert cassette.call("llm", {"messages": []}, lambda: calls.append(1) or "fresh") == "fresh"
+        assert cassette.call("llm", {"messages": []}, unexpected_call) == "fresh"
+        assert calls == [1]
+
+        # Without a callable an auto-mode miss can't be filled
+        try:
+            cassette.call("llm", {"messages": ["other"]}, None)
+        except CassetteMiss:
+            pass
+        else:
+            raise AssertionError("expected CassetteMiss")
+
+        assert Cassette(path, mode="replay", latency_scale=0).call("llm", {"messages": []}, None) == "fresh"
+
+
+def test_embedding_encoding():
+    """Embeddings are written as base64 float32 and replayed as lists of floats"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calls.jsonl")
+        embedding = [0.25, -1.5, 3.0]
+        Cassette(path, mode="record").call("embed", {"text": "I like tea"}, lambda: embedding)
+
+        with open(path, encoding="utf-8") as f:
+            record = json.loads(f.readline())
+        assert record["response"] == {"b64": base64.b64encode(np.array(embedding, dtype=np.float32).tobytes()).decode()}
+
+        replayed = Cassette(path, mode="replay", latency_scale=0).call("embed", {"text": "I like tea"}, None)
+        assert isinstance(replayed, list) and replayed == embedding
+
+
+if __name__ == "__main__":
+    tests = [
+        test_record_then_replay,
+        test_normalization,
+        test_round_robin_replay,
+        test_replay_miss,
+        test_auto_mode_records_misses,
+        test_embedding_encoding,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
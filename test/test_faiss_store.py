@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+FAISS Vector Store Tests
+
+Offline tests for mem0/vector_stores/faiss.py with the collection stored in a temporary directory.
+No external services required.
+
+Test coverage:
+1. 'log' persistence: mutations that were never compacted are replayed after a restart
+2. 'snapshot' persistence: a reopened store matches the one that was written
+3. Deleted vectors are not returned by search, before and after their tombstones are purged
+4. Filtered search on indexed and unindexed payload keys
+5. list() with filters reads the payload index instead of scanning the docstore
+"""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0.vector_stores.faiss import FAISS
+
+VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.7, 0.7, 0.0]]
+PAYLOADS = [
+    {"user_id": "alice", "data": "a1", "category": "work"},
+    {"user_id": "alice", "data": "a2", "category": "home"},
+    {"user_id": "bob", "agent_id": "helper", "data": "b1", "category": "work"},
+    {"user_id": "bob", "data": "b2", "category": "home"},
+]
+IDS = ["a1", "a2", "b1", "b2"]
+
+
+def make_store(path, **kwargs):
+    return FAISS(collection_name="memories", path=path, embedding_model_dims=3, **kwargs)
+
+
+def ids_of(results):
+    return [result.id for result in results]
+
+
+def test_log_replay_after_restart():
+    """Records only in the mutation log are applied when the collection is loaded again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp, persistence="log", compaction_interval=3600)
+        store.insert(VECTORS, PAYLOADS, IDS)
+        store.delete("a2")
+        store.update("b1", vector=[0.0, 0.1, 1.0], payload={"user_id": "bob", "data": "b1 updated"})
+        # No close(): the process "crashes" before the compactor writes a snapshot
+        assert os.path.getsize(os.path.join(tmp, "memories.log")) > 0
+        del store
+
+        reopened = make_store(tmp, persistence="log", compaction_interval=3600)
+        assert reopened.col_info()["count"] == 3
+        assert reopened.get("a2") is None
+        assert reopened.get("b1").payload == {"user_id": "bob", "data": "b1 updated"}
+        assert ids_of(reopened.search("", [0.0, 0.1, 1.0], limit=1)) == ["b1"]
+        assert ids_of(reopened.list(filters={"user_id": "alice"})[0]) == ["a1"]
+
+        # Mutations after the replay are logged on top of it
+        reopened.insert([[0.0, 1.0, 0.0]], [{"user_id": "alice", "data": "a3"}], ["a3"])
+        reopened.close()
+
+        final = make_store(tmp, persistence="log", compaction_interval=3600)
+        assert ids_of(final.list(filters={"user_id": "alice"})[0]) == ["a1", "a3"]
+        final.close()
+
+
+def test_snapshot_reopen():
+    """The default snapshot persistence restores vectors, payloads and the payload index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp)
+        store.insert(VECTORS, PAYLOADS, IDS)
+        store.delete("b2")
+
+        reopened = make_store(tmp)
+        assert reopened.col_info()["count"] == 3
+        assert ids_of(reopened.search("", [0.7, 0.7, 0.0], limit=4, filters={"user_id": "bob"})) == ["b1"]
+        assert reopened.get("a1").payload == PAYLOADS[0]
+
+
+def test_delete_then_search():
+    """A deleted vector never comes back from search, whether it is tombstoned or already removed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # A high tombstone ratio keeps deleted vectors in the index until flush()
+        store = make_store(tmp, tombstone_ratio=1.0)
+        store.insert(VECTORS, PAYLOADS, IDS)
+
+        store.delete("a1")
+        assert store._tombstones and store.index.ntotal == 4
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4)) == ["b2", "a2", "b1"]
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=1, filters={"user_id": "alice"})) == ["a2"]
+
+        store.flush()
+        assert not store._tombstones and store.index.ntotal == 3
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4)) == ["b2", "a2", "b1"]
+
+        # Re-inserting a deleted id makes it searchable again
+        store.insert([[1.0, 0.0, 0.0]], [PAYLOADS[0]], ["a1"])
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=1)) == ["a1"]
+
+
+def test_filtered_search():
+    """Indexed keys restrict the candidates; unindexed keys are checked on the hits"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp)
+        store.insert(VECTORS, PAYLOADS, IDS)
+
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": "bob"})) == ["b2", "b1"]
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4, filters={"agent_id": "helper"})) == ["b1"]
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4, filters={"category": "home"})) == ["b2", "a2"]
+        assert ids_of(
+            store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": ["alice", "bob"], "category": "work"})
+        ) == ["a1", "b1"]
+        assert store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": "carol"}) == []
+
+        # Only the candidates from the payload index are handed to FAISS
+        with mock.patch.object(store.index, "search", wraps=store.index.search) as search:
+            store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": "alice"})
+        params = search.call_args.kwargs["params"]
+        assert [params.sel.is_member(idx) for idx in range(4)] == [True, True, False, False]
+
+
+def test_list_uses_payload_index():
+    """list() with an indexed filter only reads the matching payloads, in insertion order"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp, indexed_payload_keys=["category"])
+        store.insert(VECTORS, PAYLOADS, IDS)
+
+        store.docstore = mock.MagicMock(wraps=store.docstore)
+        assert ids_of(store.list(filters={"category": "home"})[0]) == ["a2", "b2"]
+        assert [call.args[0] for call in store.docstore.get.call_args_list] == ["a2", "b2"]
+        store.docstore.items.assert_not_called()
+
+        assert ids_of(store.list(filters={"user_id": "bob", "category": "work"})[0]) == ["b1"]
+        assert ids_of(store.list(filters={"user_id": "alice"}, limit=1)[0]) == ["a1"]
+        assert store.list(filters={"user_id": "carol"}) == [[]]
+
+        # Without filters every payload is listed
+        assert ids_of(store.list()[0]) == IDS
+
+
+if __name__ == "__main__":
+    tests = [
+        test_log_replay_after_restart,
+        test_snapshot_reopen,
+        test_delete_then_search,
+        test_filtered_search,
+        test_list_uses_payload_index,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
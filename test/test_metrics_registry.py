@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+MetricsRegistry Tests
+
+Offline tests for the in-process metrics registry in performance_monitoring/performance_logger.py.
+No server or database required.
+
+Test coverage:
+1. Writer threads are spread over several stripes (not all on one lock)
+2. Observations from many threads are merged without loss
+3. Error events are written even when event sampling is off
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add performance_monitoring directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "performance_monitoring"))
+
+from performance_logger import MetricsRegistry, PerformanceLogger
+
+
+def test_threads_use_multiple_stripes():
+    """Plain threads and pool workers must not all map to the same stripe"""
+    registry = MetricsRegistry(stripes=16)
+    used = set()
+    lock = threading.Lock()
+
+    def record():
+        stripe = registry._stripe()
+        with lock:
+            used.add(id(stripe))
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(used) > 1, f"8 threads landed on {len(used)} stripe(s)"
+
+    used.clear()
+    barrier = threading.Barrier(8)
+
+    def record_in_pool():
+        # Hold all workers alive together so the pool really uses 8 distinct threads
+        barrier.wait()
+        record()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(record_in_pool) for _ in range(8)]:
+            future.result()
+    assert len(used) > 1, f"8 pool workers landed on {len(used)} stripe(s)"
+
+
+def test_stripe_is_stable_per_thread():
+    """A thread keeps writing to the same stripe"""
+    registry = MetricsRegistry(stripes=16)
+    assert registry._stripe() is registry._stripe()
+
+
+def test_concurrent_observations_are_merged():
+    """Counts from all threads add up after collect()"""
+    registry = MetricsRegistry(stripes=4)
+
+    def work():
+        for _ in range(1000):
+            registry.observe("stage", 1.0, {"provider": "test"})
+            registry.inc("calls")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(work) for _ in range(8)]:
+            future.result()
+
+    histograms, counters = registry.collect()
+    assert histograms[("stage", (("provider", "test"),))].count == 8000
+    assert counters[("calls", ())] == 8000
+
+
+def test_errors_logged_without_sampling():
+    """log_error writes to the log file even with sample_rate=0"""
+    logger = logging.getLogger("mem0_performance")
+    saved_handlers = logger.handlers[:]
+    logger.handlers.clear()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, "perf.log")
+        perf_logger = PerformanceLogger(log_file_path=log_path, sample_rate=0)
+        try:
+            assert not os.path.exists(log_path), "no log file should be created before the first error"
+            perf_logger.log_step("quiet.step", 1.0)
+            perf_logger.log_error("failing.step", ValueError("boom"))
+        finally:
+            perf_logger.close()
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers[:] = saved_handlers
+
+        with open(log_path, encoding="utf-8") as f:
+            events = [json.loads(line.split(" - ", 1)[1]) for line in f]
+    assert [event["event"] for event in events] == ["error"]
+    assert events[0]["step"] == "failing.step"
+    assert events[0]["error_type"] == "ValueError"
+
+
+if __name__ == "__main__":
+    tests = [
+        test_threads_use_multiple_stripes,
+        test_stripe_is_stable_per_thread,
+        test_concurrent_observations_are_merged,
+        test_errors_logged_without_sampling,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+OpenSearch Refresh Policy Tests
+
+Offline tests for mem0/vector_stores/opensearch.py. A real OpenSearch client is used with its transport
+mocked, so the requests are checked after opensearch-py has encoded the query parameters.
+No OpenSearch server required.
+
+Test coverage:
+1. delete sends the configured refresh policy as refresh=true / refresh=wait_for
+2. update sends the configured refresh policy
+3. Without a configured refresh policy no refresh parameter is sent
+"""
+
+import os
+import sys
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0.vector_stores.opensearch import OpenSearchDB
+
+SEARCH_HIT = {"hits": {"hits": [{"_id": "doc-1", "_source": {"id": "mem-1", "payload": {}}}]}}
+
+
+def fake_perform_request(method, url, params=None, headers=None, body=None, **kwargs):
+    if method == "HEAD":
+        return True  # index exists
+    if url.endswith("/_search"):
+        return SEARCH_HIT
+    return {"result": "ok"}
+
+
+def make_store(**kwargs):
+    return OpenSearchDB(
+        host="localhost", port=9200, collection_name="memories", embedding_model_dims=3, **kwargs
+    )
+
+
+def write_calls(perform, method):
+    return [call for call in perform.call_args_list if call.args[0] == method and "/_search" not in call.args[1]]
+
+
+def test_delete_sends_refresh():
+    """delete passes refresh through the client's parameter encoding"""
+    for refresh, expected in ((True, b"true"), (False, b"false"), ("wait_for", b"wait_for")):
+        with mock.patch("opensearchpy.transport.Transport.perform_request", side_effect=fake_perform_request) as perform:
+            make_store(refresh=refresh).delete("mem-1")
+        (call,) = write_calls(perform, "DELETE")
+        assert call.args[1] == "/memories/_doc/doc-1"
+        assert call.kwargs["params"] == {"refresh": expected}
+
+
+def test_update_sends_refresh():
+    """update passes refresh through the client's parameter encoding"""
+    with mock.patch("opensearchpy.transport.Transport.perform_request", side_effect=fake_perform_request) as perform:
+        make_store(refresh=True).update("mem-1", payload={"data": "new"})
+    (call,) = write_calls(perform, "POST")
+    assert call.args[1] == "/memories/_update/doc-1"
+    assert call.kwargs["params"] == {"refresh": b"true"}
+    assert call.kwargs["body"] == {"doc": {"payload": {"data": "new"}}}
+
+
+def test_no_refresh_by_default():
+    """Without a configured refresh policy the index refresh_interval applies"""
+    with mock.patch("opensearchpy.transport.Transport.perform_request", side_effect=fake_perform_request) as perform:
+        store = make_store()
+        store.delete("mem-1")
+        store.update("mem-1", payload={"data": "new"})
+    for call in write_calls(perform, "DELETE") + write_calls(perform, "POST"):
+        assert "refresh" not in call.kwargs["params"]
+
+
+if __name__ == "__main__":
+    tests = [test_delete_sends_refresh, test_update_sends_refresh, test_no_refresh_by_default]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
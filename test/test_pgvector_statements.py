@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+PGVector Statement Builder Tests
+
+Offline tests for the SQL builders in mem0/vector_stores/pgvector.py. The builders don't touch the
+database, so the store is created without running __init__ and configured by hand.
+No PostgreSQL server required.
+
+Test coverage:
+1. Search statement per index layout: SQL shape, parameter order and hnsw.* settings
+2. The binary-quantized first pass raises hnsw.ef_search to cover the re-rank pool
+3. Filter clauses: filter columns, payload->> comparisons and the opt-in JSONB containment path
+4. List and delete statements, including deletes routed to a tenant partition
+5. Binary COPY encoding of vectors, payloads and rows, and the framing of the COPY stream
+"""
+
+import io
+import json
+import os
+import re
+import struct
+import sys
+import uuid
+from contextlib import contextmanager
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0.vector_stores.pgvector import (
+    _COPY_HEADER,
+    _COPY_TRAILER,
+    PGVector,
+    _encode_copy_row,
+    _encode_jsonb,
+    _encode_vector,
+)
+
+QUERY = [0.1, 0.2, 0.3]
+
+
+def make_store(**overrides):
+    store = PGVector.__new__(PGVector)
+    settings = {
+        "collection_name": "memories",
+        "embedding_model_dims": 3,
+        "use_hnsw": True,
+        "use_diskann": False,
+        "vector_type": "vector",
+        "index_quantization": None,
+        "rerank_factor": 10,
+        "filter_columns": ["user_id", "agent_id", "run_id"],
+        "payload_containment_filters": False,
+        "_partition_strategy": None,
+        "_column_keys": set(),
+        "search_params": {"ef_search": None, "iterative_scan": None, "max_scan_tuples": None},
+        # No pools: __del__ only closes what exists
+        "connection_pool": None,
+        "replica_pools": [],
+    }
+    settings.update(overrides)
+    for name, value in settings.items():
+        setattr(store, name, value)
+    return store
+
+
+def squash(sql):
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+def json_value(param):
+    # psycopg 3 keeps the wrapped value in .obj, psycopg2 in .adapted
+    return getattr(param, "obj", getattr(param, "adapted", None))
+
+
+def decode_copy_row(data):
+    """Split one binary COPY tuple into its field values (None for NULL) and return the unread rest."""
+    (count,) = struct.unpack_from(">h", data)
+    offset, fields = 2, []
+    for _ in range(count):
+        (length,) = struct.unpack_from(">i", data, offset)
+        offset += 4
+        if length == -1:
+            fields.append(None)
+        else:
+            fields.append(data[offset:offset + length])
+            offset += length
+    return fields, data[offset:]
+
+
+def test_plain_search_statement():
+    """Plain HNSW search: one vector placeholder, filters, then limit"""
+    store = make_store(_column_keys={"user_id"})
+    sql, params, settings = store._search_statement(
+        QUERY, 5, {"user_id": "alice"}, {"ef_search": 80, "iterative_scan": None}, exact=False
+    )
+    assert squash(sql) == (
+        "SELECT id, vector <=> %s::vector(3) AS distance, payload FROM memories "
+        "WHERE user_id = %s ORDER BY distance LIMIT %s"
+    )
+    assert params == (QUERY, "alice", 5)
+    assert settings == [("hnsw.ef_search", "80")]
+
+
+def test_exact_search_statement():
+    """Exact search ranks a materialized candidate set; filters come before the vector"""
+    store = make_store(_column_keys={"user_id"})
+    sql, params, settings = store._search_statement(QUERY, 5, {"user_id": "alice"}, {}, exact=True)
+    assert "AS MATERIALIZED" in sql
+    assert params == ("alice", QUERY, 5)
+    assert settings == []
+
+
+def test_binary_search_statement_raises_ef_search():
+    """The binary first pass asks for limit * rerank_factor rows and sets ef_search to match"""
+    store = make_store(index_quantization="binary", _column_keys={"user_id"})
+    sql, params, settings = store._search_statement(QUERY, 5, {"user_id": "alice"}, {}, exact=False)
+    flat = squash(sql)
+    assert "ORDER BY binary_quantize(vector)::bit(3) <~> binary_quantize(%s::vector(3))" in flat
+    # Outer distance vector, filter, first-pass vector, candidate count, final limit
+    assert flat.index("vector <=> %s") < flat.index("user_id = %s") < flat.index("binary_quantize(%s")
+    assert params == (QUERY, "alice", QUERY, 50, 5)
+    assert settings == [("hnsw.ef_search", "50")]
+
+    # A larger configured ef_search is kept
+    _, _, settings = store._search_statement(QUERY, 5, None, {"ef_search": 200}, exact=False)
+    assert settings == [("hnsw.ef_search", "200")]
+
+    # ... a smaller one is replaced, and the value stays within pgvector's limit of 1000
+    _, params, settings = store._search_statement(QUERY, 200, None, {"ef_search": 64}, exact=False)
+    assert params == (QUERY, QUERY, 2000, 200)
+    assert settings == [("hnsw.ef_search", "1000")]
+
+
+def test_halfvec_search_statement():
+    """The halfvec first pass re-ranks exactly limit candidates"""
+    store = make_store(index_quantization="halfvec")
+    sql, params, settings = store._search_statement(QUERY, 5, None, {"iterative_scan": "relaxed_order"}, exact=False)
+    assert "ORDER BY vector::halfvec(3) <=> %s::halfvec(3)" in squash(sql)
+    assert params == (QUERY, QUERY, 5, 5)
+    assert settings == [("hnsw.iterative_scan", "relaxed_order")]
+
+
+def test_filter_clause_columns_and_payload():
+    """Filter columns compare the column or an inlined payload->>'key'; other keys bind the key"""
+    # user_id has a generated column, agent_id only an expression index
+    store = make_store(_column_keys={"user_id"})
+    clause, params = store._build_filter_clause({"user_id": "alice", "agent_id": "helper", "category": 7})
+    assert clause == "WHERE user_id = %s AND payload->>'agent_id' = %s AND payload->>%s = %s"
+    assert params == ["alice", "helper", "category", "7"]
+
+    # Without generated columns every scoping key goes through the payload
+    store = make_store()
+    clause, params = store._build_filter_clause({"user_id": "alice"})
+    assert clause == "WHERE payload->>'user_id' = %s"
+    assert params == ["alice"]
+
+    assert store._build_filter_clause(None) == ("", [])
+    assert store._build_filter_clause({}) == ("", [])
+
+
+def test_filter_clause_containment():
+    """With payload_containment_filters other keys use JSONB containment and keep their JSON type"""
+    store = make_store(_column_keys={"user_id"}, payload_containment_filters=True)
+    clause, params = store._build_filter_clause({"user_id": "alice", "run_id": "r1", "category": 7})
+    assert clause == "WHERE user_id = %s AND payload->>'run_id' = %s AND payload @> %s::jsonb"
+    assert params[:2] == ["alice", "r1"]
+    assert json_value(params[2]) == {"category": 7}
+
+
+def test_list_statement():
+    """list binds the filter parameters followed by the limit"""
+    store = make_store(_column_keys={"user_id"})
+    sql, params = store._list_statement({"user_id": "alice", "category": "work"}, 100)
+    assert squash(sql) == (
+        "SELECT id, vector, payload FROM memories WHERE user_id = %s AND payload->>%s = %s LIMIT %s"
+    )
+    assert params == ("alice", "category", "work", 100)
+
+    sql, params = store._list_statement(None, None)
+    assert squash(sql) == "SELECT id, vector, payload FROM memories LIMIT %s"
+    assert params == (None,)
+
+
+def test_delete_statement():
+    """Deletes by id, by owner, or both; partitioned collections compare the partition column"""
+    store = make_store()
+    sql, params = store._delete_statement(vector_id="mem-1")
+    assert squash(sql) == "DELETE FROM memories WHERE id = %s RETURNING id, payload->>'user_id'"
+    assert params == ["mem-1"]
+
+    sql, params = store._delete_statement(vector_id="mem-1", user_id="alice")
+    assert squash(sql) == (
+        "DELETE FROM memories WHERE payload->>'user_id' = %s AND id = %s RETURNING id, payload->>'user_id'"
+    )
+    assert params == ["alice", "mem-1"]
+
+    # On a partitioned collection user_id is the partition key column, so Postgres prunes to one partition
+    store = make_store(_partition_strategy="list", _column_keys={"user_id"})
+    sql, params = store._delete_statement(vector_id="mem-1", user_id="alice")
+    assert squash(sql) == "DELETE FROM memories WHERE user_id = %s AND id = %s RETURNING id, payload->>'user_id'"
+    assert params == ["alice", "mem-1"]
+
+    sql, params = store._delete_statement(user_id="alice")
+    assert squash(sql) == "DELETE FROM memories WHERE user_id = %s RETURNING id, payload->>'user_id'"
+    assert params == ["alice"]
+
+
+def test_copy_value_encoding():
+    """Vectors, halfvecs and payloads use pgvector's and jsonb's binary input formats"""
+    assert _encode_vector([1.0, -2.5]) == struct.pack(">HH", 2, 0) + struct.pack(">2f", 1.0, -2.5)
+    assert _encode_vector([1.0, -2.5], "halfvec") == struct.pack(">HH", 2, 0) + struct.pack(">2e", 1.0, -2.5)
+
+    import numpy as np
+
+    array = np.array([1.0, -2.5], dtype=np.float32)
+    assert _encode_vector(array) == _encode_vector([1.0, -2.5])
+    assert _encode_vector(array, "halfvec") == _encode_vector([1.0, -2.5], "halfvec")
+
+    assert _encode_jsonb({"data": "café"}) == b"\x01" + json.dumps({"data": "café"}).encode("utf-8")
+    assert _encode_jsonb(None) is None
+
+    row = _encode_copy_row([b"abc", None, b""])
+    assert row == struct.pack(">h", 3) + struct.pack(">i", 3) + b"abc" + struct.pack(">i", -1) + struct.pack(">i", 0)
+
+
+def test_copy_insert_rows():
+    """Bulk insert rows carry the uuid bytes, vector, jsonb payload and, when partitioned, the partition key"""
+    store = make_store()
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    payloads = [{"user_id": "alice"}, None]
+    sql, rows = store._copy_insert_rows([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], payloads, ids, None)
+    assert sql == "COPY memories (id, vector, payload) FROM STDIN (FORMAT BINARY)"
+    rows = list(rows)
+    fields, rest = decode_copy_row(rows[0])
+    assert rest == b""
+    assert fields == [uuid.UUID(ids[0]).bytes, _encode_vector([1.0, 0.0, 0.0]), _encode_jsonb(payloads[0])]
+    fields, _ = decode_copy_row(rows[1])
+    assert fields[2] is None
+
+    store = make_store(_partition_strategy="hash")
+    sql, rows = store._copy_insert_rows([[1.0, 0.0, 0.0]], payloads[:1], ids[:1], ["alice"])
+    assert sql == "COPY memories (id, vector, payload, user_id) FROM STDIN (FORMAT BINARY)"
+    fields, _ = decode_copy_row(next(rows))
+    assert fields[3] == b"alice"
+
+
+class FakeCopyCursor:
+    """Collects the bytes written through either psycopg's COPY API."""
+
+    def __init__(self):
+        self.sql = None
+        self.data = b""
+
+    @contextmanager
+    def copy(self, sql):
+        self.sql = sql
+        buffer = io.BytesIO()
+        yield buffer
+        self.data = buffer.getvalue()
+
+    def copy_expert(self, sql, buffer):
+        self.sql = sql
+        self.data = buffer.read()
+
+
+def test_copy_binary_stream():
+    """The COPY stream is the header, the rows in order and the trailer"""
+    store = make_store()
+    rows = [_encode_copy_row([str(i).encode()]) for i in range(2500)]
+    cur = FakeCopyCursor()
+    store._copy_binary(cur, "COPY memories (id) FROM STDIN (FORMAT BINARY)", iter(rows))
+    assert cur.sql == "COPY memories (id) FROM STDIN (FORMAT BINARY)"
+    assert cur.data.startswith(_COPY_HEADER) and cur.data.endswith(_COPY_TRAILER)
+
+    data, decoded = cur.data[len(_COPY_HEADER):-len(_COPY_TRAILER)], []
+    while data:
+        fields, data = decode_copy_row(data)
+        decoded.append(fields[0])
+    assert decoded == [str(i).encode() for i in range(2500)]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_plain_search_statement,
+        test_exact_search_statement,
+        test_binary_search_statement_raises_ef_search,
+        test_halfvec_search_statement,
+        test_filter_clause_columns_and_payload,
+        test_filter_clause_containment,
+        test_list_statement,
+        test_delete_statement,
+        test_copy_value_encoding,
+        test_copy_insert_rows,
+        test_copy_binary_stream,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Qdrant Vector Store Tests
+
+Offline tests for mem0/vector_stores/qdrant.py against the in-memory client (QdrantClient(":memory:")).
+No Qdrant server required.
+
+Test coverage:
+1. search_batch answers several query vectors with one query_batch_points request
+2. Inserts are split into upsert_batch_size chunks
+3. The wait setting is passed to every write
+4. user_id gets a tenant keyword index, other scoping fields a plain keyword index
+"""
+
+import os
+import sys
+import warnings
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import KeywordIndexParams
+
+from mem0.vector_stores.qdrant import Qdrant
+
+VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.7, 0.7, 0.0]]
+PAYLOADS = [{"user_id": "alice"}, {"user_id": "alice"}, {"user_id": "bob"}, {"user_id": "bob"}]
+
+
+def make_store(client=None, **kwargs):
+    client = client or QdrantClient(":memory:")
+    with warnings.catch_warnings():
+        # The in-memory client warns that payload indexes have no effect locally
+        warnings.simplefilter("ignore", UserWarning)
+        return Qdrant(collection_name="test_memories", embedding_model_dims=3, client=client, **kwargs)
+
+
+def test_search_batch_single_request():
+    """search_batch returns one result list per query vector from a single query_batch_points call"""
+    store = make_store()
+    store.insert(VECTORS, PAYLOADS, ids=[1, 2, 3, 4])
+
+    with mock.patch.object(store.client, "query_batch_points", wraps=store.client.query_batch_points) as batch:
+        results = store.search_batch([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], limit=1)
+    assert batch.call_count == 1
+    assert [[point.id for point in points] for points in results] == [[1], [3]]
+
+    results = store.search_batch([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], limit=2, filters={"user_id": "bob"})
+    assert all(point.payload["user_id"] == "bob" for points in results for point in points)
+    assert [points[0].id for points in results] == [4, 3]
+
+    assert store.search_batch([], limit=1) == []
+
+
+def test_insert_is_chunked():
+    """Inserts go out in upsert_batch_size chunks and all points land"""
+    store = make_store(upsert_batch_size=3)
+    vectors = [[float(i), 1.0, 0.0] for i in range(10)]
+
+    with mock.patch.object(store.client, "upsert", wraps=store.client.upsert) as upsert:
+        store.insert(vectors, [{"user_id": "alice"}] * 10, ids=list(range(10)))
+    assert [len(call.kwargs["points"]) for call in upsert.call_args_list] == [3, 3, 3, 1]
+    assert store.client.count(collection_name="test_memories").count == 10
+
+
+def test_wait_is_passed_to_writes():
+    """The configured wait flag reaches upsert and delete"""
+    for wait in (True, False):
+        store = make_store(wait=wait)
+        with mock.patch.object(store.client, "upsert", wraps=store.client.upsert) as upsert, \
+                mock.patch.object(store.client, "delete", wraps=store.client.delete) as delete:
+            store.insert(VECTORS, PAYLOADS, ids=[1, 2, 3, 4])
+            store.update(1, vector=[0.5, 0.5, 0.0], payload={"user_id": "carol"})
+            store.delete(2)
+        assert [call.kwargs["wait"] for call in upsert.call_args_list] == [wait, wait]
+        assert delete.call_args.kwargs["wait"] is wait
+        assert store.client.count(collection_name="test_memories").count == 3
+
+
+def test_user_id_tenant_index():
+    """user_id is indexed with is_tenant=True, the other scoping fields as plain keywords"""
+    client = QdrantClient(":memory:")
+    with mock.patch.object(client, "create_payload_index", wraps=client.create_payload_index) as create_index:
+        make_store(client=client)
+    schemas = {call.kwargs["field_name"]: call.kwargs["field_schema"] for call in create_index.call_args_list}
+    assert set(schemas) == {"user_id", "agent_id", "run_id", "actor_id"}
+    assert isinstance(schemas["user_id"], KeywordIndexParams) and schemas["user_id"].is_tenant
+    assert all(schemas[field] == "keyword" for field in ("agent_id", "run_id", "actor_id"))
+
+
+if __name__ == "__main__":
+    tests = [
+        test_search_batch_single_request,
+        test_insert_is_chunked,
+        test_wait_is_passed_to_writes,
+        test_user_id_tenant_index,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
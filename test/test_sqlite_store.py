@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+SQLite Vector Store Tests
+
+Offline tests for mem0/vector_stores/sqlite.py against a database file in a temporary directory.
+No external services required.
+
+Test coverage:
+1. insert / search / list / delete with scope-column and payload filters
+2. The scope matrix cache is invalidated by update and delete, and only for the touched scopes
+3. Writes from another connection to the same file invalidate the cache
+4. Reopening the database keeps the rows; a mismatched configuration is rejected
+"""
+
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem0.vector_stores.sqlite import SQLiteVectorStore
+
+VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.7, 0.7, 0.0]]
+PAYLOADS = [
+    {"user_id": "alice", "data": "a1", "category": "work"},
+    {"user_id": "alice", "data": "a2", "category": "home"},
+    {"user_id": "bob", "agent_id": "helper", "data": "b1", "category": "work"},
+    {"user_id": "bob", "data": "b2", "category": "home"},
+]
+IDS = ["a1", "a2", "b1", "b2"]
+
+
+def make_store(path, **kwargs):
+    return SQLiteVectorStore(collection_name="memories", path=path, embedding_model_dims=3, **kwargs)
+
+
+def ids_of(results):
+    return [result.id for result in results]
+
+
+def test_insert_search_list_delete():
+    """Scope filters use the indexed columns, other keys the JSON payload; list and delete follow them"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp)
+        store.insert(VECTORS, PAYLOADS, IDS)
+
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4)) == ["a1", "b2", "a2", "b1"]
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=2, filters={"user_id": "bob"})) == ["b2", "b1"]
+        assert ids_of(store.search("", [0.0, 0.0, 1.0], limit=4, filters={"agent_id": "helper"})) == ["b1"]
+        assert ids_of(store.search("", [1.0, 0.0, 0.0], limit=4, filters={"category": "home"})) == ["b2", "a2"]
+        assert ids_of(
+            store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": ["alice", "bob"], "category": "work"})
+        ) == ["a1", "b1"]
+        assert store.search("", [1.0, 0.0, 0.0], limit=4, filters={"user_id": []}) == []
+
+        top = store.search("", [1.0, 0.0, 0.0], limit=1)[0]
+        assert top.payload == PAYLOADS[0]
+        assert abs(top.score - 1.0) < 1e-6
+
+        assert ids_of(store.list(filters={"user_id": "alice"})[0]) == ["a1", "a2"]
+        assert ids_of(store.list(filters={"category": "work"})[0]) == ["a1", "b1"]
+        assert ids_of(store.list(limit=3)[0]) == ["a1", "a2", "b1"]
+
+        store.delete("a1")
+        assert store.get("a1") is None
+        assert ids_of(store.list(filters={"user_id": "alice"})[0]) == ["a2"]
+        assert store.col_info()["count"] == 3
+        store.close()
+
+
+def test_cache_invalidated_by_update_and_delete():
+    """update and delete drop the cached matrices of the scopes they touch and leave the others"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = make_store(tmp)
+        store.insert(VECTORS, PAYLOADS, IDS)
+
+        store.search("", [1.0, 0.0, 0.0], filters={"user_id": "alice"})
+        store.search("", [1.0, 0.0, 0.0], filters={"user_id": "bob"})
+        store.search("", [1.0, 0.0, 0.0], filters={"user_id": "alice"})
+        assert store.cache_stats()["scope"] == {"hits": 1, "misses": 2, "size": 2}
+
+        # Moving a2 onto the query vector must change alice's ranking, not bob's cached matrix
+        store.update("a2", vector=[1.0, 0.1, 0.0])
+        assert store.cache_stats()["scope"]["size"] == 1
+        results = store.search("", [1.0, 0.1, 0.0], limit=1, filters={"user_id": "alice"})
+        assert ids_of(results) == ["a2"]
+
+        # A payload update moving a row to another user invalidates both scopes
+        store.search("", [1.0, 0.0, 0.0], filters={"user_id": "bob"})
+        store.update("a2", payload={"user_id": "bob", "data": "moved"})
+        assert store.cache_stats()["scope"]["size"] == 0
+        assert "a2" in ids_of(store.search("", [1.0, 0.1, 0.0], limit=4, filters={"user_id": "bob"}))
+        assert "a2" not in ids_of(store.search("", [1.0, 0.1, 0.0], limit=4, filters={"user_id": "alice"}))
+
+        store.delete("a2")
+        assert "a2" not in ids_of(store.search("", [1.0, 0.1, 0.0], limit=4, filters={"user_id": "bob"}))
+        store.close()
+
+
+def test_cache_invalidated_by_other_connection():
+    """A commit from another connection to the same file clears the cache before the next search"""
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = make_store(tmp)
+        writer = make_store(tmp)
+        writer.insert(VECTORS, PAYLOADS, IDS)
+
+        assert ids_of(reader.search("", [0.0, 0.0, 1.0], limit=1, filters={"user_id": "bob"})) == ["b1"]
+        writer.delete("b1")
+        assert ids_of(reader.search("", [0.0, 0.0, 1.0], limit=1, filters={"user_id": "bob"})) == ["b2"]
+        writer.close()
+        reader.close()
+
+
+def test_reopen_database():
+    """Rows survive closing and reopening the file; a different dimension for the collection is rejected"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mem.db")
+        store = make_store(path, vector_dtype="int8")
+        store.insert(VECTORS, PAYLOADS, IDS)
+        store.close()
+
+        store = make_store(path, vector_dtype="int8")
+        assert store.list_cols() == ["memories"]
+        assert store.col_info()["count"] == 4
+        assert store.get("b1").payload == PAYLOADS[2]
+        assert ids_of(store.search("", [0.0, 1.0, 0.0], limit=2)) == ["a2", "b2"]
+        store.close()
+
+        try:
+            SQLiteVectorStore(collection_name="memories", path=path, embedding_model_dims=4, vector_dtype="int8")
+        except ValueError as e:
+            assert "dims=3" in str(e)
+        else:
+            raise AssertionError("reopening with other dimensions should fail")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_insert_search_list_delete,
+        test_cache_invalidated_by_update_and_delete,
+        test_cache_invalidated_by_other_connection,
+        test_reopen_database,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ FAILED: {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)